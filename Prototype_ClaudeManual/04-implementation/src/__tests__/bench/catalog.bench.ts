@@ -0,0 +1,49 @@
+// @vitest-environment node
+import path from 'path'
+import { afterAll, bench, describe } from 'vitest'
+import { Catalog } from '@/lib/catalog'
+import { createClaudeFixture } from './fixtures'
+
+// Run with: npm run bench
+// Cold = fresh catalog (full scan + parse), snapshot = fresh catalog restored
+// from its on-disk snapshot (stat only), warm = shared catalog (stat only).
+
+const fixture = createClaudeFixture({
+  skills: 1000,
+  commands: 500,
+  agents: 500,
+  hooks: 200,
+  architectureDocs: 500,
+  workflows: 100,
+})
+
+const snapshotPath = path.join(fixture.root, 'cache', 'catalog.json.gz')
+const warmCatalog = new Catalog(fixture.root, { snapshotPath: null })
+
+afterAll(() => fixture.cleanup())
+
+describe('catalog request latency (2800 files)', () => {
+  bench('cold request', async () => {
+    await new Catalog(fixture.root, { snapshotPath: null }).getSearchItems()
+  }, { iterations: 5 })
+
+  bench('snapshot start', async () => {
+    await new Catalog(fixture.root, { snapshotPath }).getSearchItems()
+  }, {
+    iterations: 5,
+    setup: async () => {
+      const catalog = new Catalog(fixture.root, { snapshotPath })
+      await catalog.refresh()
+      await catalog.flushSnapshot()
+    },
+  })
+
+  bench('warm request', async () => {
+    await warmCatalog.getSearchItems()
+  }, {
+    iterations: 20,
+    setup: async () => {
+      await warmCatalog.refresh()
+    },
+  })
+})
@@ -0,0 +1,141 @@
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+
+export interface ClaudeFixtureOptions {
+  skills?: number;
+  commands?: number;
+  agents?: number;
+  hooks?: number;
+  architectureDocs?: number;
+  workflows?: number;
+}
+
+const STAGES = ['discovery', 'prototype', 'productspecs', 'solarch', 'implementation', 'utility'];
+
+function skillMarkdown(i: number): string {
+  const stage = STAGES[i % STAGES.length];
+  return `---
+name: ${stage}-skill-${i}
+description: Synthetic ${stage} skill number ${i} used for benchmarking
+model: sonnet
+allowed-tools: Read, Write, Grep
+tags:
+  - ${stage}
+  - bench
+hooks:
+  PreToolUse:
+    - matcher: "Write"
+      hooks:
+        - type: command
+          command: python3 .claude/hooks/check_${i}.py
+---
+# ${stage} skill ${i}
+
+Generates artifacts for the ${stage} stage of item ${i}.
+
+## When to Use
+
+- When the ${stage} checkpoint ${i} is reached
+- When regenerating outputs
+
+## Workflow
+
+1. Read inputs
+2. Produce outputs for ${i}
+3. Validate traceability
+${'\nLorem ipsum dolor sit amet, consectetur adipiscing elit. '.repeat(20)}
+`;
+}
+
+function commandMarkdown(i: number): string {
+  const stage = STAGES[i % STAGES.length];
+  return `---
+description: Synthetic ${stage} command ${i}
+argument-hint: <SystemName>
+skills:
+  required:
+    - ${stage}-skill-${i}
+---
+# /${stage}-command-${i}
+
+Runs the ${stage} pipeline ${i}.
+
+## Usage
+
+\`/${stage}-command-${i} MySystem\`
+`;
+}
+
+function agentMarkdown(i: number): string {
+  const stage = STAGES[i % STAGES.length];
+  return `---
+name: ${stage}-agent-${i}
+description: Synthetic ${stage} agent ${i}
+model: haiku
+---
+# ${stage} agent ${i}
+
+Analyzes inputs for ${stage}.
+
+## Capabilities
+
+- Parse material ${i}
+- Summarize findings
+`;
+}
+
+/**
+ * Create a throwaway project root with a synthetic `.claude/` tree.
+ * Returns the root path and a cleanup function.
+ */
+export function createClaudeFixture(options: ClaudeFixtureOptions = {}): { root: string; cleanup: () => void } {
+  const {
+    skills = 0,
+    commands = 0,
+    agents = 0,
+    hooks = 0,
+    architectureDocs = 0,
+    workflows = 0,
+  } = options;
+  const root = fs.mkdtempSync(path.join(os.tmpdir(), 'claudemanual-fixture-'));
+  const claude = path.join(root, '.claude');
+
+  for (let i = 0; i < skills; i++) {
+    const dir = path.join(claude, 'skills', `${STAGES[i % STAGES.length]}-skill-${i}`);
+    fs.mkdirSync(dir, { recursive: true });
+    fs.writeFileSync(path.join(dir, 'SKILL.md'), skillMarkdown(i));
+  }
+
+  fs.mkdirSync(path.join(claude, 'commands'), { recursive: true });
+  for (let i = 0; i < commands; i++) {
+    fs.writeFileSync(path.join(claude, 'commands', `${STAGES[i % STAGES.length]}-command-${i}.md`), commandMarkdown(i));
+  }
+
+  fs.mkdirSync(path.join(claude, 'agents'), { recursive: true });
+  for (let i = 0; i < agents; i++) {
+    fs.writeFileSync(path.join(claude, 'agents', `${STAGES[i % STAGES.length]}-agent-${i}.md`), agentMarkdown(i));
+  }
+
+  fs.mkdirSync(path.join(claude, 'hooks'), { recursive: true });
+  for (let i = 0; i < hooks; i++) {
+    fs.writeFileSync(path.join(claude, 'hooks', `check_${i}.py`), `"""Validate output ${i}."""\nimport sys\n`);
+  }
+
+  for (let i = 0; i < architectureDocs; i++) {
+    const dir = path.join(claude, 'architecture', `Folder ${i % 20}`);
+    fs.mkdirSync(dir, { recursive: true });
+    fs.writeFileSync(path.join(dir, `Doc_${i}.md`), `# Architecture doc ${i}\n\n${'Design notes and decisions. '.repeat(40)}\n`);
+  }
+
+  for (let i = 0; i < workflows; i++) {
+    const dir = path.join(claude, 'architecture', 'Workflows', 'Discovery Phase');
+    fs.mkdirSync(dir, { recursive: true });
+    fs.writeFileSync(path.join(dir, `Workflow_${i}.md`), `# Workflow ${i}\n\nStep by step.\n`);
+  }
+
+  return {
+    root,
+    cleanup: () => fs.rmSync(root, { recursive: true, force: true }),
+  };
+}
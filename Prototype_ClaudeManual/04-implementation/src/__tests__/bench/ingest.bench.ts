@@ -0,0 +1,110 @@
+// @vitest-environment node
+import fs from 'fs'
+import os from 'os'
+import path from 'path'
+import { fileURLToPath } from 'url'
+import { Worker } from 'worker_threads'
+import { afterAll, beforeAll, bench, describe } from 'vitest'
+import { Catalog } from '@/lib/catalog'
+import { ParsePool, defaultPoolSize } from '@/lib/catalog/parsePool'
+import { createClaudeFixture } from './fixtures'
+
+// Run with: npm run bench
+// Cold start of a synthetic 10k-file .claude/ tree, parsed on the main thread
+// vs. on the worker pool. Prints files/sec and how far RSS rose above its
+// starting value during a run, per mode, when done.
+
+const FILE_COUNT = 10_000
+const srcDir = path.resolve(path.dirname(fileURLToPath(import.meta.url)), '../..')
+
+const fixture = createClaudeFixture({
+  skills: 4000,
+  commands: 2000,
+  agents: 1500,
+  hooks: 500,
+  architectureDocs: 1500,
+  workflows: 500,
+})
+
+// RSS is sampled this often during a run; parsing yields on file reads, so samples keep coming
+const RSS_SAMPLE_MS = 5
+
+const stats: Record<string, { runs: number; totalMs: number; rssGrowthMb: number }> = {}
+let workerDir = ''
+let pool: ParsePool
+
+// Worker threads can't load TypeScript, so bundle the worker entry first
+async function buildParseWorker(outDir: string): Promise<string> {
+  const { build } = await import('vite')
+  await build({
+    configFile: false,
+    logLevel: 'silent',
+    resolve: { alias: { '@': srcDir } },
+    build: {
+      ssr: path.join(srcDir, 'lib/catalog/parseWorker.ts'),
+      outDir,
+      emptyOutDir: true,
+      rollupOptions: { output: { format: 'es', entryFileNames: 'parseWorker.mjs' } },
+    },
+  })
+  return path.join(outDir, 'parseWorker.mjs')
+}
+
+async function coldStart(mode: string, parsePool: ParsePool | null) {
+  // maxRSS only ever grows across the whole process, so it would carry one mode's
+  // peak into the next; measure each run against its own starting RSS instead
+  const baseline = process.memoryUsage().rss
+  let peak = baseline
+  const sample = () => {
+    peak = Math.max(peak, process.memoryUsage().rss)
+  }
+  const sampler = setInterval(sample, RSS_SAMPLE_MS)
+
+  const started = performance.now()
+  try {
+    await new Catalog(fixture.root, { parsePool, snapshotPath: null }).refresh()
+  } finally {
+    clearInterval(sampler)
+  }
+  sample()
+
+  const entry = (stats[mode] ??= { runs: 0, totalMs: 0, rssGrowthMb: 0 })
+  entry.runs++
+  entry.totalMs += performance.now() - started
+  // rss covers the whole process, worker threads included
+  entry.rssGrowthMb = Math.max(entry.rssGrowthMb, (peak - baseline) / 1024 / 1024)
+}
+
+beforeAll(async () => {
+  workerDir = fs.mkdtempSync(path.join(os.tmpdir(), 'claudemanual-worker-'))
+  const workerFile = await buildParseWorker(workerDir)
+  pool = new ParsePool({ size: Math.max(1, defaultPoolSize()), createWorker: () => new Worker(workerFile) })
+})
+
+afterAll(() => {
+  pool.close()
+  fixture.cleanup()
+  fs.rmSync(workerDir, { recursive: true, force: true })
+
+  console.table(
+    Object.fromEntries(
+      Object.entries(stats).map(([mode, { runs, totalMs, rssGrowthMb }]) => [
+        mode,
+        {
+          'files/sec': Math.round(FILE_COUNT / (totalMs / runs / 1000)),
+          'peak RSS growth (MB)': Math.round(rssGrowthMb),
+        },
+      ])
+    )
+  )
+})
+
+describe(`cold start (${FILE_COUNT} files, ${Math.max(1, defaultPoolSize())} parse workers)`, () => {
+  bench('main thread', async () => {
+    await coldStart('main thread', null)
+  }, { iterations: 3 })
+
+  bench('worker pool', async () => {
+    await coldStart('worker pool', pool)
+  }, { iterations: 3 })
+})
@@ -0,0 +1,69 @@
+import { bench, describe } from 'vitest'
+import { render } from '@testing-library/react'
+import { NavigationTree } from '@/components/NavigationTree'
+import { IncrementalMatcher, buildSearchTexts, filterTree, matchSearchTexts } from '@/lib/treeFilter'
+import type { Stage, TreeNode } from '@/types/navigation'
+
+// Run with: npm run bench
+// Per keystroke the tree has to be matched, filtered and re-rendered within a
+// 16ms frame. Matching moves to a worker above WORKER_MIN_NODES; here it runs inline.
+
+const STAGES: Stage[] = ['discovery', 'prototype', 'productspecs', 'solarch', 'implementation']
+const CATEGORIES = ['skills', 'commands', 'agents'] as const
+
+function createTree(nodes: number): TreeNode[] {
+  const perCategory = Math.ceil(nodes / CATEGORIES.length)
+  return CATEGORIES.map((category) => ({
+    id: category,
+    label: category,
+    type: 'category' as const,
+    count: perCategory,
+    children: Array.from({ length: perCategory }, (_, i) => {
+      const stage = STAGES[i % STAGES.length]
+      return {
+        id: `${category}-${i}`,
+        label: `${stage}-${category.slice(0, -1)}-${i}`,
+        type: category.slice(0, -1) as 'skill' | 'command' | 'agent',
+        stage,
+        stages: [stage],
+        path: `.claude/${category}/${stage}-${i}.md`,
+        description: `Synthetic ${stage} ${category.slice(0, -1)} number ${i}`,
+      }
+    }),
+  }))
+}
+
+for (const size of [5_000, 20_000, 50_000]) {
+  const items = createTree(size)
+  const texts = buildSearchTexts(items)
+  const query = 'prototype-skill-1'
+
+  describe(`navigation tree (${size} nodes)`, () => {
+    bench('filter keystroke (full scan)', () => {
+      filterTree(items, [], new Set(matchSearchTexts(texts, query)))
+    }, { iterations: 20 })
+
+    const matcher = new IncrementalMatcher()
+    bench('filter keystroke (incremental)', () => {
+      filterTree(items, [], new Set(matcher.match(query)))
+    }, {
+      iterations: 20,
+      setup: () => {
+        matcher.setTexts(texts)
+        matcher.match(query.slice(0, -1))
+      },
+    })
+
+    bench('stage filter', () => {
+      filterTree(items, ['prototype'], null)
+    }, { iterations: 20 })
+
+    bench('render, all expanded by search', () => {
+      render(<NavigationTree items={items} searchQuery="synthetic" onSelect={() => {}} />).unmount()
+    }, { iterations: 10 })
+
+    bench('render, filtered by search', () => {
+      render(<NavigationTree items={items} searchQuery={query} onSelect={() => {}} />).unmount()
+    }, { iterations: 10 })
+  })
+}
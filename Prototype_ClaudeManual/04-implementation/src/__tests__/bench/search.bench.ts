@@ -0,0 +1,44 @@
+// @vitest-environment node
+import { afterAll, beforeAll, bench, describe } from 'vitest'
+import { Catalog } from '@/lib/catalog'
+import type { SearchIndex } from '@/lib/search'
+import { createClaudeFixture } from './fixtures'
+
+// Run with: npm run bench
+// Query latency against a warm index; excludes the initial scan.
+
+const fixture = createClaudeFixture({
+  skills: 1000,
+  commands: 500,
+  agents: 500,
+  hooks: 200,
+  architectureDocs: 500,
+  workflows: 100,
+})
+
+let index: SearchIndex
+
+beforeAll(async () => {
+  index = await new Catalog(fixture.root, { snapshotPath: null }).getSearchIndex()
+})
+
+afterAll(() => fixture.cleanup())
+
+describe('search latency (2800 files)', () => {
+  bench('exact term', () => {
+    index.search('discovery')
+  })
+
+  bench('multi-term with prefix', () => {
+    index.search('prototype sk')
+  })
+
+  bench('fuzzy term', () => {
+    index.search('protoytpe ')
+  })
+
+  bench('filtered second page', () => {
+    const first = index.search('skill', { types: ['Skill'], stages: ['discovery'] })
+    index.search('skill', { types: ['Skill'], stages: ['discovery'], cursor: first.nextCursor })
+  })
+})
@@ -1,6 +1,7 @@
 import { describe, it, expect, vi } from 'vitest';
 import { render, screen, fireEvent } from '@testing-library/react';
 import { NavigationTree } from '../../components/NavigationTree';
+import { WORKER_MIN_NODES } from '../../hooks/useTreeSearch';
 import type { TreeNode, Stage } from '../../types/navigation';
 
 const mockTreeData: TreeNode[] = [
@@ -217,6 +218,28 @@ describe('NavigationTree', () => {
       ).toBeInTheDocument();
     });
 
+    it('shows a pending state, not the empty state, until the search worker answers', () => {
+      // A worker that never answers
+      vi.stubGlobal('Worker', class {
+        onmessage = null;
+        postMessage() {}
+        terminate() {}
+      });
+      const hugeTree: TreeNode[] = Array.from({ length: WORKER_MIN_NODES }, (_, i) => ({
+        id: `skill-${i}`,
+        label: `Skill ${i}`,
+        type: 'skill' as const,
+      }));
+
+      try {
+        render(<NavigationTree items={hugeTree} searchQuery="skill 42" onSelect={vi.fn()} />);
+        expect(screen.getByText('Searching...')).toBeInTheDocument();
+        expect(screen.queryByText(/no items found/i)).not.toBeInTheDocument();
+      } finally {
+        vi.unstubAllGlobals();
+      }
+    });
+
     it('updates count badges when filter active', () => {
       const onSelect = vi.fn();
       const { rerender } = render(
@@ -267,6 +290,85 @@ describe('NavigationTree', () => {
     });
   });
 
+  describe('Virtualization', () => {
+    const largeTree: TreeNode[] = [
+      {
+        id: 'skills',
+        label: 'Skills',
+        type: 'category',
+        children: Array.from({ length: 2000 }, (_, i) => ({
+          id: `skill-${i}`,
+          label: `Skill ${i}`,
+          type: 'skill' as const,
+          stage: 'discovery' as Stage,
+        })),
+      },
+    ];
+
+    it('renders only the rows in view', () => {
+      const onSelect = vi.fn();
+      const { container } = render(<NavigationTree items={largeTree} onSelect={onSelect} />);
+
+      fireEvent.click(screen.getByText('Skills'));
+
+      const rendered = container.querySelectorAll('[role="treeitem"]').length;
+      expect(rendered).toBeGreaterThan(1);
+      expect(rendered).toBeLessThan(100);
+      expect(screen.queryByText('Skill 1999')).not.toBeInTheDocument();
+    });
+
+    it('renders rows further down after scrolling', () => {
+      const onSelect = vi.fn();
+      const { container } = render(<NavigationTree items={largeTree} onSelect={onSelect} />);
+      fireEvent.click(screen.getByText('Skills'));
+
+      const scroller = container.firstChild as HTMLElement;
+      scroller.scrollTop = 1500 * 36;
+      fireEvent.scroll(scroller);
+
+      expect(screen.getByText('Skill 1500')).toBeInTheDocument();
+      expect(screen.queryByText('Skill 10')).not.toBeInTheDocument();
+    });
+
+    it('windows rows when an outer element scrolls instead of the tree', () => {
+      const onSelect = vi.fn();
+      const { container } = render(
+        <div data-testid="outer" style={{ height: 400, overflowY: 'auto' }}>
+          <NavigationTree items={largeTree} onSelect={onSelect} />
+        </div>
+      );
+      fireEvent.click(screen.getByText('Skills'));
+
+      // Laid out without a definite height, the tree grows to the full list and never scrolls itself
+      const outer = screen.getByTestId('outer');
+      const tree = container.querySelector('[role="tree"]') as HTMLElement;
+      const treeScroller = tree.parentElement as HTMLElement;
+      const listHeight = 2001 * 36;
+      Object.defineProperty(treeScroller, 'clientHeight', { configurable: true, value: listHeight });
+      const box = (top: number, height: number) =>
+        ({ top, bottom: top + height, height, left: 0, right: 300, width: 300, x: 0, y: top, toJSON: () => ({}) }) as DOMRect;
+      const rect = vi.spyOn(HTMLElement.prototype, 'getBoundingClientRect').mockImplementation(function (this: HTMLElement) {
+        if (this === outer) return box(0, 400);
+        if (this === treeScroller) return box(-outer.scrollTop, listHeight + 32);
+        if (this === tree) return box(16 - outer.scrollTop, listHeight);
+        return box(0, 0);
+      });
+
+      try {
+        fireEvent.scroll(outer);
+        expect(container.querySelectorAll('[role="treeitem"]').length).toBeLessThan(40);
+
+        outer.scrollTop = 1500 * 36;
+        fireEvent.scroll(outer);
+        expect(screen.getByText('Skill 1500')).toBeInTheDocument();
+        expect(screen.queryByText('Skill 10')).not.toBeInTheDocument();
+        expect(container.querySelectorAll('[role="treeitem"]').length).toBeLessThan(40);
+      } finally {
+        rect.mockRestore();
+      }
+    });
+  });
+
   describe('Accessibility', () => {
     it('has proper ARIA attributes', () => {
       const onSelect = vi.fn();
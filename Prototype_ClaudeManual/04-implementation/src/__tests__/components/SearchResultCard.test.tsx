@@ -84,6 +84,39 @@ describe('SearchResultCard', () => {
     expect(marks.length).toBeGreaterThan(0);
   });
 
+  it('highlights server-provided match offsets instead of the raw query', () => {
+    const handleClick = vi.fn();
+    const result: SearchResult = {
+      ...mockSearchResult,
+      highlights: [
+        { field: 'name', start: 0, end: 9 },
+        { field: 'description', start: 30, end: 34 },
+      ],
+    };
+    const { container } = render(
+      <SearchResultCard result={result} query="discover pains" onClick={handleClick} />
+    );
+
+    const marks = Array.from(container.querySelectorAll('mark')).map(m => m.textContent);
+    expect(marks).toEqual(['Discovery', 'pain']);
+  });
+
+  it('renders the content snippet with its match offsets marked like the other fields', () => {
+    const handleClick = vi.fn();
+    const result: SearchResult = {
+      ...mockSearchResult,
+      content: 'Groups pain points by persona',
+      highlights: [{ field: 'content', start: 7, end: 11 }],
+    };
+    const { container } = render(
+      <SearchResultCard result={result} query="pain" onClick={handleClick} />
+    );
+
+    const marks = Array.from(container.querySelectorAll('mark'));
+    expect(marks.map(m => m.textContent)).toEqual(['pain']);
+    expect(marks[0].parentElement?.textContent).toBe('Groups pain points by persona...');
+  });
+
   it('applies highlighted style when highlighted prop is true', () => {
     const handleClick = vi.fn();
     const { container } = render(
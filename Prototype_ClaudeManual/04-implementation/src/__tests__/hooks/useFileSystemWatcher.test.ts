@@ -0,0 +1,67 @@
+import { describe, it, expect, beforeEach } from 'vitest'
+import { QueryClient } from '@tanstack/react-query'
+import type { QueryKey } from '@tanstack/react-query'
+import { invalidateCatalogQueries, invalidateForChanges } from '@/hooks/useFileSystemWatcher'
+import type { CatalogChange } from '@/lib/catalog/types'
+
+const KEYS: QueryKey[] = [
+  ['skills'],
+  ['commands'],
+  ['agents'],
+  ['search', 'jtbd', [], []],
+  ['architecture-hierarchy', '.claude/architecture'],
+  ['workflow-hierarchy', '.claude/architecture/Workflows'],
+  ['architecture-content', 'CC/Hooks.md'],
+  ['architecture-content', 'CC/Other.md'],
+  ['workflow-content', 'Discovery Phase/Overview.md'],
+  ['preferences'],
+]
+
+describe('useFileSystemWatcher invalidation', () => {
+  let queryClient: QueryClient
+
+  const invalidated = () =>
+    KEYS.filter(key => queryClient.getQueryState(key)?.isInvalidated).map(key => key[0] + (key[1] ? `:${key[1]}` : ''))
+
+  beforeEach(() => {
+    queryClient = new QueryClient()
+    for (const key of KEYS) queryClient.setQueryData(key, {})
+  })
+
+  it('invalidates the list of the changed kind and search only', () => {
+    const changes: CatalogChange[] = [
+      { path: '.claude/skills/Discovery_JTBD/SKILL.md', kind: 'skills', id: 'Discovery_JTBD', action: 'changed' },
+    ]
+
+    invalidateForChanges(queryClient, changes)
+
+    expect(invalidated()).toEqual(['skills', 'search:jtbd'])
+  })
+
+  it('invalidates only the open document that changed', () => {
+    invalidateForChanges(queryClient, [
+      { path: '.claude/architecture/CC/Hooks.md', kind: 'architecture', id: 'arch-cc-hooks', action: 'changed' },
+    ])
+
+    expect(invalidated()).toEqual(['search:jtbd', 'architecture-content:CC/Hooks.md'])
+  })
+
+  it('refreshes folder trees when workflow files are added', () => {
+    invalidateForChanges(queryClient, [
+      { path: '.claude/architecture/Workflows/Discovery Phase/New.md', kind: 'workflows', id: 'workflow-new', action: 'added' },
+    ])
+
+    expect(invalidated()).toEqual([
+      'search:jtbd',
+      'architecture-hierarchy:.claude/architecture',
+      'workflow-hierarchy:.claude/architecture/Workflows',
+    ])
+  })
+
+  it('can invalidate everything served from the catalog', () => {
+    invalidateCatalogQueries(queryClient)
+
+    expect(invalidated()).toHaveLength(KEYS.length - 1)
+    expect(queryClient.getQueryState(['preferences'])?.isInvalidated).toBe(false)
+  })
+})
@@ -0,0 +1,83 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest'
+import { act, renderHook } from '@testing-library/react'
+import { WORKER_MIN_NODES, useTreeSearch } from '@/hooks/useTreeSearch'
+import type { TreeSearchRequest, TreeSearchResponse } from '@/lib/treeFilter.worker'
+
+// Stands in for the tree search worker; answers are sent by the test
+class FakeWorker {
+  static instances: FakeWorker[] = []
+  onmessage: ((event: MessageEvent<TreeSearchResponse>) => void) | null = null
+  requests: TreeSearchRequest[] = []
+
+  constructor() {
+    FakeWorker.instances.push(this)
+  }
+
+  postMessage(request: TreeSearchRequest) {
+    this.requests.push(request)
+  }
+
+  terminate() {}
+
+  answer(matches: number[]) {
+    const last = this.requests.filter(request => request.type === 'match').pop()!
+    act(() => this.onmessage?.({ data: { id: (last as { id: number }).id, matches } } as MessageEvent<TreeSearchResponse>))
+  }
+}
+
+const largeTexts = (prefix: string) => Array.from({ length: WORKER_MIN_NODES }, (_, i) => `${prefix}-${i}`)
+
+describe('useTreeSearch', () => {
+  beforeEach(() => {
+    FakeWorker.instances = []
+    vi.stubGlobal('Worker', FakeWorker)
+  })
+
+  afterEach(() => {
+    vi.unstubAllGlobals()
+  })
+
+  it('matches small trees inline', () => {
+    const { result } = renderHook(() => useTreeSearch(['alpha', 'beta', 'alphabet'], 'alpha'))
+    expect([...result.current.matches!]).toEqual([0, 2])
+    expect(result.current.pending).toBe(false)
+    expect(FakeWorker.instances).toHaveLength(0)
+  })
+
+  it('is pending and matches nothing in a large tree until the worker answers', () => {
+    const texts = largeTexts('skill')
+    const { result, rerender } = renderHook(({ query }) => useTreeSearch(texts, query), {
+      initialProps: { query: '' },
+    })
+    expect(result.current).toEqual({ matches: null, pending: false })
+
+    rerender({ query: 'skill-42' })
+    expect(result.current.matches!.size).toBe(0)
+    expect(result.current.pending).toBe(true)
+
+    FakeWorker.instances[0].answer([42])
+    expect([...result.current.matches!]).toEqual([42])
+    expect(result.current.pending).toBe(false)
+
+    // A refined query keeps the previous matches until its own answer arrives
+    rerender({ query: 'skill-420' })
+    expect([...result.current.matches!]).toEqual([42])
+    expect(result.current.pending).toBe(true)
+  })
+
+  it('keeps the previous matches while texts that have since changed are searched again', () => {
+    const { result, rerender } = renderHook(({ texts }) => useTreeSearch(texts, 'skill-1'), {
+      initialProps: { texts: largeTexts('skill') },
+    })
+    FakeWorker.instances[0].answer([1])
+    expect(result.current.pending).toBe(false)
+
+    rerender({ texts: largeTexts('skill') })
+    expect([...result.current.matches!]).toEqual([1])
+    expect(result.current.pending).toBe(true)
+
+    FakeWorker.instances[0].answer([1, 10])
+    expect([...result.current.matches!]).toEqual([1, 10])
+    expect(result.current.pending).toBe(false)
+  })
+})
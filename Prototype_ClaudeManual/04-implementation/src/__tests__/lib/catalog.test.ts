@@ -0,0 +1,165 @@
+// @vitest-environment node
+import fs from 'fs'
+import os from 'os'
+import path from 'path'
+import { gunzipSync, gzipSync } from 'zlib'
+import { describe, it, expect, beforeEach, afterEach } from 'vitest'
+import { Catalog, SNAPSHOT_VERSION } from '@/lib/catalog'
+import { defaultSnapshotPath } from '@/lib/catalog/snapshot'
+import { createClaudeFixture } from '../bench/fixtures'
+
+describe('Catalog', () => {
+  let fixture: ReturnType<typeof createClaudeFixture>
+  const snapshotPath = () => path.join(fixture.root, 'cache', 'catalog.json.gz')
+
+  beforeEach(() => {
+    fixture = createClaudeFixture({ skills: 3, commands: 2, agents: 2, hooks: 1, architectureDocs: 2, workflows: 1 })
+  })
+
+  afterEach(() => {
+    fixture.cleanup()
+  })
+
+  it('indexes every source', async () => {
+    const catalog = new Catalog(fixture.root, { snapshotPath: snapshotPath() })
+
+    expect(await catalog.getSkills()).toHaveLength(3)
+    expect(await catalog.getCommands()).toHaveLength(2)
+    expect(await catalog.getAgents()).toHaveLength(2)
+
+    const searchItems = await catalog.getSearchItems()
+    const types = new Set(searchItems.map(item => item.type))
+    expect(types).toEqual(new Set(['Skill', 'Command', 'Agent', 'Hook', 'Workflow', 'Architecture']))
+    expect(searchItems).toHaveLength(11)
+  })
+
+  it('parses skill frontmatter, hooks and sections', async () => {
+    const catalog = new Catalog(fixture.root, { snapshotPath: snapshotPath() })
+    const skill = (await catalog.getSkills()).find(s => s.id === 'discovery-skill-0')!
+
+    expect(skill.stage).toBe('Discovery')
+    expect(skill.name).toBe('Discovery Skill 0')
+    expect(skill.allowed_tools).toEqual(['Read', 'Write', 'Grep'])
+    expect(skill.frontmatter.hooks?.PreToolUse?.[0].matcher).toBe('Write')
+    expect(skill.content.example).toContain('Use when:')
+    expect(skill.path).toBe('.claude/skills/discovery-skill-0/SKILL.md')
+  })
+
+  it('formats skill names on hyphens and underscores only', async () => {
+    const skillDir = path.join(fixture.root, '.claude/skills/spaced-skill')
+    fs.mkdirSync(skillDir, { recursive: true })
+    fs.writeFileSync(path.join(skillDir, 'SKILL.md'), '---\nname: my skill-name_v2\ndescription: Spaced\n---\n# Spaced\n')
+    fs.writeFileSync(path.join(fixture.root, '.claude/commands/spaced command.md'), '---\ndescription: Spaced\n---\n# Spaced\n')
+
+    const catalog = new Catalog(fixture.root, { snapshotPath: snapshotPath() })
+    expect((await catalog.getSkills()).find(s => s.id === 'spaced-skill')?.name).toBe('My skill Name V2')
+    // Other kinds capitalize every word, as before
+    expect((await catalog.getCommands()).find(c => c.id === 'spaced command')?.name).toBe('Spaced Command')
+  })
+
+  it('returns cached lists when nothing changed', async () => {
+    const catalog = new Catalog(fixture.root, { snapshotPath: snapshotPath() })
+    const first = await catalog.getSkills()
+    const second = await catalog.getSkills()
+
+    expect(second).toBe(first)
+  })
+
+  it('re-parses only files whose mtime changed', async () => {
+    const catalog = new Catalog(fixture.root, { snapshotPath: snapshotPath() })
+    const before = await catalog.getAgents()
+    const untouched = before.find(a => a.id === 'prototype-agent-1')
+
+    const agentPath = path.join(fixture.root, '.claude', 'agents', 'discovery-agent-0.md')
+    fs.writeFileSync(agentPath, '---\nname: renamed-agent\ndescription: Updated\n---\n# Renamed\n')
+    const future = new Date(Date.now() + 5000)
+    fs.utimesSync(agentPath, future, future)
+
+    const after = await catalog.getAgents()
+    expect(after).not.toBe(before)
+    expect(after.find(a => a.id === 'discovery-agent-0')?.name).toBe('Renamed Agent')
+    expect(after.find(a => a.id === 'prototype-agent-1')).toBe(untouched)
+  })
+
+  it('drops deleted files', async () => {
+    const catalog = new Catalog(fixture.root, { snapshotPath: snapshotPath() })
+    expect(await catalog.getCommands()).toHaveLength(2)
+
+    fs.rmSync(path.join(fixture.root, '.claude', 'commands', 'discovery-command-0.md'))
+
+    const commands = await catalog.getCommands()
+    expect(commands.map(c => c.id)).toEqual(['prototype-command-1'])
+  })
+
+  it('shares a single refresh between concurrent callers', async () => {
+    const catalog = new Catalog(fixture.root, { snapshotPath: snapshotPath() })
+    const [a, b] = await Promise.all([catalog.getSkills(), catalog.getSkills()])
+
+    expect(a).toBe(b)
+  })
+  describe('snapshot', () => {
+    const agentPath = () => path.join(fixture.root, '.claude', 'agents', 'discovery-agent-0.md')
+
+    async function saveSnapshot() {
+      const catalog = new Catalog(fixture.root, { snapshotPath: snapshotPath() })
+      await catalog.refresh()
+      await catalog.flushSnapshot()
+    }
+
+    it('restores the catalog and search index without re-parsing unchanged files', async () => {
+      // A whole-second mtime can be restored exactly; Date-based utimes drops sub-millisecond precision
+      const pinned = new Date(Math.floor(Date.now() / 1000) * 1000 - 60_000)
+      fs.utimesSync(agentPath(), pinned, pinned)
+      await saveSnapshot()
+      expect(fs.existsSync(snapshotPath())).toBe(true)
+
+      // Same size and mtime: only a parse would notice the new content
+      fs.writeFileSync(agentPath(), fs.readFileSync(agentPath(), 'utf-8').replace('Synthetic', 'Different'))
+      fs.utimesSync(agentPath(), pinned, pinned)
+
+      const catalog = new Catalog(fixture.root, { snapshotPath: snapshotPath() })
+      const agent = (await catalog.getAgents()).find(a => a.id === 'discovery-agent-0')!
+      expect(agent.description).toContain('Synthetic')
+      expect((await catalog.getSearchItems())).toHaveLength(11)
+
+      const page = (await catalog.getSearchIndex()).search('discovery agent')
+      expect(page.results.map(hit => hit.id)).toContain('discovery-agent-0')
+    })
+
+    it('re-parses files changed since the snapshot was saved', async () => {
+      await saveSnapshot()
+
+      fs.writeFileSync(agentPath(), '---\nname: renamed-agent\ndescription: Updated\n---\n# Renamed\n')
+      const future = new Date(Date.now() + 5000)
+      fs.utimesSync(agentPath(), future, future)
+      fs.rmSync(path.join(fixture.root, '.claude', 'commands', 'discovery-command-0.md'))
+
+      const catalog = new Catalog(fixture.root, { snapshotPath: snapshotPath() })
+      expect((await catalog.getAgents()).find(a => a.id === 'discovery-agent-0')?.name).toBe('Renamed Agent')
+      expect((await catalog.getCommands()).map(c => c.id)).toEqual(['prototype-command-1'])
+    })
+
+    it('keeps the default snapshot in the app cache, one file per project', () => {
+      const cacheDir = path.join(os.tmpdir(), 'claudemanual-cache')
+      const file = defaultSnapshotPath(fixture.root, cacheDir)
+
+      expect(file.startsWith(path.join(cacheDir, 'claude-manual') + path.sep)).toBe(true)
+      expect(defaultSnapshotPath(fixture.root, cacheDir)).toBe(file)
+      expect(defaultSnapshotPath(path.join(fixture.root, 'other'), cacheDir)).not.toBe(file)
+    })
+
+    it('rebuilds from source when the snapshot version differs', async () => {
+      fs.mkdirSync(path.dirname(snapshotPath()), { recursive: true })
+      const stale = { version: SNAPSHOT_VERSION + 1, savedAt: new Date().toISOString(), entries: [{ path: 'bogus' }] }
+      fs.writeFileSync(snapshotPath(), gzipSync(JSON.stringify(stale)))
+
+      const catalog = new Catalog(fixture.root, { snapshotPath: snapshotPath() })
+      expect(await catalog.getSearchItems()).toHaveLength(11)
+
+      await catalog.flushSnapshot()
+      const saved = JSON.parse(gunzipSync(fs.readFileSync(snapshotPath())).toString('utf-8'))
+      expect(saved.version).toBe(SNAPSHOT_VERSION)
+      expect(saved.entries).toHaveLength(11)
+    })
+  })
+})
@@ -0,0 +1,135 @@
+// @vitest-environment node
+import fs from 'fs'
+import path from 'path'
+import { describe, it, expect, beforeEach, afterEach } from 'vitest'
+import { Catalog } from '@/lib/catalog'
+import type { CatalogChangeEvent } from '@/lib/catalog'
+import { CatalogWatcher } from '@/lib/catalog/watcher'
+import { createClaudeFixture } from '../bench/fixtures'
+
+function nextEvent(catalog: Catalog, timeoutMs = 5000): Promise<CatalogChangeEvent> {
+  return new Promise((resolve, reject) => {
+    const timer = setTimeout(() => {
+      unsubscribe()
+      reject(new Error('Timed out waiting for a catalog change'))
+    }, timeoutMs)
+    const unsubscribe = catalog.subscribe(event => {
+      clearTimeout(timer)
+      unsubscribe()
+      resolve(event)
+    })
+  })
+}
+
+describe('Catalog.applyChanges', () => {
+  let fixture: ReturnType<typeof createClaudeFixture>
+  let catalog: Catalog
+
+  beforeEach(async () => {
+    fixture = createClaudeFixture({ skills: 3, commands: 2, agents: 2, hooks: 1, architectureDocs: 2, workflows: 1 })
+    catalog = new Catalog(fixture.root, { snapshotPath: null })
+    await catalog.refresh()
+  })
+
+  afterEach(() => {
+    catalog.unwatch()
+    fixture.cleanup()
+  })
+
+  it('re-reads a single edited file and reports its id', async () => {
+    const relativePath = '.claude/agents/discovery-agent-0.md'
+    fs.writeFileSync(path.join(fixture.root, relativePath), '---\nname: renamed-agent\ndescription: Updated\n---\n# Renamed\n')
+
+    const changes = await catalog.applyChanges([relativePath, relativePath])
+
+    expect(changes).toEqual([{ path: relativePath, kind: 'agents', id: 'discovery-agent-0', action: 'changed' }])
+    expect((await catalog.getAgents()).find(a => a.id === 'discovery-agent-0')?.name).toBe('Renamed Agent')
+  })
+
+  it('reports added and removed files', async () => {
+    const added = '.claude/commands/new-command.md'
+    const removed = '.claude/commands/discovery-command-0.md'
+    fs.writeFileSync(path.join(fixture.root, added), '---\ndescription: New\n---\n# New\n')
+    fs.rmSync(path.join(fixture.root, removed))
+
+    const changes = await catalog.applyChanges([added, removed])
+
+    expect(changes.map(c => [c.path, c.action])).toEqual(expect.arrayContaining([[added, 'added'], [removed, 'removed']]))
+    expect((await catalog.getCommands()).map(c => c.id).sort()).toEqual(['new-command', 'prototype-command-1'])
+  })
+
+  it('handles directory renames', async () => {
+    const skills = path.join(fixture.root, '.claude', 'skills')
+    fs.renameSync(path.join(skills, 'discovery-skill-0'), path.join(skills, 'renamed-skill'))
+
+    const changes = await catalog.applyChanges(['.claude/skills/discovery-skill-0', '.claude/skills/renamed-skill'])
+
+    expect(changes.map(c => [c.id, c.action]).sort()).toEqual([['discovery-skill-0', 'removed'], ['renamed-skill', 'added']])
+  })
+
+  it('ignores files that are not catalog sources', async () => {
+    fs.writeFileSync(path.join(fixture.root, '.claude', 'skills', 'discovery-skill-0', 'notes.txt'), 'scratch')
+
+    expect(await catalog.applyChanges(['.claude/skills/discovery-skill-0/notes.txt'])).toEqual([])
+  })
+
+  it('notifies subscribers', async () => {
+    const events: CatalogChangeEvent[] = []
+    catalog.subscribe(event => events.push(event))
+    fs.rmSync(path.join(fixture.root, '.claude', 'hooks', 'check_0.py'))
+
+    await catalog.applyChanges(['.claude/hooks/check_0.py'])
+
+    expect(events).toHaveLength(1)
+    expect(events[0].version).toBe(catalog.currentVersion)
+    expect(events[0].changes[0].action).toBe('removed')
+  })
+
+  it('updates from filesystem events while watching', async () => {
+    expect(catalog.watch()).toBe(true)
+    const event = nextEvent(catalog)
+
+    const docPath = path.join(fixture.root, '.claude', 'architecture', 'Folder 0', 'Doc_0.md')
+    fs.writeFileSync(docPath, '# Rewritten\n\nBrand new zeppelin section.\n')
+
+    const { changes } = await event
+    expect(changes.map(c => c.path)).toContain('.claude/architecture/Folder 0/Doc_0.md')
+    const index = await catalog.getSearchIndex()
+    expect(index.search('zeppelin').total).toBe(1)
+  })
+})
+
+describe('CatalogWatcher', () => {
+  let fixture: ReturnType<typeof createClaudeFixture>
+
+  beforeEach(() => {
+    fixture = createClaudeFixture({ skills: 1, commands: 1, agents: 1, hooks: 1, architectureDocs: 1, workflows: 1 })
+  })
+
+  afterEach(() => {
+    fixture.cleanup()
+  })
+
+  it('coalesces a burst of events into one batch', async () => {
+    const batches: string[][] = []
+    const watcher = new CatalogWatcher(fixture.root, { onChange: paths => batches.push(paths), debounceMs: 50 })
+    expect(watcher.start()).toBe(true)
+
+    const agentPath = path.join(fixture.root, '.claude', 'agents', 'discovery-agent-0.md')
+    for (let i = 0; i < 5; i++) fs.appendFileSync(agentPath, `\nline ${i}\n`)
+    fs.writeFileSync(path.join(fixture.root, '.claude', 'commands', 'another.md'), '# Another\n')
+
+    await new Promise(resolve => setTimeout(resolve, 300))
+    watcher.close()
+
+    expect(batches).toHaveLength(1)
+    expect(batches[0]).toEqual(expect.arrayContaining(['.claude/agents/discovery-agent-0.md', '.claude/commands/another.md']))
+  })
+
+  it('refuses to start when a source directory is missing', () => {
+    fs.rmSync(path.join(fixture.root, '.claude', 'hooks'), { recursive: true })
+    const watcher = new CatalogWatcher(fixture.root, { onChange: () => {} })
+
+    expect(watcher.start()).toBe(false)
+  })
+})
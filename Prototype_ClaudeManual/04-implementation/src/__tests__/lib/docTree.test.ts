@@ -0,0 +1,199 @@
+// @vitest-environment node
+import fs from 'fs'
+import os from 'os'
+import path from 'path'
+import { describe, it, expect, beforeEach, afterEach } from 'vitest'
+import { NextRequest } from 'next/server'
+import {
+  getTreeVersion,
+  listTreeLevel,
+  matchesETag,
+  resolveTreePath,
+  serveDocTree,
+  toETag,
+  toNDJSONStream,
+  walkTree,
+} from '@/lib/docTree'
+import type { DocTreeNode, DocTreeRoute } from '@/lib/docTree'
+
+function write(root: string, relativePath: string, content = '# Doc\n') {
+  const file = path.join(root, relativePath)
+  fs.mkdirSync(path.dirname(file), { recursive: true })
+  fs.writeFileSync(file, content)
+}
+
+async function collect(iterable: AsyncIterable<DocTreeNode>): Promise<DocTreeNode[]> {
+  const nodes: DocTreeNode[] = []
+  for await (const node of iterable) nodes.push(node)
+  return nodes
+}
+
+describe('docTree', () => {
+  let root: string
+
+  beforeEach(() => {
+    root = fs.mkdtempSync(path.join(os.tmpdir(), 'claudemanual-tree-'))
+    write(root, 'README.md')
+    write(root, 'notes.txt')
+    write(root, 'CC/hooks.md')
+    write(root, 'CC/memory.md')
+    write(root, 'CC/Deep/nested.md')
+    fs.mkdirSync(path.join(root, 'Empty'))
+  })
+
+  afterEach(() => {
+    fs.rmSync(root, { recursive: true, force: true })
+  })
+
+  it('lists one level with child counts', async () => {
+    const { nodes } = await listTreeLevel(root, '')
+
+    expect(nodes).toEqual([
+      { path: 'CC', name: 'CC', type: 'folder', parent: '', childCount: 3 },
+      { path: 'Empty', name: 'Empty', type: 'folder', parent: '', childCount: 0 },
+      { path: 'README.md', name: 'README.md', type: 'file', parent: '' },
+    ])
+
+    const nested = await listTreeLevel(root, 'CC')
+    expect(nested.nodes.map(node => node.path)).toEqual(['CC/Deep', 'CC/hooks.md', 'CC/memory.md'])
+  })
+
+  it('skips folders without markdown anywhere below them when asked', async () => {
+    fs.mkdirSync(path.join(root, 'Hollow/Inner'), { recursive: true })
+    write(root, 'Hollow/Inner/notes.txt')
+    write(root, 'Hollow/Filled/Deeper/doc.md')
+
+    const { nodes } = await listTreeLevel(root, '', { skipEmptyFolders: true })
+    expect(nodes).toEqual([
+      { path: 'CC', name: 'CC', type: 'folder', parent: '', childCount: 3 },
+      { path: 'Hollow', name: 'Hollow', type: 'folder', parent: '', childCount: 1 },
+      { path: 'README.md', name: 'README.md', type: 'file', parent: '' },
+    ])
+    expect((await listTreeLevel(root, 'Hollow', { skipEmptyFolders: true })).nodes.map(node => node.path))
+      .toEqual(['Hollow/Filled'])
+
+    const walked = await collect(walkTree(root, { skipEmptyFolders: true }))
+    expect(walked.filter(node => node.type === 'folder').map(node => [node.path, node.childCount])).toEqual([
+      ['CC', 3],
+      ['CC/Deep', 1],
+      ['Hollow', 1],
+      ['Hollow/Filled', 1],
+      ['Hollow/Filled/Deeper', 1],
+    ])
+  })
+
+  it('changes a pruned level version when a deep folder gains markdown', async () => {
+    fs.mkdirSync(path.join(root, 'Hollow/Inner'), { recursive: true })
+    const before = await listTreeLevel(root, '', { skipEmptyFolders: true })
+    expect(before.nodes.map(node => node.path)).not.toContain('Hollow')
+
+    write(root, 'Hollow/Inner/doc.md')
+    const after = await listTreeLevel(root, '', { skipEmptyFolders: true })
+    expect(after.version).not.toBe(before.version)
+    expect(after.nodes.map(node => node.path)).toContain('Hollow')
+  })
+
+  it('changes the level version only when its listing changes', async () => {
+    const before = await listTreeLevel(root, '')
+    expect((await listTreeLevel(root, '')).version).toBe(before.version)
+
+    write(root, 'CC/added.md')
+    expect((await listTreeLevel(root, '')).version).not.toBe(before.version)
+  })
+
+  it('walks parents before their children', async () => {
+    const nodes = await collect(walkTree(root))
+
+    expect(nodes.map(node => node.path)).toEqual([
+      'CC',
+      'CC/Deep',
+      'CC/Deep/nested.md',
+      'CC/hooks.md',
+      'CC/memory.md',
+      'Empty',
+      'README.md',
+    ])
+    expect(nodes.find(node => node.path === 'CC/Deep/nested.md')?.parent).toBe('CC/Deep')
+  })
+
+  it('tracks the tree version across nested folders', async () => {
+    const before = await getTreeVersion(root)
+    expect(await getTreeVersion(root)).toBe(before)
+
+    write(root, 'CC/Deep/another.md')
+    const after = await getTreeVersion(root)
+    expect(after).not.toBe(before)
+    expect(await getTreeVersion(root)).toBe(after)
+  })
+
+  it('rejects paths outside the tree', () => {
+    expect(resolveTreePath(root, 'CC')).toBe(path.join(root, 'CC'))
+    expect(resolveTreePath(root, '')).toBe(root)
+    expect(resolveTreePath(root, '../elsewhere')).toBeNull()
+  })
+
+  it('matches weak and listed ETags', () => {
+    const etag = toETag('abc', 'tree')
+
+    expect(matchesETag(etag, etag)).toBe(true)
+    expect(matchesETag(`"other", ${etag.replace(/^W\//, '')}`, etag)).toBe(true)
+    expect(matchesETag('*', etag)).toBe(true)
+    expect(matchesETag(toETag('abc', 'ndjson'), etag)).toBe(false)
+    expect(matchesETag(null, etag)).toBe(false)
+  })
+
+  it('streams nodes as NDJSON', async () => {
+    const text = await new Response(toNDJSONStream(walkTree(root))).text()
+    const lines = text.trim().split('\n').map(line => JSON.parse(line))
+
+    expect(lines).toHaveLength(7)
+    expect(lines[0]).toEqual({ path: 'CC', name: 'CC', type: 'folder', parent: '', childCount: 3 })
+  })
+
+  describe('serveDocTree', () => {
+    // The tree is served from its parent directory, as the routes serve theirs from the project root
+    const get = (query: string, headers: Record<string, string> = {}) => {
+      const route: DocTreeRoute<DocTreeNode> = {
+        pathParam: 'treePath',
+        defaultPath: path.basename(root),
+        label: 'docs',
+        toItem: (_basePath, node) => ({ ...node }),
+        toContent: (file, _filePath, content) => ({ path: file, content }),
+      }
+      return serveDocTree(new NextRequest(`http://localhost/api/docs?${query}`, { headers }), path.dirname(root), route)
+    }
+
+    it('serves one folder level with child counts and answers a matching ETag with 304', async () => {
+      const response = await get('parent=')
+      const body = await response.json()
+
+      expect(body.treePath).toBe(path.basename(root))
+      expect(body.items.map((item: DocTreeNode) => [item.path, item.childCount])).toEqual([
+        ['CC', 3],
+        ['Empty', 0],
+        ['README.md', undefined],
+      ])
+      expect((await get('parent=', { 'If-None-Match': response.headers.get('etag')! })).status).toBe(304)
+      expect((await get('parent=../..')).status).toBe(400)
+    })
+
+    it('nests the full listing without per-level fields', async () => {
+      const { items } = await (await get('')).json()
+      const cc = items.find((item: DocTreeNode) => item.path === 'CC')
+
+      expect(cc).not.toHaveProperty('childCount')
+      expect(cc).not.toHaveProperty('parent')
+      expect(cc.children.map((item: DocTreeNode) => item.path)).toEqual(['CC/Deep', 'CC/hooks.md', 'CC/memory.md'])
+    })
+
+    it('streams NDJSON and serves files inside the tree only', async () => {
+      const streamed = await get('format=ndjson')
+      expect(streamed.headers.get('content-type')).toContain('application/x-ndjson')
+      expect((await streamed.text()).trim().split('\n')).toHaveLength(7)
+
+      expect(await (await get('file=CC/hooks.md')).json()).toEqual({ path: 'CC/hooks.md', content: '# Doc\n' })
+      expect((await get('file=../outside.md')).status).toBe(400)
+      expect((await get('file=CC/missing.md')).status).toBe(404)
+    })
+  })
+})
@@ -0,0 +1,94 @@
+// @vitest-environment node
+import fs from 'fs'
+import path from 'path'
+import { Worker } from 'worker_threads'
+import { describe, it, expect, beforeEach, afterEach } from 'vitest'
+import { ingest } from '@/lib/catalog/ingest'
+import type { IngestJob, IngestResult } from '@/lib/catalog/ingest'
+import { ParsePool } from '@/lib/catalog/parsePool'
+import { createClaudeFixture } from '../bench/fixtures'
+
+// Stand-in worker: answers each batch without parsing so the pool can be tested without a TS loader
+const ECHO_WORKER = `
+  import('worker_threads').then(({ parentPort, threadId }) => {
+    parentPort.on('message', jobs => {
+      parentPort.postMessage(jobs.map(job => ({ relativePath: job.relativePath, hash: 'h', parsed: { searchText: String(threadId) } })))
+    })
+  })
+`
+
+function agentJobs(root: string): IngestJob[] {
+  return fs.readdirSync(path.join(root, '.claude', 'agents')).map(name => {
+    const relativePath = `.claude/agents/${name}`
+    return { kind: 'agents' as const, relativePath, file: path.join(root, relativePath) }
+  })
+}
+
+async function collect(jobs: IngestJob[], pool: ParsePool | null, minPoolFiles = 1): Promise<IngestResult[]> {
+  const results: IngestResult[] = []
+  await ingest(jobs, result => results.push(result), { pool, batchSize: 4, minPoolFiles })
+  return results
+}
+
+describe('ingest', () => {
+  let fixture: ReturnType<typeof createClaudeFixture>
+  let pool: ParsePool | null = null
+
+  beforeEach(() => {
+    fixture = createClaudeFixture({ skills: 0, commands: 0, agents: 10, hooks: 0, architectureDocs: 0, workflows: 0 })
+  })
+
+  afterEach(() => {
+    pool?.close()
+    pool = null
+    fixture.cleanup()
+  })
+
+  it('emits one parsed record per file on the main thread', async () => {
+    const jobs = agentJobs(fixture.root)
+    jobs.push({ kind: 'agents', relativePath: '.claude/agents/missing.md', file: path.join(fixture.root, '.claude/agents/missing.md') })
+
+    const results = await collect(jobs, null)
+
+    expect(results).toHaveLength(11)
+    expect(results.find(r => r.relativePath === '.claude/agents/missing.md')).toEqual({ relativePath: '.claude/agents/missing.md', hash: null, parsed: null })
+    const agent = results.find(r => r.relativePath === '.claude/agents/discovery-agent-0.md')!.parsed!
+    expect(agent.record?.id).toBe('discovery-agent-0')
+    expect(agent.searchItem?.type).toBe('Agent')
+  })
+
+  it('skips parsing when the content hash is unchanged', async () => {
+    const [first] = await collect(agentJobs(fixture.root).slice(0, 1), null)
+    const [second] = await collect(agentJobs(fixture.root).slice(0, 1).map(job => ({ ...job, hash: first.hash! })), null)
+
+    expect(second.hash).toBe(first.hash)
+    expect(second.parsed).toBeNull()
+  })
+
+  it('spreads batches across pool workers', async () => {
+    pool = new ParsePool({ size: 2, createWorker: () => new Worker(ECHO_WORKER, { eval: true }) })
+
+    const results = await collect(agentJobs(fixture.root), pool)
+
+    expect(results).toHaveLength(10)
+    expect(new Set(results.map(r => r.parsed?.searchText)).size).toBe(2)
+  })
+
+  it('stays on the main thread for small batches', async () => {
+    pool = new ParsePool({ size: 2, createWorker: () => new Worker(ECHO_WORKER, { eval: true }) })
+
+    const results = await collect(agentJobs(fixture.root), pool, 100)
+
+    expect(results.every(r => r.parsed?.record)).toBe(true)
+  })
+
+  it('falls back to the main thread when workers fail to start', async () => {
+    pool = new ParsePool({ size: 2, createWorker: () => new Worker('throw new Error("boom")', { eval: true }) })
+
+    const results = await collect(agentJobs(fixture.root), pool)
+
+    expect(results).toHaveLength(10)
+    expect(results.every(r => r.parsed?.record)).toBe(true)
+    expect(pool.available).toBe(false)
+  })
+})
@@ -0,0 +1,100 @@
+// @vitest-environment node
+import { describe, it, expect, beforeEach } from 'vitest'
+import { clearMarkdownCache, extractSection, getRenderedMarkdown, renderMarkdown } from '@/lib/markdownHtml'
+
+const DOC = `---
+name: sample
+description: A sample doc
+---
+# Overview
+
+Intro with [a link](https://example.com) and \`inline\` code.
+
+## Setup
+
+\`\`\`ts
+const answer = 42
+\`\`\`
+
+## Diagram
+
+\`\`\`mermaid
+graph TD
+  A-->B
+\`\`\`
+
+### Setup
+
+Nested heading with a repeated name.
+
+## Notes
+
+Closing words.
+`
+
+function html(doc: string): string {
+  return renderMarkdown(doc)!.blocks.map(block => (block.type === 'html' ? block.html : '')).join('')
+}
+
+describe('markdownHtml', () => {
+  beforeEach(() => {
+    clearMarkdownCache()
+  })
+
+  it('separates frontmatter and builds a TOC with unique anchors', () => {
+    const rendered = renderMarkdown(DOC)!
+
+    expect(rendered.frontmatter).toBe('name: sample\ndescription: A sample doc')
+    expect(rendered.toc).toEqual([
+      { level: 1, text: 'Overview', id: 'overview' },
+      { level: 2, text: 'Setup', id: 'setup' },
+      { level: 2, text: 'Diagram', id: 'diagram' },
+      { level: 3, text: 'Setup', id: 'setup-1' },
+      { level: 2, text: 'Notes', id: 'notes' },
+    ])
+    expect(html(DOC)).toContain('<h3 id="setup-1">Setup</h3>')
+  })
+
+  it('highlights code and leaves Mermaid diagrams to the client', () => {
+    const { blocks } = renderMarkdown(DOC)!
+
+    expect(blocks.map(block => block.type)).toEqual(['html', 'mermaid', 'html'])
+    expect(blocks[1]).toEqual({ type: 'mermaid', code: 'graph TD\n  A-->B' })
+    expect(html(DOC)).toContain('<code class="hljs language-ts">')
+    expect(html(DOC)).toContain('data-copy-code')
+  })
+
+  it('drops raw HTML and unsafe URLs', () => {
+    const out = html(
+      '<script>alert(1)</script>\n\nText <img src=x onerror=alert(1)> [bad](javascript:alert(1)) ![img](javascript:alert(2))\n'
+    )
+
+    expect(out).not.toContain('<script')
+    expect(out).not.toContain('onerror')
+    expect(out).not.toContain('javascript:')
+    expect(out).toContain('bad')
+  })
+
+  it('opens external links in a new tab', () => {
+    expect(html('[site](https://example.com)')).toContain(
+      '<a href="https://example.com" target="_blank" rel="noopener noreferrer">site</a>'
+    )
+    expect(html('[local](#setup)')).toContain('<a href="#setup">local</a>')
+  })
+
+  it('returns one section, up to the next heading at its level', () => {
+    expect(extractSection(DOC, 'diagram')).toBe('## Diagram\n\n```mermaid\ngraph TD\n  A-->B\n```\n\n### Setup\n\nNested heading with a repeated name.\n\n')
+    expect(extractSection(DOC, 'missing')).toBeNull()
+
+    const section = renderMarkdown(DOC, 'diagram')!
+    expect(section.toc.map(entry => entry.id)).toEqual(['diagram', 'setup-1'])
+    expect(renderMarkdown(DOC, 'missing')).toBeNull()
+  })
+
+  it('serves repeat renders of the same content from the cache', () => {
+    const first = getRenderedMarkdown(DOC)
+    expect(getRenderedMarkdown(DOC)).toBe(first)
+    expect(getRenderedMarkdown(`${DOC}\nMore.\n`)).not.toBe(first)
+    expect(getRenderedMarkdown(DOC, 'notes')).not.toBe(first)
+  })
+})
@@ -0,0 +1,93 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest'
+
+const { render, initialize } = vi.hoisted(() => ({
+  render: vi.fn(async (id: string, code: string) => ({ svg: `<svg id="${id}">${code}</svg>` })),
+  initialize: vi.fn(),
+}))
+
+vi.mock('mermaid', () => ({ default: { render, initialize } }))
+
+import {
+  SvgLruCache,
+  clearMermaidMemoryCache,
+  diagramKey,
+  instantiateSvg,
+  peekCachedSvg,
+  renderMermaidSvg,
+} from '@/lib/mermaidRenderer'
+
+describe('mermaidRenderer', () => {
+  beforeEach(() => {
+    clearMermaidMemoryCache()
+    render.mockClear()
+    initialize.mockClear()
+  })
+
+  it('keys diagrams by source and theme', () => {
+    expect(diagramKey('graph TD\n  A-->B', 'light')).toBe(diagramKey('  graph TD\n  A-->B\n', 'light'))
+    expect(diagramKey('graph TD\n  A-->B', 'light')).not.toBe(diagramKey('graph TD\n  A-->B', 'dark'))
+    expect(diagramKey('graph TD\n  A-->B', 'light')).not.toBe(diagramKey('graph TD\n  A-->C', 'light'))
+  })
+
+  it('evicts the least recently used SVG', () => {
+    const cache = new SvgLruCache(2)
+    cache.set('a', '<svg>a</svg>')
+    cache.set('b', '<svg>b</svg>')
+    cache.get('a')
+    cache.set('c', '<svg>c</svg>')
+
+    expect(cache.get('b')).toBeUndefined()
+    expect(cache.get('a')).toBe('<svg>a</svg>')
+    expect(cache.size).toBe(2)
+  })
+
+  it('renders each diagram once and serves repeats from memory', async () => {
+    const code = 'graph TD\n  A-->B'
+    const [first, second] = await Promise.all([renderMermaidSvg(code, 'light'), renderMermaidSvg(code, 'light')])
+
+    expect(first).toBe(second)
+    expect(render).toHaveBeenCalledTimes(1)
+    expect(peekCachedSvg(diagramKey(code, 'light'))).toBe(first)
+
+    await renderMermaidSvg(code, 'light')
+    expect(render).toHaveBeenCalledTimes(1)
+  })
+
+  it('re-initializes Mermaid when the theme changes', async () => {
+    await renderMermaidSvg('graph LR\n  X-->Y', 'dark')
+    await renderMermaidSvg('graph LR\n  X-->Z', 'light')
+
+    expect(initialize).toHaveBeenCalledTimes(2)
+    expect(initialize.mock.calls.map(([config]) => config.theme)).toEqual(['dark', 'default'])
+  })
+
+  it('does not cache failed renders', async () => {
+    render.mockRejectedValueOnce(new Error('Parse error'))
+    const code = 'not a diagram'
+
+    await expect(renderMermaidSvg(code, 'light')).rejects.toThrow('Parse error')
+    expect(peekCachedSvg(diagramKey(code, 'light'))).toBeUndefined()
+    await expect(renderMermaidSvg(code, 'light')).resolves.toContain('not a diagram')
+  })
+
+  it('renders with an id derived from the diagram and makes it unique per mount', async () => {
+    const code = 'graph TD\n  A-->B'
+    const key = diagramKey(code, 'light')
+    render.mockResolvedValueOnce({
+      svg: `<svg id="mermaid-${key}"><style>#mermaid-${key} .node{fill:red}</style>` +
+        `<path marker-end="url(#mermaid-${key}_flowchart-pointEnd)"/></svg>`,
+    })
+
+    const svg = await renderMermaidSvg(code, 'light')
+    expect(render.mock.calls[0][0]).toBe(`mermaid-${key}`)
+
+    const first = instantiateSvg(svg, key, 'r1')
+    const second = instantiateSvg(svg, key, 'r2')
+    expect(first).toBe(
+      `<svg id="mermaid-${key}-r1"><style>#mermaid-${key}-r1 .node{fill:red}</style>` +
+        `<path marker-end="url(#mermaid-${key}-r1_flowchart-pointEnd)"/></svg>`
+    )
+    expect(second).toContain(`id="mermaid-${key}-r2"`)
+    expect(second).not.toContain('-r1')
+  })
+})
@@ -0,0 +1,107 @@
+// @vitest-environment node
+import { describe, it, expect, beforeEach } from 'vitest'
+import { SearchIndex, decodeCursor } from '@/lib/search'
+import type { SearchableItem } from '@/lib/catalog'
+
+function item(overrides: Partial<SearchableItem> & Pick<SearchableItem, 'id' | 'name'>): SearchableItem {
+  return {
+    description: '',
+    stage: 'Discovery',
+    path: `.claude/skills/${overrides.id}/SKILL.md`,
+    type: 'Skill',
+    ...overrides,
+  }
+}
+
+describe('SearchIndex', () => {
+  let index: SearchIndex
+
+  beforeEach(() => {
+    index = new SearchIndex()
+    index.add('a', item({ id: 'Discovery_JTBD', name: 'Discovery JTBD', description: 'Extracts jobs to be done from pain points.' }), 'Groups pain points by persona.')
+    index.add('b', item({ id: 'Discovery_Personas', name: 'Discovery Personas', description: 'Builds personas.' }), 'Uses JTBD output to shape personas.')
+    index.add('c', item({ id: 'prototype-builder', name: 'Prototype Builder', description: 'Builds screens.', stage: 'Prototype', type: 'Agent' }), 'Runs after discovery is complete.')
+  })
+
+  it('ranks name matches above body matches', () => {
+    const page = index.search('jtbd')
+
+    expect(page.results.map(r => r.id)).toEqual(['Discovery_JTBD', 'Discovery_Personas'])
+    expect(page.results[0].score).toBe(1)
+    expect(page.results[1].score).toBeLessThan(1)
+  })
+
+  it('ANDs query terms', () => {
+    expect(index.search('discovery personas').results.map(r => r.id)).toEqual(['Discovery_Personas'])
+  })
+
+  it('matches the last term as a prefix', () => {
+    expect(index.search('proto').results.map(r => r.id)).toEqual(['prototype-builder'])
+    expect(index.search('proto ').total).toBe(0)
+  })
+
+  it('falls back to fuzzy matching for typos', () => {
+    const page = index.search('persnas ')
+    expect(page.results[0].id).toBe('Discovery_Personas')
+    expect(index.search('persnas', { types: ['Agent'] }).total).toBe(0)
+  })
+
+  it('searches the full body and returns a snippet around the match', () => {
+    const filler = 'lorem ipsum '.repeat(100)
+    index.add('d', item({ id: 'long-doc', name: 'Long Doc' }), `${filler}the needle is here`)
+
+    const [hit] = index.search('needle').results
+    expect(hit.id).toBe('long-doc')
+    expect(hit.content).toContain('the needle is here')
+
+    const range = hit.highlights.find(h => h.field === 'content')!
+    expect(hit.content!.slice(range.start, range.end)).toBe('needle')
+  })
+
+  it('returns highlight offsets into name and description', () => {
+    const [hit] = index.search('pain').results
+    const description = hit.highlights.find(h => h.field === 'description')!
+    expect(hit.description.slice(description.start, description.end)).toBe('pain')
+  })
+
+  it('paginates with a cursor', () => {
+    const first = index.search('*', { limit: 2 })
+    expect(first.results).toHaveLength(2)
+    expect(first.total).toBe(3)
+    expect(decodeCursor(first.nextCursor)).toBe(2)
+
+    const second = index.search('*', { limit: 2, cursor: first.nextCursor })
+    expect(second.results.map(r => r.id)).toEqual(['prototype-builder'])
+    expect(second.nextCursor).toBeNull()
+  })
+
+  it('filters by type and stage and counts types before the type filter', () => {
+    const page = index.search('builds', { types: ['Agent'] })
+    expect(page.results.map(r => r.id)).toEqual(['prototype-builder'])
+    expect(page.typeCounts).toEqual({ Skill: 1, Agent: 1 })
+
+    expect(index.search('builds', { stages: ['discovery'] }).results.map(r => r.id)).toEqual(['Discovery_Personas'])
+  })
+
+  it('filters by tag before paging and lists the tags of all hits', () => {
+    index.add('d', item({ id: 'tagged-skill', name: 'Zeta Skill', tags: ['team'] }), '')
+    index.add('e', item({ id: 'other-skill', name: 'Omega Skill', tags: ['solo'] }), '')
+
+    const page = index.search('*', { tags: ['team'], taggedIds: ['prototype-builder'], limit: 1 })
+    expect(page.total).toBe(2)
+    expect(page.typeCounts).toEqual({ Skill: 1, Agent: 1 })
+    expect(page.tags).toEqual(['solo', 'team'])
+
+    const next = index.search('*', { tags: ['team'], taggedIds: ['prototype-builder'], limit: 1, cursor: page.nextCursor })
+    expect([...page.results, ...next.results].map(r => r.id)).toEqual(['prototype-builder', 'tagged-skill'])
+  })
+
+  it('drops removed and replaced documents', () => {
+    index.remove('a')
+    expect(index.search('extracts').total).toBe(0)
+
+    index.add('b', item({ id: 'Discovery_Personas', name: 'Discovery Personas', description: 'Renamed.' }), '')
+    expect(index.search('jtbd').total).toBe(0)
+    expect(index.size).toBe(2)
+  })
+})
@@ -0,0 +1,249 @@
+// @vitest-environment node
+import fs from 'fs'
+import os from 'os'
+import path from 'path'
+import { describe, it, expect, beforeEach, afterEach } from 'vitest'
+import { InvalidCursorError, StateStore } from '@/lib/state'
+import { EventLog } from '@/lib/state/eventLog'
+
+function write(root: string, relativePath: string, content: unknown) {
+  const file = path.join(root, relativePath)
+  fs.mkdirSync(path.dirname(file), { recursive: true })
+  fs.writeFileSync(file, typeof content === 'string' ? content : JSON.stringify(content, null, 2))
+}
+
+function jsonl(events: object[]): string {
+  return events.map(event => `${JSON.stringify(event)}\n`).join('')
+}
+
+function hookEvent(minute: number, eventType: string, sessionId = 'session-a', details: string | null = null) {
+  return {
+    timestamp: `2026-02-03T15:${String(minute).padStart(2, '0')}:00.000000`,
+    event_type: eventType,
+    session_id: sessionId,
+    success: true,
+    details,
+  }
+}
+
+describe('EventLog', () => {
+  it('orders events by timestamp even when logs interleave', () => {
+    const log = new EventLog()
+    log.append('_state/logs/a.jsonl', 'a', JSON.stringify(hookEvent(1, 'Stop')))
+    log.append('_state/logs/b.jsonl', 'b', JSON.stringify(hookEvent(3, 'Stop')))
+    log.append('_state/logs/a.jsonl', 'a', JSON.stringify(hookEvent(2, 'Stop')))
+
+    const { items } = log.query({ eventType: 'Stop' })
+    expect(items.map(event => [event.source, event.timestamp])).toEqual([
+      ['b', '2026-02-03T15:03:00.000000'],
+      ['a', '2026-02-03T15:02:00.000000'],
+      ['a', '2026-02-03T15:01:00.000000'],
+    ])
+  })
+
+  it('skips lines that are not JSON objects', () => {
+    const log = new EventLog()
+    expect(log.append('_state/logs/a.jsonl', 'a', 'not json')).toBe(false)
+    expect(log.append('_state/logs/a.jsonl', 'a', '[1, 2]')).toBe(false)
+    expect(log.size).toBe(0)
+  })
+})
+
+describe('StateStore', () => {
+  let root: string
+  let store: StateStore
+
+  beforeEach(() => {
+    root = fs.mkdtempSync(path.join(os.tmpdir(), 'claudemanual-state-'))
+    write(root, '_state/logs/hooks.jsonl', jsonl([
+      hookEvent(0, 'SessionStart'),
+      hookEvent(1, 'PreToolUse', 'session-a', 'tool=Write, target=REQ-001'),
+      hookEvent(2, 'PreToolUse', 'session-b'),
+      hookEvent(3, 'Stop', 'session-b'),
+      hookEvent(4, 'PreToolUse'),
+    ]))
+    write(root, '_state/permission_audit.json', jsonl([
+      { timestamp: '2026-02-03T15:05:00.000000', session_id: 'session-a', is_read_only: true, auto_action: 'allowed' },
+    ]))
+    write(root, '_state/agent_sessions.json', {
+      active_sessions: [
+        { session_id: 'session-3', agent_type: 'prototype-builder', status: 'active', started_at: '2026-02-01T10:00:00' },
+      ],
+      completed_sessions: [
+        { session_id: 'session-1', agent_type: 'discovery-jtbd', status: 'completed', started_at: '2026-01-31T09:00:00' },
+        { session_id: 'session-2', agent_type: 'discovery-jtbd', status: 'completed', started_at: '2026-01-31T10:00:00' },
+      ],
+    })
+    write(root, '_state/call_stack_session-a.json', { session_id: 'session-a', stack: ['orchestrator', 'Explore'] })
+    write(root, 'traceability/pain_point_registry.json', {
+      pain_points: [
+        { id: 'PP-1.1', title: 'Knowledge transfer' },
+        { id: 'PP-1.2', title: 'Missing context' },
+        { id: 'PP-1.3', title: 'Untraced' },
+      ],
+    })
+    write(root, 'traceability/jtbd_registry.json', {
+      jobs: [
+        { id: 'JTBD-1.1', title: 'Self-service learning', pain_points: ['PP-1.1'] },
+        { id: 'JTBD-1.2', title: 'Understand context', pain_points: ['PP-1.2'] },
+      ],
+    })
+    write(root, '_state/requirements_registry.json', {
+      requirements: [
+        { id: 'REQ-001', source_pain_point: 'PP-1.1', source_jtbd: 'JTBD-1.1', screens: ['SCR-001'] },
+        { id: 'REQ-002', source_jtbd: 'JTBD-1.2', screens: [] },
+      ],
+    })
+    write(root, 'traceability/screen_registry.json', { screens: [{ id: 'SCR-001', name: 'Main Explorer View' }] })
+    write(root, 'traceability/trace_links.json', { links: [{ source: 'PP-1.3', target: 'JTBD-1.2' }] })
+    store = new StateStore(root)
+  })
+
+  afterEach(() => {
+    store.unwatch()
+    fs.rmSync(root, { recursive: true, force: true })
+  })
+
+  it('returns events newest first, filtered by session, type, log and artifact', async () => {
+    const all = await store.queryEvents({})
+    expect(all.items).toHaveLength(6)
+    expect(all.items[0].source).toBe('permission_audit')
+
+    const preToolUse = await store.queryEvents({ eventType: 'PreToolUse', sessionId: 'session-a' })
+    expect(preToolUse.items.map(event => event.timestamp)).toEqual([
+      '2026-02-03T15:04:00.000000',
+      '2026-02-03T15:01:00.000000',
+    ])
+
+    expect((await store.queryEvents({ source: 'hooks', sessionId: 'session-b' })).items).toHaveLength(2)
+    expect((await store.queryEvents({ artifactId: 'REQ-001' })).items.map(event => event.eventType)).toEqual(['PreToolUse'])
+    expect((await store.queryEvents({ sessionId: 'nobody' })).items).toEqual([])
+  })
+
+  it('pages with a cursor and honours the time range', async () => {
+    const first = await store.queryEvents({ limit: 4 })
+    const second = await store.queryEvents({ limit: 4, cursor: first.nextCursor! })
+
+    expect(first.items).toHaveLength(4)
+    expect(second.items).toHaveLength(2)
+    expect(second.nextCursor).toBeNull()
+    expect(new Set([...first.items, ...second.items].map(event => event.id)).size).toBe(6)
+
+    const range = await store.queryEvents({ from: '2026-02-03T15:01:00', to: '2026-02-03T15:03:00' })
+    expect(range.items.map(event => event.eventType)).toEqual(['Stop', 'PreToolUse', 'PreToolUse'])
+
+    await expect(store.queryEvents({ cursor: 'not-a-cursor' })).rejects.toThrow(InvalidCursorError)
+  })
+
+  it('tails logs, leaving a partial last line for later', async () => {
+    await store.refresh()
+    const logFile = path.join(root, '_state/logs/hooks.jsonl')
+    const line = JSON.stringify(hookEvent(6, 'Stop', 'session-c'))
+
+    fs.appendFileSync(logFile, line.slice(0, 20))
+    expect((await store.queryEvents({ sessionId: 'session-c' })).items).toHaveLength(0)
+
+    fs.appendFileSync(logFile, `${line.slice(20)}\n`)
+    expect((await store.queryEvents({ sessionId: 'session-c' })).items).toHaveLength(1)
+    expect(store.eventCount).toBe(7)
+  })
+
+  it('re-reads a log that was truncated', async () => {
+    await store.refresh()
+    write(root, '_state/logs/hooks.jsonl', jsonl([hookEvent(9, 'Notification')]))
+
+    const { items } = await store.queryEvents({ source: 'hooks' })
+    expect(items.map(event => event.eventType)).toEqual(['Notification'])
+    expect(store.eventCount).toBe(2)
+  })
+
+  it('re-reads a log rewritten in place, even when it grew', async () => {
+    await store.refresh()
+    const logFile = path.join(root, '_state/logs/hooks.jsonl')
+    const ino = fs.statSync(logFile).ino
+    fs.writeFileSync(logFile, jsonl([0, 1, 2, 3, 4, 5].map(minute => hookEvent(minute, 'Notification', 'session-e'))))
+    expect(fs.statSync(logFile).ino).toBe(ino)
+
+    const { items } = await store.queryEvents({ source: 'hooks' })
+    expect(items).toHaveLength(6)
+    expect(new Set(items.map(event => event.eventType))).toEqual(new Set(['Notification']))
+  })
+
+  it('keeps logs with the same name apart', async () => {
+    write(root, '_state/logs/permission_audit.jsonl', jsonl([
+      { timestamp: '2026-02-03T15:07:00.000000', session_id: 'session-d', auto_action: 'denied' },
+    ]))
+    expect((await store.queryEvents({ source: 'permission_audit' })).items).toHaveLength(2)
+    expect((await store.queryEvents({ file: '_state/logs/permission_audit.jsonl' })).items.map(event => event.sessionId))
+      .toEqual(['session-d'])
+
+    // Truncating one must not drop the other's events
+    write(root, '_state/logs/permission_audit.jsonl', '')
+    const { items } = await store.queryEvents({ source: 'permission_audit' })
+    expect(items.map(event => event.file)).toEqual(['_state/permission_audit.json'])
+  })
+
+  it('lists agent sessions newest first and joins call stacks and events', async () => {
+    const sessions = await store.getSessions()
+    expect(sessions.items.map(session => session.session_id)).toEqual(['session-3', 'session-2', 'session-1'])
+
+    const completed = await store.getSessions({ status: 'completed', limit: 1 })
+    expect(completed.items.map(session => session.session_id)).toEqual(['session-2'])
+    expect((await store.getSessions({ status: 'completed', cursor: completed.nextCursor! })).items.map(session => session.session_id))
+      .toEqual(['session-1'])
+
+    expect(await store.getSession('session-a')).toEqual({
+      sessionId: 'session-a',
+      callStack: ['orchestrator', 'Explore'],
+      agentSession: null,
+      eventCount: 4,
+    })
+  })
+
+  it('traces pain points through jobs and requirements to screens', async () => {
+    const { summary, painPoints } = await store.getCoverage()
+
+    expect(painPoints).toEqual([
+      { id: 'PP-1.1', title: 'Knowledge transfer', jtbd: ['JTBD-1.1'], requirements: ['REQ-001'], screens: ['SCR-001'], covered: true },
+      { id: 'PP-1.2', title: 'Missing context', jtbd: ['JTBD-1.2'], requirements: ['REQ-002'], screens: [], covered: false },
+      { id: 'PP-1.3', title: 'Untraced', jtbd: ['JTBD-1.2'], requirements: ['REQ-002'], screens: [], covered: false },
+    ])
+    expect(summary).toMatchObject({ painPoints: 3, withJtbd: 3, withRequirements: 3, withScreens: 1, coveragePercent: 33.3 })
+  })
+
+  it('recomputes coverage after a registry changes', async () => {
+    const before = await store.getCoverage()
+    expect(await store.getCoverage()).toBe(before)
+
+    write(root, 'traceability/screen_registry.json', {
+      screens: [{ id: 'SCR-001', name: 'Main Explorer View' }, { id: 'SCR-002', name: 'Search', requirements: ['REQ-002'] }],
+    })
+    const after = await store.getCoverage()
+    expect(after.summary.withScreens).toBe(3)
+  })
+
+  it('keeps the registry version when only logs change', async () => {
+    await store.refresh()
+    const versionTag = store.versionTag
+    const registryVersionTag = store.registryVersionTag
+
+    fs.appendFileSync(path.join(root, '_state/logs/hooks.jsonl'), jsonl([hookEvent(7, 'Stop')]))
+    await store.refresh()
+    expect(store.versionTag).not.toBe(versionTag)
+    expect(store.registryVersionTag).toBe(registryVersionTag)
+
+    write(root, 'traceability/trace_links.json', { links: [] })
+    await store.refresh()
+    expect(store.registryVersionTag).not.toBe(registryVersionTag)
+  })
+
+  it('looks up artifacts with their links', async () => {
+    const requirement = await store.getArtifact('REQ-001')
+    expect(requirement?.links).toEqual(['JTBD-1.1', 'PP-1.1', 'SCR-001'])
+    expect(requirement?.source).toBe('_state/requirements_registry.json')
+    expect(await store.getArtifact('REQ-999')).toBeNull()
+
+    const jobs = await store.listArtifacts('jtbd')
+    expect(jobs.items.map(artifact => artifact.id)).toEqual(['JTBD-1.1', 'JTBD-1.2'])
+  })
+})
@@ -0,0 +1,103 @@
+import { describe, it, expect } from 'vitest'
+import {
+  IncrementalMatcher,
+  buildSearchTexts,
+  filterTree,
+  flattenVisibleTree,
+  matchSearchTexts,
+} from '@/lib/treeFilter'
+import type { TreeNode } from '@/types/navigation'
+
+const tree: TreeNode[] = [
+  {
+    id: 'skills',
+    label: 'Skills',
+    type: 'category',
+    count: 2,
+    children: [
+      { id: 'jtbd', label: 'Discovery_JTBD', type: 'skill', stage: 'discovery', description: 'Jobs To Be Done' },
+      { id: 'components', label: 'Prototype_Components', type: 'skill', stage: 'prototype', stages: ['prototype', 'implementation'] },
+    ],
+  },
+  {
+    id: 'agents',
+    label: 'Agents',
+    type: 'category',
+    count: 1,
+    children: [
+      { id: 'personas', label: 'discovery-persona-synthesizer', type: 'agent', stage: 'discovery', path: '.claude/agents/personas.md' },
+    ],
+  },
+]
+
+function search(query: string) {
+  const texts = buildSearchTexts(tree)
+  return filterTree(tree, [], new Set(matchSearchTexts(texts, query)))
+}
+
+describe('treeFilter', () => {
+  it('indexes nodes in depth-first order', () => {
+    const texts = buildSearchTexts(tree)
+
+    expect(texts).toHaveLength(5)
+    expect(texts[1]).toContain('discovery_jtbd')
+    expect(texts[1]).toContain('jobs to be done')
+    expect(texts[4]).toContain('.claude/agents/personas.md')
+  })
+
+  it('returns the same tree when nothing filters it', () => {
+    expect(filterTree(tree, [], null).filtered).toBe(tree)
+  })
+
+  it('keeps matches with their ancestors and expands them', () => {
+    const { filtered, toExpand } = search('DISCOVERY')
+
+    expect(filtered.map(node => node.id)).toEqual(['skills', 'agents'])
+    expect(filtered[0].children!.map(node => node.id)).toEqual(['jtbd'])
+    expect(toExpand.sort()).toEqual(['agents', 'skills'])
+  })
+
+  it('matches descriptions and paths', () => {
+    expect(search('to be done').filtered[0].children!.map(node => node.id)).toEqual(['jtbd'])
+    expect(search('personas.md').filtered.map(node => node.id)).toEqual(['agents'])
+  })
+
+  it('filters by stage and recounts children', () => {
+    const { filtered } = filterTree(tree, ['implementation'], null)
+
+    expect(filtered.map(node => node.id)).toEqual(['skills', 'agents'])
+    expect(filtered[0].children!.map(node => node.id)).toEqual(['components'])
+    expect(filtered[0].count).toBe(1)
+    expect(filtered[1].count).toBe(0)
+  })
+
+  it('combines stage filter and search', () => {
+    const texts = buildSearchTexts(tree)
+    const { filtered } = filterTree(tree, ['prototype'], new Set(matchSearchTexts(texts, 'discovery')))
+
+    expect(filtered).toEqual([])
+  })
+
+  it('narrows the previous matches while the query grows', () => {
+    const texts = buildSearchTexts(tree)
+    const matcher = new IncrementalMatcher()
+    matcher.setTexts(texts)
+
+    expect(matcher.match('dis')).toEqual([1, 4])
+    expect(matcher.match('disc')).toEqual([1, 4])
+    expect(matcher.match('discovery_')).toEqual([1])
+    expect(matcher.match('proto')).toEqual([2])
+  })
+
+  it('flattens only expanded branches', () => {
+    const rows = flattenVisibleTree(tree, new Set(['agents']))
+
+    expect(rows.map(row => [row.node.id, row.level])).toEqual([
+      ['skills', 0],
+      ['agents', 0],
+      ['personas', 1],
+    ])
+    expect(rows[1].isExpanded).toBe(true)
+    expect(rows[0].isExpanded).toBe(false)
+  })
+})
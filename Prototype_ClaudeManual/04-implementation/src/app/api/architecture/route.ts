@@ -1,6 +1,7 @@
-import { NextRequest, NextResponse } from 'next/server';
-import { promises as fs } from 'fs';
+import { NextRequest } from 'next/server';
 import path from 'path';
+import { serveDocTree } from '@/lib/docTree';
+import type { DocTreeNode } from '@/lib/docTree';
 
 // Default architecture path
 const DEFAULT_ARCHITECTURE_PATH = '.claude/architecture';
@@ -18,6 +19,10 @@ interface ArchitectureFile {
   type: 'file' | 'folder';
   category: string;
   children?: ArchitectureFile[];
+  /** Containing folder ('' at the root), in per-folder and streamed listings */
+  parent?: string;
+  /** Folders in per-folder and streamed listings: entries directly inside */
+  childCount?: number;
 }
 
 interface ArchitectureContent {
@@ -48,104 +53,52 @@ function createDisplayName(fileName: string): string {
   return fileName.replace(/\.md$/, '');
 }
 
-// Recursively scan directory for markdown files
-async function scanDirectory(dirPath: string, basePath: string): Promise<ArchitectureFile[]> {
-  const items: ArchitectureFile[] = [];
-
-  try {
-    const entries = await fs.readdir(dirPath, { withFileTypes: true });
-
-    for (const entry of entries) {
-      const fullPath = path.join(dirPath, entry.name);
-      const relativePath = path.relative(basePath, fullPath);
-
-      if (entry.isDirectory()) {
-        const children = await scanDirectory(fullPath, basePath);
-        // Include folders even if empty (they might contain non-md files)
-        const category = getCategoryFromPath(entry.name);
-        items.push({
-          id: relativePath.replace(/[\/\\]/g, '-'),
-          name: entry.name,
-          path: relativePath,
-          type: 'folder',
-          category,
-          children,
-        });
-      } else if (entry.isFile() && entry.name.endsWith('.md')) {
-        const parentFolder = path.basename(path.dirname(fullPath));
-        const category = getCategoryFromPath(parentFolder);
-        items.push({
-          id: relativePath.replace(/[\/\\]/g, '-').replace(/\.md$/, ''),
-          name: createDisplayName(entry.name),
-          path: relativePath,
-          type: 'file',
-          category,
-        });
-      }
-    }
-  } catch (error) {
-    console.error(`Error scanning directory ${dirPath}:`, error);
+function toArchitectureFile(basePath: string, node: DocTreeNode): ArchitectureFile {
+  if (node.type === 'folder') {
+    return {
+      id: node.path.replace(/\//g, '-'),
+      name: node.name,
+      path: node.path,
+      type: 'folder',
+      category: getCategoryFromPath(node.name),
+      parent: node.parent,
+      childCount: node.childCount,
+    };
   }
 
-  return items;
+  const parentFolder = path.basename(path.join(basePath, node.parent));
+  return {
+    id: node.path.replace(/\//g, '-').replace(/\.md$/, ''),
+    name: createDisplayName(node.name),
+    path: node.path,
+    type: 'file',
+    category: getCategoryFromPath(parentFolder),
+    parent: node.parent,
+  };
+}
+
+function toArchitectureContent(file: string, filePath: string, content: string): ArchitectureContent {
+  return {
+    id: file.replace(/[\/\\]/g, '-').replace(/\.md$/, ''),
+    name: createDisplayName(path.basename(file)),
+    path: file,
+    content,
+    category: getCategoryFromPath(path.basename(path.dirname(filePath))),
+  };
 }
 
 // GET /api/architecture - List all architecture docs in hierarchy
+// GET /api/architecture?parent=<folder> - List one folder with child counts (parent= for the root)
+// GET /api/architecture?format=ndjson - Stream the full listing, one flat item per line
 // GET /api/architecture?file=<path> - Get specific file content
+// Listings carry an ETag; a matching If-None-Match returns 304
+// Folders are included even if empty (they might contain non-md files)
 export async function GET(request: NextRequest) {
-  const searchParams = request.nextUrl.searchParams;
-  const fileParam = searchParams.get('file');
-  const customPath = searchParams.get('architecturePath');
-
-  // Resolve architecture path (use custom path or default)
-  const architecturePath = customPath || DEFAULT_ARCHITECTURE_PATH;
-  const projectRoot = getProjectRoot();
-  const absolutePath = path.resolve(projectRoot, architecturePath);
-
-  // If file parameter is provided, return file content
-  if (fileParam) {
-    try {
-      const filePath = path.join(absolutePath, fileParam);
-
-      // Security check: ensure path is within architecture directory
-      const normalizedFilePath = path.normalize(filePath);
-      if (!normalizedFilePath.startsWith(absolutePath)) {
-        return NextResponse.json({ error: 'Invalid file path' }, { status: 400 });
-      }
-
-      const content = await fs.readFile(filePath, 'utf-8');
-      const parentFolder = path.basename(path.dirname(filePath));
-      const category = getCategoryFromPath(parentFolder);
-
-      const result: ArchitectureContent = {
-        id: fileParam.replace(/[\/\\]/g, '-').replace(/\.md$/, ''),
-        name: createDisplayName(path.basename(fileParam)),
-        path: fileParam,
-        content,
-        category,
-      };
-
-      return NextResponse.json(result);
-    } catch (error) {
-      console.error('Error reading file:', error);
-      return NextResponse.json({ error: 'File not found' }, { status: 404 });
-    }
-  }
-
-  // Return hierarchical structure
-  try {
-    const hierarchy = await scanDirectory(absolutePath, absolutePath);
-
-    return NextResponse.json({
-      architecturePath,
-      defaultPath: DEFAULT_ARCHITECTURE_PATH,
-      items: hierarchy,
-    });
-  } catch (error) {
-    console.error('Error scanning architecture:', error);
-    return NextResponse.json({
-      error: 'Failed to scan architecture directory',
-      architecturePath,
-    }, { status: 500 });
-  }
+  return serveDocTree(request, getProjectRoot(), {
+    pathParam: 'architecturePath',
+    defaultPath: DEFAULT_ARCHITECTURE_PATH,
+    label: 'architecture',
+    toItem: toArchitectureFile,
+    toContent: toArchitectureContent,
+  });
 }
@@ -0,0 +1,70 @@
+import { NextRequest } from 'next/server';
+import { getCatalog } from '@/lib/catalog';
+
+export type { CatalogChange, CatalogChangeEvent } from '@/lib/catalog';
+
+export const dynamic = 'force-dynamic';
+export const runtime = 'nodejs';
+
+// Keeps proxies from closing an idle stream
+const HEARTBEAT_MS = 25_000;
+// How long the browser waits before reconnecting
+const RETRY_MS = 3_000;
+
+function formatEvent(event: string, data: unknown): string {
+  return `event: ${event}\ndata: ${JSON.stringify(data)}\n\n`;
+}
+
+// GET /api/events - Server-sent events for changes under .claude/
+//   event: ready   data: { version, watching }   (sent on every (re)connect)
+//   event: change  data: CatalogChangeEvent
+export async function GET(request: NextRequest) {
+  const catalog = getCatalog();
+  catalog.watch();
+  await catalog.refresh();
+
+  const encoder = new TextEncoder();
+  let cleanup = () => {};
+
+  const stream = new ReadableStream<Uint8Array>({
+    start(controller) {
+      const send = (chunk: string) => {
+        try {
+          controller.enqueue(encoder.encode(chunk));
+        } catch {
+          cleanup();
+        }
+      };
+
+      const unsubscribe = catalog.subscribe((event) => send(formatEvent('change', event)));
+      const heartbeat = setInterval(() => send(': heartbeat\n\n'), HEARTBEAT_MS);
+      cleanup = () => {
+        clearInterval(heartbeat);
+        unsubscribe();
+      };
+
+      request.signal.addEventListener('abort', () => {
+        cleanup();
+        try {
+          controller.close();
+        } catch {
+          // Already closed
+        }
+      });
+
+      send(`retry: ${RETRY_MS}\n\n`);
+      send(formatEvent('ready', { version: catalog.currentVersion, watching: catalog.isWatching }));
+    },
+    cancel() {
+      cleanup();
+    },
+  });
+
+  return new Response(stream, {
+    headers: {
+      'Content-Type': 'text/event-stream',
+      'Cache-Control': 'no-cache, no-transform',
+      Connection: 'keep-alive',
+    },
+  });
+}
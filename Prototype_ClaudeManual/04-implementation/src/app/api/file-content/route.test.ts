@@ -0,0 +1,129 @@
+// @vitest-environment node
+import fs from 'fs'
+import os from 'os'
+import path from 'path'
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest'
+import { NextRequest } from 'next/server'
+import { GET } from './route'
+
+const DOC = `---
+name: Demo
+---
+
+# Demo
+
+Intro paragraph.
+
+## Usage
+
+Run it.
+
+## Notes
+
+Nothing else.
+`
+
+// Bytes that are not valid UTF-8, so any decoding on the way would show
+const BINARY = Buffer.from([0xff, 0xfe, 0x00, 0xc3, 0x28, 0x0a, 0x41])
+
+function get(query: string, headers: Record<string, string> = {}) {
+  return GET(new NextRequest(`http://localhost/api/file-content?${query}`, { headers }))
+}
+
+describe('GET /api/file-content', () => {
+  let root: string
+  let docPath: string
+
+  beforeEach(() => {
+    // The route resolves the project root two levels above the working directory
+    root = fs.mkdtempSync(path.join(os.tmpdir(), 'claudemanual-content-'))
+    const cwd = path.join(root, 'Prototype_ClaudeManual', '04-implementation')
+    fs.mkdirSync(cwd, { recursive: true })
+    vi.spyOn(process, 'cwd').mockReturnValue(cwd)
+
+    docPath = path.join(root, '.claude/skills/Demo/SKILL.md')
+    fs.mkdirSync(path.dirname(docPath), { recursive: true })
+    fs.writeFileSync(docPath, DOC)
+    fs.mkdirSync(path.join(root, '.claude/hooks'), { recursive: true })
+    fs.writeFileSync(path.join(root, '.claude/hooks/blob.bin'), BINARY)
+  })
+
+  afterEach(() => {
+    vi.restoreAllMocks()
+    fs.rmSync(root, { recursive: true, force: true })
+  })
+
+  it('answers a repeated request with 304 via If-None-Match or If-Modified-Since', async () => {
+    const first = await get('path=.claude/skills/Demo/SKILL.md')
+    expect(first.status).toBe(200)
+    expect((await first.json()).content).toBe(DOC)
+
+    const etag = first.headers.get('etag')!
+    const lastModified = first.headers.get('last-modified')!
+    expect(etag).toMatch(/^W\//)
+
+    const byETag = await get('path=.claude/skills/Demo/SKILL.md', { 'If-None-Match': etag })
+    expect(byETag.status).toBe(304)
+    expect(byETag.headers.get('etag')).toBe(etag)
+
+    const byDate = await get('path=.claude/skills/Demo/SKILL.md', { 'If-Modified-Since': lastModified })
+    expect(byDate.status).toBe(304)
+  })
+
+  it('returns 200 with a new ETag once the file has been modified', async () => {
+    const first = await get('path=.claude/skills/Demo/SKILL.md')
+    const etag = first.headers.get('etag')!
+    const lastModified = first.headers.get('last-modified')!
+
+    const later = new Date(Date.now() + 60_000)
+    fs.utimesSync(docPath, later, later)
+
+    const byETag = await get('path=.claude/skills/Demo/SKILL.md', { 'If-None-Match': etag })
+    expect(byETag.status).toBe(200)
+    expect(byETag.headers.get('etag')).not.toBe(etag)
+
+    const byDate = await get('path=.claude/skills/Demo/SKILL.md', { 'If-Modified-Since': lastModified })
+    expect(byDate.status).toBe(200)
+  })
+
+  it('keeps ETags apart per format and section', async () => {
+    const json = await get('path=.claude/skills/Demo/SKILL.md')
+    const raw = await get('path=.claude/skills/Demo/SKILL.md&format=raw')
+    const section = await get('path=.claude/skills/Demo/SKILL.md&section=usage')
+
+    expect(new Set([json, raw, section].map(response => response.headers.get('etag'))).size).toBe(3)
+  })
+
+  it('streams raw files byte for byte', async () => {
+    const response = await get('path=.claude/hooks/blob.bin&format=raw')
+
+    expect(response.status).toBe(200)
+    expect(response.headers.get('content-length')).toBe(String(BINARY.length))
+    expect(response.headers.get('content-type')).toBe('text/plain; charset=utf-8')
+    expect(Buffer.from(await response.arrayBuffer())).toEqual(BINARY)
+  })
+
+  it('returns one section of a markdown file', async () => {
+    const json = await (await get('path=.claude/skills/Demo/SKILL.md&section=usage')).json()
+    expect(json.content).toContain('Run it.')
+    expect(json.content).not.toContain('Nothing else.')
+
+    const raw = await get('path=.claude/skills/Demo/SKILL.md&format=raw&section=usage')
+    expect(await raw.text()).toBe(json.content)
+
+    const html = await (await get('path=.claude/skills/Demo/SKILL.md&format=html&section=usage')).json()
+    expect(html.section).toBe('usage')
+    expect(JSON.stringify(html.blocks)).toContain('Run it.')
+  })
+
+  it('returns 404 for a missing section or file', async () => {
+    expect((await get('path=.claude/skills/Demo/SKILL.md&section=missing')).status).toBe(404)
+    expect((await get('path=.claude/skills/Demo/SKILL.md&format=html&section=missing')).status).toBe(404)
+    expect((await get('path=.claude/skills/Demo/OTHER.md')).status).toBe(404)
+  })
+
+  it('rejects unknown formats and rendering non-markdown files', async () => {
+    expect((await get('path=.claude/skills/Demo/SKILL.md&format=pdf')).status).toBe(400)
+    expect((await get('path=.claude/hooks/blob.bin&format=html')).status).toBe(400)
+  })
+})
@@ -1,17 +1,46 @@
 import { NextRequest, NextResponse } from 'next/server';
 import fs from 'fs';
 import path from 'path';
+import { Readable } from 'stream';
+import { matchesETag, toETag } from '@/lib/docTree';
+import { MARKDOWN_RENDER_VERSION, extractSection, getRenderedMarkdown } from '@/lib/markdownHtml';
 
 // Allowed directories for security
 const ALLOWED_DIRS = ['.claude/skills', '.claude/commands', '.claude/agents', '.claude/hooks', '.claude/architecture'];
 
+type ContentFormat = 'json' | 'raw' | 'html';
+const FORMATS: ContentFormat[] = ['json', 'raw', 'html'];
+
+function isNotModified(request: NextRequest, etag: string, stat: fs.Stats): boolean {
+  const ifNoneMatch = request.headers.get('if-none-match');
+  if (ifNoneMatch) return matchesETag(ifNoneMatch, etag);
+
+  // HTTP dates have second precision
+  const ifModifiedSince = Date.parse(request.headers.get('if-modified-since') ?? '');
+  return !Number.isNaN(ifModifiedSince) && Math.floor(stat.mtimeMs / 1000) * 1000 <= ifModifiedSince;
+}
+
+function rawContentType(extension: string): string {
+  return extension === 'md' ? 'text/markdown; charset=utf-8' : 'text/plain; charset=utf-8';
+}
+
+// GET /api/file-content?path=<path> - File content and metadata as JSON
+// GET /api/file-content?path=<path>&format=raw - The file itself, streamed
+// GET /api/file-content?path=<path>&format=html - Markdown rendered to sanitized HTML blocks, with a TOC
+// Add &section=<heading id> to any of these for just that heading's section of a markdown file.
+// Responses carry an ETag and Last-Modified; a matching If-None-Match or If-Modified-Since returns 304
 export async function GET(request: NextRequest) {
   const searchParams = request.nextUrl.searchParams;
   const filePath = searchParams.get('path');
+  const section = searchParams.get('section');
+  const format = (searchParams.get('format') ?? 'json') as ContentFormat;
 
   if (!filePath) {
     return NextResponse.json({ error: 'Missing path parameter' }, { status: 400 });
   }
+  if (!FORMATS.includes(format)) {
+    return NextResponse.json({ error: `Unknown format: ${format}` }, { status: 400 });
+  }
 
   // Security: Validate path is within allowed directories
   const normalizedPath = path.normalize(filePath).replace(/\\/g, '/');
@@ -39,30 +68,84 @@ export async function GET(request: NextRequest) {
       return NextResponse.json({ error: 'Access denied' }, { status: 403 });
     }
 
-    // Check if file exists
-    if (!fs.existsSync(absolutePath)) {
-      return NextResponse.json({ error: 'File not found' }, { status: 404 });
+    let stat: fs.Stats;
+    try {
+      stat = await fs.promises.stat(absolutePath);
+    } catch (error) {
+      if ((error as NodeJS.ErrnoException).code === 'ENOENT') {
+        return NextResponse.json({ error: 'File not found' }, { status: 404 });
+      }
+      throw error;
     }
 
     // Check if it's a file (not directory)
-    const stat = fs.statSync(absolutePath);
     if (!stat.isFile()) {
       return NextResponse.json({ error: 'Not a file' }, { status: 400 });
     }
 
-    // Read and return file content
-    const content = fs.readFileSync(absolutePath, 'utf-8');
     const fileName = path.basename(absolutePath);
     const fileExtension = path.extname(absolutePath).slice(1);
+    if ((format === 'html' || section) && fileExtension !== 'md') {
+      return NextResponse.json({ error: 'Only markdown files can be rendered or split into sections' }, { status: 400 });
+    }
+
+    // Validators come from the stat alone, so an unchanged file is answered without reading it
+    const variant = format === 'html' ? `html${MARKDOWN_RENDER_VERSION}` : format;
+    const etag = toETag(
+      `${stat.size.toString(36)}-${Math.floor(stat.mtimeMs).toString(36)}`,
+      section ? `${variant}-${encodeURIComponent(section)}` : variant
+    );
+    const cacheHeaders = {
+      ETag: etag,
+      'Last-Modified': stat.mtime.toUTCString(),
+      'Cache-Control': 'no-cache',
+    };
+    if (isNotModified(request, etag, stat)) {
+      return new NextResponse(null, { status: 304, headers: cacheHeaders });
+    }
 
-    return NextResponse.json({
+    // Stream the whole file rather than buffering it
+    if (format === 'raw' && !section) {
+      const stream = Readable.toWeb(fs.createReadStream(absolutePath)) as ReadableStream<Uint8Array>;
+      return new NextResponse(stream, {
+        headers: {
+          ...cacheHeaders,
+          'Content-Type': rawContentType(fileExtension),
+          'Content-Length': String(stat.size),
+          'X-Content-Type-Options': 'nosniff',
+        },
+      });
+    }
+
+    const fileContent = await fs.promises.readFile(absolutePath, 'utf-8');
+    const metadata = {
       path: normalizedPath,
       fileName,
       extension: fileExtension,
-      content,
       size: stat.size,
-      modifiedAt: stat.mtime.toISOString()
-    });
+      modifiedAt: stat.mtime.toISOString(),
+    };
+
+    if (format === 'html') {
+      const rendered = getRenderedMarkdown(fileContent, section ?? undefined);
+      if (!rendered) {
+        return NextResponse.json({ error: 'Section not found' }, { status: 404 });
+      }
+      return NextResponse.json({ ...metadata, section, ...rendered }, { headers: cacheHeaders });
+    }
+
+    const content = section ? extractSection(fileContent, section) : fileContent;
+    if (content === null) {
+      return NextResponse.json({ error: 'Section not found' }, { status: 404 });
+    }
+
+    if (format === 'raw') {
+      return new NextResponse(content, {
+        headers: { ...cacheHeaders, 'Content-Type': rawContentType(fileExtension), 'X-Content-Type-Options': 'nosniff' },
+      });
+    }
+
+    return NextResponse.json({ ...metadata, content }, { headers: cacheHeaders });
   } catch (error) {
     console.error('File content error:', error);
     return NextResponse.json({ error: 'Failed to read file' }, { status: 500 });
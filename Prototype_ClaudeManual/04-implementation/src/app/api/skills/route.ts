@@ -1,354 +1,10 @@
 import { NextResponse } from 'next/server';
-import fs from 'fs';
-import path from 'path';
-
-interface SkillContent {
-  purpose: string;
-  example: string;
-  workflow: string;
-}
-
-interface HookEntry {
-  type: string;
-  command: string;
-}
-
-interface HookMatcher {
-  matcher?: string;
-  once?: boolean;
-  hooks: HookEntry[];
-}
-
-interface ParsedHooks {
-  [key: string]: HookMatcher[] | undefined;
-}
-
-interface FrontmatterAttributes {
-  model?: string | null;
-  context?: string | null;
-  agent?: string | null;
-  allowed_tools?: string[];
-  skills_required?: string[];
-  hooks?: ParsedHooks;
-  [key: string]: unknown;
-}
-
-interface Skill {
-  id: string;
-  name: string;
-  type: 'skill';
-  description: string;
-  stage: string;
-  path: string;
-  model: string | null;
-  context: string | null;
-  agent: string | null;
-  allowed_tools: string[];
-  skills_required: string[];
-  frontmatter: FrontmatterAttributes;
-  rawContent: string;
-  content: SkillContent;
-}
-
-function parseHooksSection(frontmatterText: string): ParsedHooks | undefined {
-  const hooksMatch = frontmatterText.match(/^hooks:\s*$/m);
-  if (!hooksMatch) return undefined;
-
-  const startIdx = hooksMatch.index! + hooksMatch[0].length;
-  const lines = frontmatterText.substring(startIdx).split('\n');
-
-  const hooks: ParsedHooks = {};
-  let currentHookType: string | null = null;
-  let currentMatcher: HookMatcher | null = null;
-  let currentHookEntry: Partial<HookEntry> | null = null;
-  let commandLines: string[] = [];
-
-  for (const line of lines) {
-    if (line && !line.startsWith(' ') && !line.startsWith('\t') && line.includes(':')) {
-      break;
-    }
-
-    const trimmed = line.trim();
-    const indent = line.search(/\S/);
-
-    if (indent === 2 && trimmed.endsWith(':') && !trimmed.startsWith('-')) {
-      if (currentHookEntry && currentHookEntry.type && currentMatcher) {
-        if (commandLines.length > 0) {
-          currentHookEntry.command = commandLines.join(' ').trim();
-          commandLines = [];
-        }
-        currentMatcher.hooks.push(currentHookEntry as HookEntry);
-        currentHookEntry = null;
-      }
-      if (currentMatcher && currentHookType) {
-        if (!hooks[currentHookType]) hooks[currentHookType] = [];
-        hooks[currentHookType]!.push(currentMatcher);
-        currentMatcher = null;
-      }
-      currentHookType = trimmed.slice(0, -1);
-      continue;
-    }
-
-    if (trimmed.startsWith('- ') && currentHookType) {
-      if (currentHookEntry && currentHookEntry.type && currentMatcher) {
-        if (commandLines.length > 0) {
-          currentHookEntry.command = commandLines.join(' ').trim();
-          commandLines = [];
-        }
-        currentMatcher.hooks.push(currentHookEntry as HookEntry);
-        currentHookEntry = null;
-      }
-      if (trimmed.startsWith('- matcher:') || trimmed.startsWith('- hooks:')) {
-        if (currentMatcher) {
-          if (!hooks[currentHookType]) hooks[currentHookType] = [];
-          hooks[currentHookType]!.push(currentMatcher);
-        }
-        currentMatcher = { hooks: [] };
-      }
-
-      const content = trimmed.substring(2);
-      if (content.startsWith('matcher:')) {
-        const matcherValue = content.substring(8).trim().replace(/^["']|["']$/g, '');
-        if (currentMatcher) currentMatcher.matcher = matcherValue;
-      } else if (content.startsWith('type:')) {
-        currentHookEntry = { type: content.substring(5).trim() };
-      }
-      continue;
-    }
-
-    if (currentMatcher && indent >= 6) {
-      if (trimmed.startsWith('once:')) {
-        currentMatcher.once = trimmed.substring(5).trim() === 'true';
-      } else if (trimmed === 'hooks:') {
-        // hooks array start
-      } else if (trimmed.startsWith('- type:')) {
-        if (currentHookEntry && currentHookEntry.type) {
-          if (commandLines.length > 0) {
-            currentHookEntry.command = commandLines.join(' ').trim();
-            commandLines = [];
-          }
-          currentMatcher.hooks.push(currentHookEntry as HookEntry);
-        }
-        currentHookEntry = { type: trimmed.substring(7).trim() };
-      } else if (trimmed.startsWith('command:')) {
-        if (currentHookEntry) {
-          const cmdValue = trimmed.substring(8).trim();
-          if (cmdValue.startsWith('>-') || cmdValue.startsWith('>')) {
-            commandLines = [];
-          } else {
-            currentHookEntry.command = cmdValue.replace(/^["']|["']$/g, '');
-          }
-        }
-      } else if (currentHookEntry && !trimmed.startsWith('-') && !trimmed.includes(':')) {
-        commandLines.push(trimmed);
-      }
-    }
-  }
-
-  if (currentHookEntry && currentHookEntry.type && currentMatcher) {
-    if (commandLines.length > 0) {
-      currentHookEntry.command = commandLines.join(' ').trim();
-    }
-    currentMatcher.hooks.push(currentHookEntry as HookEntry);
-  }
-  if (currentMatcher && currentHookType) {
-    if (!hooks[currentHookType]) hooks[currentHookType] = [];
-    hooks[currentHookType]!.push(currentMatcher);
-  }
-
-  return Object.keys(hooks).length > 0 ? hooks : undefined;
-}
-
-function parseYamlFrontmatter(content: string): { frontmatter: Record<string, string>; body: string; hooks: ParsedHooks | undefined } {
-  const frontmatterMatch = content.match(/^---\n([\s\S]*?)\n---\n?([\s\S]*)$/);
-  if (!frontmatterMatch) return { frontmatter: {}, body: content, hooks: undefined };
-
-  const frontmatterText = frontmatterMatch[1];
-  const frontmatter: Record<string, string> = {};
-  const lines = frontmatterText.split('\n');
-  let currentKey = '';
-  let currentValue = '';
-
-  for (const line of lines) {
-    const keyMatch = line.match(/^(\w[\w-]*):(.*)$/);
-    if (keyMatch && !line.trim().endsWith(':')) {
-      if (currentKey) {
-        frontmatter[currentKey] = currentValue.trim();
-      }
-      currentKey = keyMatch[1];
-      currentValue = keyMatch[2].trim();
-    } else if (keyMatch && line.trim().endsWith(':')) {
-      if (currentKey) {
-        frontmatter[currentKey] = currentValue.trim();
-      }
-      currentKey = '';
-      currentValue = '';
-    } else if (currentKey && line.startsWith('  ') && !line.includes('- ')) {
-      currentValue += ' ' + line.trim();
-    }
-  }
-  if (currentKey) {
-    frontmatter[currentKey] = currentValue.trim();
-  }
-
-  const hooks = parseHooksSection(frontmatterText);
-
-  return { frontmatter, body: frontmatterMatch[2] || '', hooks };
-}
-
-function extractSection(body: string, sectionName: string): string {
-  // Look for ## Section Name or ### Section Name
-  const patterns = [
-    new RegExp(`##\\s*${sectionName}[\\s\\S]*?(?=\\n##|$)`, 'i'),
-    new RegExp(`###\\s*${sectionName}[\\s\\S]*?(?=\\n###|\\n##|$)`, 'i'),
-  ];
-
-  for (const pattern of patterns) {
-    const match = body.match(pattern);
-    if (match) {
-      // Remove the header line and return content
-      return match[0].replace(/^##?\s*[^\n]+\n/, '').trim();
-    }
-  }
-  return '';
-}
-
-function extractWhenToUse(body: string): string[] {
-  const section = extractSection(body, 'When to Use(?: This Skill)?');
-  if (!section) return [];
-
-  // Extract bullet points
-  const bullets = section.match(/^[-*]\s+(.+)$/gm);
-  if (bullets) {
-    return bullets.map(b => b.replace(/^[-*]\s+/, '').trim());
-  }
-  return [];
-}
-
-function extractPurpose(body: string, description: string): string {
-  // Try to find first paragraph after the title
-  const titleMatch = body.match(/^#\s+[^\n]+\n\n([^\n#]+)/);
-  if (titleMatch) {
-    return titleMatch[1].trim();
-  }
-  // Fall back to description
-  return description;
-}
-
-function extractWorkflow(body: string): string {
-  // Look for workflow, execution, or process sections
-  const workflowSection = extractSection(body, 'Workflow|Execution|Process|The Method|How It Works');
-  if (workflowSection) {
-    // Limit to reasonable length
-    return workflowSection.substring(0, 500);
-  }
-  return '';
-}
-
-function determineStage(skillName: string): string {
-  const name = skillName.toLowerCase();
-  if (name.startsWith('discovery_') || name.startsWith('discovery-')) return 'Discovery';
-  if (name.startsWith('prototype_') || name.startsWith('prototype-')) return 'Prototype';
-  if (name.startsWith('productspecs_') || name.startsWith('productspecs-')) return 'ProductSpecs';
-  if (name.startsWith('solarch_') || name.startsWith('solarch-') || name.startsWith('solutionarchitecture_')) return 'SolArch';
-  if (name.startsWith('implementation_') || name.startsWith('implementation-')) return 'Implementation';
-  if (name.startsWith('grc_')) return 'GRC';
-  if (name.startsWith('security_')) return 'Security';
-  if (name.startsWith('shared_')) return 'Shared';
-  return 'Utility';
-}
-
-function parseAllowedTools(value: string | undefined): string[] {
-  if (!value) return [];
-  return value.split(',').map(t => t.trim()).filter(Boolean);
-}
-
-function formatSkillName(name: string): string {
-  return name
-    .split(/[-_]/)
-    .map((w: string) => w.charAt(0).toUpperCase() + w.slice(1))
-    .join(' ');
-}
+import { getCatalog } from '@/lib/catalog';
 
 export async function GET() {
   try {
-    // Navigate to project root (.claude folder is at project root)
-    // 04-implementation -> Prototype_ClaudeManual -> claudeManual (2 levels up)
-    const projectRoot = path.resolve(process.cwd(), '../..');
-    const skillsDir = path.join(projectRoot, '.claude', 'skills');
-
-    if (!fs.existsSync(skillsDir)) {
-      console.error('Skills directory not found:', skillsDir);
-      return NextResponse.json([]);
-    }
-
-    const skills: Skill[] = [];
-    const entries = fs.readdirSync(skillsDir, { withFileTypes: true });
-
-    for (const entry of entries) {
-      if (!entry.isDirectory()) continue;
-
-      const skillMdPath = path.join(skillsDir, entry.name, 'SKILL.md');
-      if (!fs.existsSync(skillMdPath)) continue;
-
-      try {
-        const fileContent = fs.readFileSync(skillMdPath, 'utf-8');
-        const { frontmatter, body, hooks } = parseYamlFrontmatter(fileContent);
-
-        const skillId = entry.name;
-        const skillName = frontmatter.name || skillId;
-        const description = (frontmatter.description || '').replace(/^["']|["']$/g, '');
-
-        // Extract content from body
-        const purpose = extractPurpose(body, description);
-        const whenToUse = extractWhenToUse(body);
-        const workflow = extractWorkflow(body);
-
-        // Build example from whenToUse or description
-        const example = whenToUse.length > 0
-          ? `Use when: ${whenToUse.slice(0, 3).join(', ')}`
-          : `Invoke via: /${skillName}`;
-
-        skills.push({
-          id: skillId,
-          name: formatSkillName(skillName),
-          type: 'skill',
-          description: description,
-          stage: determineStage(skillId),
-          path: `.claude/skills/${entry.name}/SKILL.md`,
-          model: frontmatter.model || null,
-          context: frontmatter.context || null,
-          agent: frontmatter.agent || null,
-          allowed_tools: parseAllowedTools(frontmatter['allowed-tools']),
-          skills_required: [],
-          frontmatter: {
-            model: frontmatter.model || null,
-            context: frontmatter.context || null,
-            agent: frontmatter.agent || null,
-            allowed_tools: parseAllowedTools(frontmatter['allowed-tools']),
-            skills_required: [],
-            hooks: hooks,
-          },
-          rawContent: body,
-          content: {
-            purpose: purpose || description,
-            example: example,
-            workflow: workflow || 'See SKILL.md for detailed workflow'
-          }
-        });
-      } catch (err) {
-        console.error(`Error parsing skill ${entry.name}:`, err);
-      }
-    }
-
-    // Sort by stage then name
-    skills.sort((a, b) => {
-      const stageOrder = ['Discovery', 'Prototype', 'ProductSpecs', 'SolArch', 'Implementation', 'GRC', 'Security', 'Shared', 'Utility'];
-      const stageCompare = stageOrder.indexOf(a.stage) - stageOrder.indexOf(b.stage);
-      if (stageCompare !== 0) return stageCompare;
-      return a.name.localeCompare(b.name);
-    });
-
+    // Served from the shared catalog; only files changed since the last request are re-parsed
+    const skills = await getCatalog().getSkills();
     return NextResponse.json(skills);
   } catch (error) {
     console.error('Error loading skills:', error);
@@ -0,0 +1,53 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { matchesETag, toETag } from '@/lib/docTree';
+import { InvalidCursorError, getStateStore } from '@/lib/state';
+
+export const dynamic = 'force-dynamic';
+export const runtime = 'nodejs';
+
+// GET /api/state/events - Events from _state/logs/*.jsonl and permission_audit.json, newest first
+//   ?session=<id>&type=<event_type>&source=<log name>&file=<log path>&artifact=<artifact id> - Filters (combined with AND)
+//   ?from=<ISO time>&to=<ISO time> - Inclusive time range
+//   ?limit=<n>&cursor=<nextCursor> - Paging (limit defaults to 100, at most 1000)
+// Responses carry an ETag; a matching If-None-Match returns 304
+export async function GET(request: NextRequest) {
+  const searchParams = request.nextUrl.searchParams;
+  const param = (name: string) => searchParams.get(name) || undefined;
+
+  const from = param('from');
+  const to = param('to');
+  for (const [name, value] of [['from', from], ['to', to]]) {
+    if (value && Number.isNaN(Date.parse(value))) {
+      return NextResponse.json({ error: `Invalid ${name} timestamp` }, { status: 400 });
+    }
+  }
+
+  try {
+    const store = getStateStore();
+    store.watch();
+    const page = await store.queryEvents({
+      sessionId: param('session'),
+      eventType: param('type'),
+      source: param('source'),
+      file: param('file'),
+      artifactId: param('artifact'),
+      from,
+      to,
+      cursor: param('cursor'),
+      limit: searchParams.has('limit') ? Number(searchParams.get('limit')) : undefined,
+    });
+
+    const etag = toETag(store.versionTag, 'events');
+    const cacheHeaders = { ETag: etag, 'Cache-Control': 'no-cache' };
+    if (matchesETag(request.headers.get('if-none-match'), etag)) {
+      return new NextResponse(null, { status: 304, headers: cacheHeaders });
+    }
+    return NextResponse.json(page, { headers: cacheHeaders });
+  } catch (error) {
+    if (error instanceof InvalidCursorError) {
+      return NextResponse.json({ error: error.message }, { status: 400 });
+    }
+    console.error('Error querying state events:', error);
+    return NextResponse.json({ error: 'Failed to query events' }, { status: 500 });
+  }
+}
@@ -0,0 +1,43 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { matchesETag, toETag } from '@/lib/docTree';
+import { InvalidCursorError, getStateStore } from '@/lib/state';
+
+export const dynamic = 'force-dynamic';
+export const runtime = 'nodejs';
+
+// GET /api/state/sessions - Agent sessions from agent_sessions.json, newest first
+//   ?status=<status>&agent_type=<type> - Filters
+//   ?limit=<n>&cursor=<nextCursor> - Paging (limit defaults to 100, at most 1000)
+// GET /api/state/sessions?session=<id> - Call stack, agent session and event count for one session
+// Responses carry an ETag; a matching If-None-Match returns 304
+export async function GET(request: NextRequest) {
+  const searchParams = request.nextUrl.searchParams;
+  const param = (name: string) => searchParams.get(name) || undefined;
+
+  try {
+    const store = getStateStore();
+    store.watch();
+    const sessionId = param('session');
+    const body = sessionId
+      ? await store.getSession(sessionId)
+      : await store.getSessions({
+          status: param('status'),
+          agentType: param('agent_type'),
+          cursor: param('cursor'),
+          limit: searchParams.has('limit') ? Number(searchParams.get('limit')) : undefined,
+        });
+
+    const etag = toETag(store.versionTag, sessionId ? 'session' : 'sessions');
+    const cacheHeaders = { ETag: etag, 'Cache-Control': 'no-cache' };
+    if (matchesETag(request.headers.get('if-none-match'), etag)) {
+      return new NextResponse(null, { status: 304, headers: cacheHeaders });
+    }
+    return NextResponse.json(body, { headers: cacheHeaders });
+  } catch (error) {
+    if (error instanceof InvalidCursorError) {
+      return NextResponse.json({ error: error.message }, { status: 400 });
+    }
+    console.error('Error querying sessions:', error);
+    return NextResponse.json({ error: 'Failed to query sessions' }, { status: 500 });
+  }
+}
@@ -0,0 +1,52 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { matchesETag, toETag } from '@/lib/docTree';
+import { InvalidCursorError, getStateStore } from '@/lib/state';
+import type { ArtifactType } from '@/lib/state';
+
+export const dynamic = 'force-dynamic';
+export const runtime = 'nodejs';
+
+const ARTIFACT_TYPES: ArtifactType[] = ['pain_point', 'jtbd', 'requirement', 'screen', 'other'];
+
+// GET /api/traceability/artifacts - Registry artifacts sorted by id
+//   ?type=pain_point|jtbd|requirement|screen|other - Filter
+//   ?limit=<n>&cursor=<nextCursor> - Paging (limit defaults to 100, at most 1000)
+// GET /api/traceability/artifacts?id=<artifact id> - One artifact with every id linked to it
+// Responses carry an ETag; a matching If-None-Match returns 304
+export async function GET(request: NextRequest) {
+  const searchParams = request.nextUrl.searchParams;
+  const id = searchParams.get('id');
+  const type = searchParams.get('type') as ArtifactType | null;
+
+  if (type && !ARTIFACT_TYPES.includes(type)) {
+    return NextResponse.json({ error: `Unknown artifact type: ${type}` }, { status: 400 });
+  }
+
+  try {
+    const store = getStateStore();
+    store.watch();
+    const body = id
+      ? await store.getArtifact(id)
+      : await store.listArtifacts(
+          type ?? undefined,
+          searchParams.get('cursor') || undefined,
+          searchParams.has('limit') ? Number(searchParams.get('limit')) : undefined
+        );
+    if (!body) {
+      return NextResponse.json({ error: 'Artifact not found' }, { status: 404 });
+    }
+
+    const etag = toETag(store.registryVersionTag, id ? 'artifact' : 'artifacts');
+    const cacheHeaders = { ETag: etag, 'Cache-Control': 'no-cache' };
+    if (matchesETag(request.headers.get('if-none-match'), etag)) {
+      return new NextResponse(null, { status: 304, headers: cacheHeaders });
+    }
+    return NextResponse.json(body, { headers: cacheHeaders });
+  } catch (error) {
+    if (error instanceof InvalidCursorError) {
+      return NextResponse.json({ error: error.message }, { status: 400 });
+    }
+    console.error('Error querying traceability artifacts:', error);
+    return NextResponse.json({ error: 'Failed to query artifacts' }, { status: 500 });
+  }
+}
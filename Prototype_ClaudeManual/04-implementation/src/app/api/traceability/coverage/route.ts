@@ -0,0 +1,41 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { matchesETag, toETag } from '@/lib/docTree';
+import { InvalidCursorError, getStateStore, offsetPage } from '@/lib/state';
+
+export const dynamic = 'force-dynamic';
+export const runtime = 'nodejs';
+
+// GET /api/traceability/coverage - Pain point -> JTBD -> requirement -> screen coverage
+//   Returns { summary, painPoints: { items, nextCursor } }; the report is computed once per registry change
+//   ?uncovered=1 - Only pain points not yet traced to a screen
+//   ?limit=<n>&cursor=<nextCursor> - Paging of pain points (limit defaults to 100, at most 1000)
+// Responses carry an ETag; a matching If-None-Match returns 304
+export async function GET(request: NextRequest) {
+  const searchParams = request.nextUrl.searchParams;
+
+  try {
+    const store = getStateStore();
+    store.watch();
+    const { summary, painPoints } = await store.getCoverage();
+
+    const etag = toETag(store.registryVersionTag, 'coverage');
+    const cacheHeaders = { ETag: etag, 'Cache-Control': 'no-cache' };
+    if (matchesETag(request.headers.get('if-none-match'), etag)) {
+      return new NextResponse(null, { status: 304, headers: cacheHeaders });
+    }
+
+    const uncovered = searchParams.get('uncovered') === '1';
+    const page = offsetPage(
+      uncovered ? painPoints.filter(entry => !entry.covered) : painPoints,
+      searchParams.get('cursor') || undefined,
+      searchParams.has('limit') ? Number(searchParams.get('limit')) : undefined
+    );
+    return NextResponse.json({ summary, painPoints: page }, { headers: cacheHeaders });
+  } catch (error) {
+    if (error instanceof InvalidCursorError) {
+      return NextResponse.json({ error: error.message }, { status: 400 });
+    }
+    console.error('Error computing traceability coverage:', error);
+    return NextResponse.json({ error: 'Failed to compute coverage' }, { status: 500 });
+  }
+}
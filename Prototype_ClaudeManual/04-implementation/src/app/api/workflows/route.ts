@@ -1,6 +1,7 @@
-import { NextRequest, NextResponse } from 'next/server';
-import { promises as fs } from 'fs';
+import { NextRequest } from 'next/server';
 import path from 'path';
+import { serveDocTree } from '@/lib/docTree';
+import type { DocTreeNode } from '@/lib/docTree';
 
 // Default workflow path (configurable via query param or settings)
 // Note: Use correct case for folder name (Workflows, not workflows)
@@ -19,6 +20,10 @@ interface WorkflowFile {
   type: 'file' | 'folder';
   stage: string;
   children?: WorkflowFile[];
+  /** Containing folder ('' at the root), in per-folder and streamed listings */
+  parent?: string;
+  /** Folders in per-folder and streamed listings: entries directly inside */
+  childCount?: number;
 }
 
 interface WorkflowContent {
@@ -50,105 +55,54 @@ function createDisplayName(stage: string, fileName: string): string {
   return `${stage} - ${baseName}`;
 }
 
-// Recursively scan directory for markdown files
-async function scanDirectory(dirPath: string, basePath: string): Promise<WorkflowFile[]> {
-  const items: WorkflowFile[] = [];
-
-  try {
-    const entries = await fs.readdir(dirPath, { withFileTypes: true });
-
-    for (const entry of entries) {
-      const fullPath = path.join(dirPath, entry.name);
-      const relativePath = path.relative(basePath, fullPath);
-
-      if (entry.isDirectory()) {
-        const children = await scanDirectory(fullPath, basePath);
-        if (children.length > 0) {
-          const stage = getStageFromPath(entry.name);
-          items.push({
-            id: relativePath.replace(/[\/\\]/g, '-'),
-            name: entry.name,
-            path: relativePath,
-            type: 'folder',
-            stage,
-            children,
-          });
-        }
-      } else if (entry.isFile() && entry.name.endsWith('.md')) {
-        const parentFolder = path.basename(path.dirname(fullPath));
-        const stage = getStageFromPath(parentFolder);
-        items.push({
-          id: relativePath.replace(/[\/\\]/g, '-').replace(/\.md$/, ''),
-          name: createDisplayName(stage, entry.name),
-          path: relativePath,
-          type: 'file',
-          stage,
-        });
-      }
-    }
-  } catch (error) {
-    console.error(`Error scanning directory ${dirPath}:`, error);
+function toWorkflowFile(basePath: string, node: DocTreeNode): WorkflowFile {
+  if (node.type === 'folder') {
+    return {
+      id: node.path.replace(/\//g, '-'),
+      name: node.name,
+      path: node.path,
+      type: 'folder',
+      stage: getStageFromPath(node.name),
+      parent: node.parent,
+      childCount: node.childCount,
+    };
   }
 
-  return items;
+  const stage = getStageFromPath(path.basename(path.join(basePath, node.parent)));
+  return {
+    id: node.path.replace(/\//g, '-').replace(/\.md$/, ''),
+    name: createDisplayName(stage, node.name),
+    path: node.path,
+    type: 'file',
+    stage,
+    parent: node.parent,
+  };
+}
+
+function toWorkflowContent(file: string, filePath: string, content: string): WorkflowContent {
+  const stage = getStageFromPath(path.basename(path.dirname(filePath)));
+  return {
+    id: file.replace(/[\/\\]/g, '-').replace(/\.md$/, ''),
+    name: createDisplayName(stage, path.basename(file)),
+    path: file,
+    content,
+    stage,
+  };
 }
 
 // GET /api/workflows - List all workflows in hierarchy
+// GET /api/workflows?parent=<folder> - List one folder with child counts (parent= for the root)
+// GET /api/workflows?format=ndjson - Stream the full listing, one flat item per line
 // GET /api/workflows?file=<path> - Get specific file content
+// Listings carry an ETag; a matching If-None-Match returns 304
+// Every listing leaves out folders without any markdown files below them
 export async function GET(request: NextRequest) {
-  const searchParams = request.nextUrl.searchParams;
-  const fileParam = searchParams.get('file');
-  const customPath = searchParams.get('workflowPath');
-
-  // Resolve workflow path (use custom path or default)
-  const workflowPath = customPath || DEFAULT_WORKFLOW_PATH;
-  const projectRoot = getProjectRoot();
-  const absolutePath = path.resolve(projectRoot, workflowPath);
-
-  // If file parameter is provided, return file content
-  if (fileParam) {
-    try {
-      const filePath = path.join(absolutePath, fileParam);
-
-      // Security check: ensure path is within workflow directory
-      const normalizedFilePath = path.normalize(filePath);
-      if (!normalizedFilePath.startsWith(absolutePath)) {
-        return NextResponse.json({ error: 'Invalid file path' }, { status: 400 });
-      }
-
-      const content = await fs.readFile(filePath, 'utf-8');
-      const parentFolder = path.basename(path.dirname(filePath));
-      const stage = getStageFromPath(parentFolder);
-
-      const result: WorkflowContent = {
-        id: fileParam.replace(/[\/\\]/g, '-').replace(/\.md$/, ''),
-        name: createDisplayName(stage, path.basename(fileParam)),
-        path: fileParam,
-        content,
-        stage,
-      };
-
-      return NextResponse.json(result);
-    } catch (error) {
-      console.error('Error reading file:', error);
-      return NextResponse.json({ error: 'File not found' }, { status: 404 });
-    }
-  }
-
-  // Return hierarchical structure
-  try {
-    const hierarchy = await scanDirectory(absolutePath, absolutePath);
-
-    return NextResponse.json({
-      workflowPath,
-      defaultPath: DEFAULT_WORKFLOW_PATH,
-      items: hierarchy,
-    });
-  } catch (error) {
-    console.error('Error scanning workflows:', error);
-    return NextResponse.json({
-      error: 'Failed to scan workflow directory',
-      workflowPath,
-    }, { status: 500 });
-  }
+  return serveDocTree(request, getProjectRoot(), {
+    pathParam: 'workflowPath',
+    defaultPath: DEFAULT_WORKFLOW_PATH,
+    label: 'workflow',
+    skipEmptyFolders: true,
+    toItem: toWorkflowFile,
+    toContent: toWorkflowContent,
+  });
 }
@@ -12,11 +12,15 @@ interface ArchitectureFile {
   type: 'file' | 'folder';
   category: string;
   children?: ArchitectureFile[];
+  parent?: string;
+  /** Folders: entries directly inside, shown as a count; 0 means nothing to expand */
+  childCount?: number;
 }
 
-interface ArchitectureHierarchy {
+interface ArchitectureLevel {
   architecturePath: string;
   defaultPath: string;
+  parent: string;
   items: ArchitectureFile[];
 }
 
@@ -38,11 +42,10 @@ const categoryColors: Record<string, string> = {
   'To Be Solved': 'bg-yellow-500',
 };
 
-async function fetchArchitectureHierarchy(architecturePath?: string): Promise<ArchitectureHierarchy> {
-  const url = architecturePath
-    ? `/api/architecture?architecturePath=${encodeURIComponent(architecturePath)}`
-    : '/api/architecture';
-  const response = await fetch(url);
+// Folders are listed one level at a time, when they are first expanded
+async function fetchArchitectureLevel(architecturePath: string, parent: string): Promise<ArchitectureLevel> {
+  const params = new URLSearchParams({ architecturePath, parent });
+  const response = await fetch(`/api/architecture?${params}`);
   if (!response.ok) throw new Error('Failed to load architecture');
   return response.json();
 }
@@ -56,6 +59,7 @@ async function fetchArchitectureContent(filePath: string): Promise<ArchitectureC
 // Recursive tree component
 function ArchitectureTree({
   items,
+  architecturePath,
   expandedFolders,
   onToggleFolder,
   onSelectFile,
@@ -63,6 +67,7 @@ function ArchitectureTree({
   level = 0,
 }: {
   items: ArchitectureFile[];
+  architecturePath: string;
   expandedFolders: Set<string>;
   onToggleFolder: (path: string) => void;
   onSelectFile: (item: ArchitectureFile) => void;
@@ -75,14 +80,20 @@ function ArchitectureTree({
         <li key={item.id}>
           {item.type === 'folder' ? (
             <div>
+              {/* Empty folders (childCount 0) have nothing to expand */}
               <button
                 onClick={() => onToggleFolder(item.path)}
-                className="flex items-center gap-2 w-full text-left px-2 py-1.5 rounded hover:bg-surface-2"
+                disabled={item.childCount === 0}
+                aria-expanded={item.childCount === 0 ? undefined : expandedFolders.has(item.path)}
+                className="flex items-center gap-2 w-full text-left px-2 py-1.5 rounded hover:bg-surface-2 disabled:cursor-default"
               >
                 <span className="text-sm">
                   {expandedFolders.has(item.path) ? '📂' : '📁'}
                 </span>
                 <span className="font-medium">{item.name}</span>
+                {item.childCount !== undefined && (
+                  <span className="text-xs text-secondary">{item.childCount}</span>
+                )}
                 {item.category && categoryColors[item.category] && (
                   <span
                     className={`text-xs px-1.5 py-0.5 rounded text-white ${categoryColors[item.category]}`}
@@ -91,9 +102,10 @@ function ArchitectureTree({
                   </span>
                 )}
               </button>
-              {expandedFolders.has(item.path) && item.children && (
-                <ArchitectureTree
-                  items={item.children}
+              {expandedFolders.has(item.path) && (
+                <ArchitectureFolder
+                  folder={item.path}
+                  architecturePath={architecturePath}
                   expandedFolders={expandedFolders}
                   onToggleFolder={onToggleFolder}
                   onSelectFile={onSelectFile}
@@ -119,6 +131,34 @@ function ArchitectureTree({
   );
 }
 
+// Children of an expanded folder, fetched on first expand
+function ArchitectureFolder({
+  folder,
+  architecturePath,
+  ...treeProps
+}: {
+  folder: string;
+  architecturePath: string;
+  expandedFolders: Set<string>;
+  onToggleFolder: (path: string) => void;
+  onSelectFile: (item: ArchitectureFile) => void;
+  selectedFilePath: string | null;
+  level: number;
+}) {
+  const { data, isLoading, error } = useQuery({
+    queryKey: ['architecture-hierarchy', architecturePath, folder],
+    queryFn: () => fetchArchitectureLevel(architecturePath, folder),
+  });
+
+  if (isLoading) {
+    return <p className="ml-6 px-2 py-1 text-xs text-secondary">Loading...</p>;
+  }
+  if (error || !data) {
+    return <p className="ml-6 px-2 py-1 text-xs text-red-500">Failed to load folder</p>;
+  }
+  return <ArchitectureTree items={data.items} architecturePath={architecturePath} {...treeProps} />;
+}
+
 export default function ArchitectureViewerPage() {
   const [selectedFile, setSelectedFile] = useState<ArchitectureFile | null>(null);
   const [expandedFolders, setExpandedFolders] = useState<Set<string>>(new Set());
@@ -135,14 +175,14 @@ export default function ArchitectureViewerPage() {
     }
   }, []);
 
-  // Fetch architecture hierarchy
+  // Fetch top-level architecture entries
   const {
     data: hierarchy,
     isLoading: hierarchyLoading,
     error: hierarchyError,
   } = useQuery({
-    queryKey: ['architecture-hierarchy', architecturePath],
-    queryFn: () => fetchArchitectureHierarchy(architecturePath),
+    queryKey: ['architecture-hierarchy', architecturePath, ''],
+    queryFn: () => fetchArchitectureLevel(architecturePath, ''),
   });
 
   // Fetch selected file content
@@ -172,25 +212,6 @@ export default function ArchitectureViewerPage() {
     setSelectedFile(item);
   };
 
-  // Expand all folders by default on first load
-  useEffect(() => {
-    if (hierarchy?.items && expandedFolders.size === 0) {
-      const allFolderPaths = new Set<string>();
-      const collectFolders = (items: ArchitectureFile[]) => {
-        for (const item of items) {
-          if (item.type === 'folder') {
-            allFolderPaths.add(item.path);
-            if (item.children) {
-              collectFolders(item.children);
-            }
-          }
-        }
-      };
-      collectFolders(hierarchy.items);
-      setExpandedFolders(allFolderPaths);
-    }
-  }, [hierarchy]);
-
   if (hierarchyLoading) {
     return (
       <div className="min-h-screen bg-background text-foreground flex items-center justify-center">
@@ -236,6 +257,7 @@ export default function ArchitectureViewerPage() {
           {hierarchy?.items && hierarchy.items.length > 0 ? (
             <ArchitectureTree
               items={hierarchy.items}
+              architecturePath={architecturePath}
               expandedFolders={expandedFolders}
               onToggleFolder={handleToggleFolder}
               onSelectFile={handleSelectFile}
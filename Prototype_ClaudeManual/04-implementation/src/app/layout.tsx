@@ -4,6 +4,7 @@ import { QueryProvider } from '@/providers/QueryProvider'
 import { ThemeProvider } from '@/providers/ThemeProvider'
 import { Navigation } from '@/components/Navigation'
 import { KeyboardShortcuts } from '@/components/KeyboardShortcuts'
+import { FileSystemWatcher } from '@/components/FileSystemWatcher'
 import '@/styles/globals.css'
 
 const inter = Inter({
@@ -36,6 +37,7 @@ export default function RootLayout({
         <ThemeProvider>
           <QueryProvider>
             <KeyboardShortcuts />
+            <FileSystemWatcher />
             <Navigation />
             {children}
           </QueryProvider>
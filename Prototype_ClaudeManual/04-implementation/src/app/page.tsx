@@ -7,7 +7,8 @@ import { NavigationTree } from '@/components/NavigationTree';
 import { DetailPane } from '@/components/DetailPane';
 import { StageFilterDropdown } from '@/components/StageFilterDropdown';
 import { ResizableSidebar } from '@/components/ResizableSidebar';
-import { getComponentStages, getPreferences, toggleFavorite } from '@/lib/localStorage';
+import { getPreferences, toggleFavorite } from '@/lib/localStorage';
+import type { Stage } from '@/types';
 
 interface FrontmatterAttributes {
   model?: string | null;
@@ -49,8 +50,8 @@ interface TreeNode {
 }
 
 // Helper to get effective stages for a component (custom if set, otherwise original)
-function getEffectiveStages(id: string, originalStage: string): string[] {
-  const customStages = getComponentStages(id);
+function getEffectiveStages(id: string, originalStage: string, componentStages: Record<string, Stage[]>): string[] {
+  const customStages = componentStages[id] || [];
   if (customStages.length > 0) {
     // Custom stages are stored as enum values (e.g., "Discovery"), convert to lowercase
     return customStages.map(s => s.toLowerCase());
@@ -58,7 +59,9 @@ function getEffectiveStages(id: string, originalStage: string): string[] {
   return [originalStage.toLowerCase()];
 }
 
+// Custom stages are read from storage once per transform, not once per item (PF-003)
 function transformToTreeNodes(skills: FrameworkItem[], commands: FrameworkItem[], agents: FrameworkItem[]): TreeNode[] {
+  const componentStages = getPreferences().component_stages;
   return [
     {
       id: 'skills',
@@ -66,7 +69,7 @@ function transformToTreeNodes(skills: FrameworkItem[], commands: FrameworkItem[]
       type: 'category' as const,
       count: skills.length,
       children: skills.map(s => {
-        const stages = getEffectiveStages(s.id, s.stage);
+        const stages = getEffectiveStages(s.id, s.stage, componentStages);
         return {
           id: s.id,
           label: s.name,
@@ -84,7 +87,7 @@ function transformToTreeNodes(skills: FrameworkItem[], commands: FrameworkItem[]
       type: 'category' as const,
       count: commands.length,
       children: commands.map(c => {
-        const stages = getEffectiveStages(c.id, c.stage);
+        const stages = getEffectiveStages(c.id, c.stage, componentStages);
         return {
           id: c.id,
           label: c.name,
@@ -102,7 +105,7 @@ function transformToTreeNodes(skills: FrameworkItem[], commands: FrameworkItem[]
       type: 'category' as const,
       count: agents.length,
       children: agents.map(a => {
-        const stages = getEffectiveStages(a.id, a.stage);
+        const stages = getEffectiveStages(a.id, a.stage, componentStages);
         return {
           id: a.id,
           label: a.name,
@@ -211,17 +214,18 @@ export default function Home() {
   }, []);
 
   // Combine all items (flat)
-  const allItems = [
+  const allItems = useMemo(() => [
     ...(skills || []),
     ...(commands || []),
     ...(agents || []),
-  ];
+  ], [skills, commands, agents]);
+  const itemsById = useMemo(() => new Map(allItems.map((item) => [item.id, item])), [allItems]);
 
   // Load last viewed item from sessionStorage
   useEffect(() => {
     const lastViewed = sessionStorage.getItem('last_viewed');
     if (lastViewed && allItems.length > 0) {
-      const item = allItems.find((i) => i.id === lastViewed);
+      const item = itemsById.get(lastViewed);
       if (item) setSelectedItem(item);
     }
   }, [allItems.length]);
@@ -233,9 +237,10 @@ export default function Home() {
     }
   }, [selectedItem]);
 
-  const handleItemSelect = (item: FrameworkItem) => {
-    setSelectedItem(item);
-  };
+  const handleTreeSelect = useCallback((itemId: string) => {
+    const item = itemsById.get(itemId);
+    if (item) setSelectedItem(item);
+  }, [itemsById]);
 
   const handleStageChange = (stages: string[]) => {
     setSelectedStages(stages);
@@ -266,7 +271,7 @@ export default function Home() {
   }
 
   return (
-    <div className="min-h-screen bg-background text-foreground flex flex-col">
+    <div className="h-screen bg-background text-foreground flex flex-col">
       {/* Header - sticky with high z-index */}
       <header className="border-b border-border px-4 py-3 flex items-center gap-4 bg-background sticky top-0 z-30">
         <div className="flex-shrink-0">
@@ -312,7 +317,7 @@ export default function Home() {
       </header>
 
       {/* Main dual-pane layout */}
-      <div className="flex-1 flex overflow-hidden relative">
+      <div className="flex-1 min-h-0 flex overflow-hidden relative">
         {/* Navigation Tree (Sidebar) */}
         <ResizableSidebar
           storageKey="main-sidebar-width"
@@ -358,14 +363,11 @@ export default function Home() {
               )}
             </div>
 
-            {/* Tree content - scrollable */}
-            <div className="flex-1 overflow-y-auto">
+            {/* Tree content - the tree scrolls itself so it can window its rows */}
+            <div className="flex-1 min-h-0">
               <NavigationTree
                 items={treeNodes as any}
-                onSelect={(itemId: string) => {
-                  const item = allItems.find(i => i.id === itemId);
-                  if (item) handleItemSelect(item);
-                }}
+                onSelect={handleTreeSelect}
                 stageFilter={selectedStages as any}
                 searchQuery={sidebarFilter}
                 favorites={favoriteIds}
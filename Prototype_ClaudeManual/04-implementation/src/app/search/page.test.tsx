@@ -3,13 +3,14 @@ import { render, screen, waitFor } from '@testing-library/react';
 import { userEvent } from '@testing-library/user-event';
 import SearchPage from './page';
 import { QueryClient, QueryClientProvider } from '@tanstack/react-query';
+import { addComponentTag } from '@/lib/localStorage';
 
 // Mock components
 vi.mock('@/components/SearchResultCard', () => ({
-  SearchResultCard: ({ item }: any) => (
-    <div data-testid={`result-${item.id}`}>
-      <h3>{item.name}</h3>
-      <p>{item.description}</p>
+  SearchResultCard: ({ result }: any) => (
+    <div data-testid={`result-${result.id}`}>
+      <h3>{result.name}</h3>
+      <p>{result.summary}</p>
     </div>
   ),
 }));
@@ -64,7 +65,13 @@ describe('SearchPage (T-018)', () => {
       if (url.includes('/api/search')) {
         return Promise.resolve({
           ok: true,
-          json: () => Promise.resolve(mockSearchResults),
+          json: () => Promise.resolve({
+            results: mockSearchResults,
+            total: mockSearchResults.length,
+            nextCursor: null,
+            typeCounts: { Skill: mockSearchResults.length },
+            tags: [],
+          }),
         });
       }
       return Promise.reject(new Error('Unknown endpoint'));
@@ -140,7 +147,7 @@ describe('SearchPage (T-018)', () => {
     global.fetch = vi.fn(() =>
       Promise.resolve({
         ok: true,
-        json: () => Promise.resolve([]),
+        json: () => Promise.resolve({ results: [], total: 0, nextCursor: null, typeCounts: {}, tags: [] }),
       })
     );
 
@@ -157,6 +164,52 @@ describe('SearchPage (T-018)', () => {
     });
   });
 
+  it('filters by tag on the server, so a match beyond the first page is found', async () => {
+    // Unfiltered, the tagged item would only arrive on the second page of 50
+    const untagged = Array.from({ length: 50 }, (_, i) => ({ ...mockSearchResults[1], id: `Untagged_${i}` }));
+    const tagged = { ...mockSearchResults[0], tags: ['team'] };
+    global.fetch = vi.fn((url: string) => {
+      const params = new URL(url, 'http://localhost').searchParams;
+      const page = params.get('tag') === 'team'
+        ? { results: [tagged], total: 1, nextCursor: null, typeCounts: { Skill: 1 }, tags: ['team'] }
+        : { results: untagged, total: 51, nextCursor: 'NTA', typeCounts: { Skill: 51 }, tags: ['team'] };
+      return Promise.resolve({ ok: true, json: () => Promise.resolve(page) });
+    });
+
+    const mockSearchParams = new URLSearchParams('?q=*&tag=team');
+    vi.mock('next/navigation', () => ({
+      useSearchParams: () => mockSearchParams,
+      useRouter: () => ({ push: vi.fn() }),
+    }));
+
+    renderWithClient(<SearchPage />);
+
+    await waitFor(() => {
+      expect(screen.getByTestId('result-Discovery_JTBD')).toBeInTheDocument();
+      expect(screen.getByText(/1 result /i)).toBeInTheDocument();
+    });
+    expect(global.fetch).toHaveBeenCalledWith(expect.stringContaining('tag=team'));
+    expect(screen.queryByText(/no components match/i)).not.toBeInTheDocument();
+  });
+
+  it('sends the ids of components carrying a selected user tag', async () => {
+    localStorage.clear();
+    addComponentTag('Discovery_GeneratePersona', 'mine');
+
+    const mockSearchParams = new URLSearchParams('?q=*&tag=mine');
+    vi.mock('next/navigation', () => ({
+      useSearchParams: () => mockSearchParams,
+      useRouter: () => ({ push: vi.fn() }),
+    }));
+
+    renderWithClient(<SearchPage />);
+
+    await waitFor(() => {
+      expect(global.fetch).toHaveBeenCalledWith(expect.stringContaining('tagged=Discovery_GeneratePersona'));
+    });
+    localStorage.clear();
+  });
+
   it('shows loading state while fetching', () => {
     global.fetch = vi.fn(() => new Promise(() => {})); // Never resolves
 
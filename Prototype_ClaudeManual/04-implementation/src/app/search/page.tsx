@@ -1,15 +1,16 @@
 'use client';
 
-import { useState, useEffect, useMemo } from 'react';
+import { useState, useEffect, useMemo, useCallback, memo } from 'react';
 import { useSearchParams, useRouter } from 'next/navigation';
-import { useQuery } from '@tanstack/react-query';
+import { useInfiniteQuery } from '@tanstack/react-query';
 import { SearchResultCard } from '@/components/SearchResultCard';
+import type { SearchResultHighlight } from '@/components/SearchResultCard';
 import { StageFilterDropdown } from '@/components/StageFilterDropdown';
 import { TagFilter } from '@/components/TagFilter';
 import { TypeFilter, ItemType } from '@/components/TypeFilter';
 import { FileContentModal } from '@/components/FileContentModal';
 import { AllTagsPanel, TagWithCount } from '@/components/AllTagsPanel';
-import { getAllUserTags, getComponentTags, getPreferences } from '@/lib/localStorage';
+import { getAllUserTags, getPreferences } from '@/lib/localStorage';
 import Link from 'next/link';
 
 interface SearchResult {
@@ -22,10 +23,34 @@ interface SearchResult {
   tags?: string[];
   content?: string;
   score?: number;
+  highlights?: SearchResultHighlight[];
 }
 
-async function fetchSearchResults(query: string): Promise<SearchResult[]> {
-  const response = await fetch(`/api/search?q=${encodeURIComponent(query)}`);
+interface SearchResultsPage {
+  results: SearchResult[];
+  total: number;
+  nextCursor: string | null;
+  typeCounts: Partial<Record<ItemType, number>>;
+  tags: string[];
+}
+
+const PAGE_SIZE = 50;
+
+async function fetchSearchResults(
+  query: string,
+  cursor: string | null,
+  stages: string[],
+  types: ItemType[],
+  tags: string[],
+  taggedIds: string[]
+): Promise<SearchResultsPage> {
+  const params = new URLSearchParams({ q: query, limit: String(PAGE_SIZE) });
+  if (cursor) params.set('cursor', cursor);
+  if (stages.length > 0) params.set('stage', stages.join(','));
+  if (types.length > 0) params.set('type', types.join(','));
+  if (tags.length > 0) params.set('tag', tags.join(','));
+  if (taggedIds.length > 0) params.set('tagged', taggedIds.join(','));
+  const response = await fetch(`/api/search?${params.toString()}`);
   if (!response.ok) throw new Error('Search failed');
   return response.json();
 }
@@ -43,29 +68,53 @@ function groupResultsByType(results: SearchResult[]): Record<string, SearchResul
   return groups;
 }
 
-// Get counts per type
-function getTypeCounts(results: SearchResult[]): Partial<Record<ItemType, number>> {
-  const counts: Partial<Record<ItemType, number>> = {};
-  for (const result of results) {
-    const type = result.type as ItemType;
-    counts[type] = (counts[type] || 0) + 1;
-  }
-  return counts;
+function copyPath(path: string) {
+  navigator.clipboard.writeText(path);
 }
 
-// Extract unique tags from results
-function extractTags(results: SearchResult[]): string[] {
-  const tagSet = new Set<string>();
-  for (const result of results) {
-    if (result.tags) {
-      for (const tag of result.tags) {
-        tagSet.add(tag);
-      }
-    }
-  }
-  return Array.from(tagSet).sort();
+function ignoreFavoriteToggle() {
+  // Favorite functionality
 }
 
+// One result. Memoized so typing in the search box does not re-render loaded results;
+// content-visibility lets the browser skip layout and paint for rows scrolled out of view.
+const SearchResultRow = memo(function SearchResultRow({
+  result,
+  query,
+  onOpen,
+}: {
+  result: SearchResult;
+  query: string;
+  onOpen: (result: SearchResult) => void;
+}) {
+  return (
+    <div
+      className="p-4 hover:bg-gray-50 dark:hover:bg-gray-800 transition-colors"
+      style={{ contentVisibility: 'auto', containIntrinsicSize: 'auto 120px' }}
+    >
+      <SearchResultCard
+        result={{
+          id: result.id,
+          name: result.name,
+          type: result.type.toLowerCase() as 'skill' | 'command' | 'agent' | 'rule' | 'hook',
+          stage: (result.stage?.toLowerCase() || 'discovery') as any,
+          path: result.path || '',
+          relevanceScore: result.score || 0,
+          summary: result.description || '',
+          content: result.content,
+          tags: result.tags,
+          isFavorite: false,
+          highlights: result.highlights,
+        }}
+        query={query}
+        onClick={() => onOpen(result)}
+        onCopyPath={copyPath}
+        onToggleFavorite={ignoreFavoriteToggle}
+      />
+    </div>
+  );
+});
+
 // Type ordering for display
 const TYPE_ORDER: ItemType[] = ['Skill', 'Command', 'Agent', 'Hook', 'Workflow', 'Architecture'];
 
@@ -77,7 +126,10 @@ export default function SearchPage() {
 
   const [selectedStages, setSelectedStages] = useState<string[]>([]);
   const [selectedTypes, setSelectedTypes] = useState<ItemType[]>([]);
-  const [selectedTags, setSelectedTags] = useState<string[]>([]);
+  // Start with the URL's tags so the first request is already filtered
+  const [selectedTags, setSelectedTags] = useState<string[]>(() =>
+    tagParam.split(',').map((t) => t.trim()).filter(Boolean)
+  );
   const [userTags, setUserTags] = useState<string[]>([]);
   const [allTagsWithCounts, setAllTagsWithCounts] = useState<TagWithCount[]>([]);
   const [expandedSections, setExpandedSections] = useState<Set<string>>(new Set(TYPE_ORDER));
@@ -142,75 +194,57 @@ export default function SearchPage() {
     setSelectedTags([]);
   };
 
+  // Components carrying a selected user tag; user tags live in localStorage, so the server is told the ids
+  const taggedIds = useMemo(() => {
+    if (selectedTags.length === 0) return [];
+    return Object.entries(getPreferences().component_tags)
+      .filter(([, tags]) => tags.some((tag) => selectedTags.includes(tag)))
+      .map(([id]) => id)
+      .sort();
+  }, [selectedTags]);
+
+  // Stage, type and tag filters are applied server-side, before paging; pages are fetched on demand
   const {
-    data: results,
+    data,
     isLoading,
     error,
-  } = useQuery({
-    queryKey: ['search', query],
-    queryFn: () => fetchSearchResults(query),
+    hasNextPage,
+    fetchNextPage,
+    isFetchingNextPage,
+  } = useInfiniteQuery({
+    queryKey: ['search', query, selectedStages, selectedTypes, selectedTags, taggedIds],
+    queryFn: ({ pageParam }) =>
+      fetchSearchResults(query, pageParam, selectedStages, selectedTypes, selectedTags, taggedIds),
+    initialPageParam: null as string | null,
+    getNextPageParam: (lastPage) => lastPage.nextCursor,
     enabled: !!query,
   });
 
+  const results = useMemo(() => data?.pages.flatMap((page) => page.results), [data]);
+  const totalResults = data?.pages[0]?.total ?? 0;
+
   const executionTime = isLoading ? 0 : ((Date.now() - startTime) / 1000).toFixed(2);
 
-  // Add user tags to results
+  // Add user tags to results (read from storage once, not once per result)
   const resultsWithUserTags = useMemo(() => {
+    const componentTags = getPreferences().component_tags;
     return (results || []).map((result) => ({
       ...result,
-      tags: [...(result.tags || []), ...getComponentTags(result.id)],
+      tags: [...(result.tags || []), ...(componentTags[result.id] || [])],
     }));
   }, [results]);
 
-  // Filter results
-  const filteredResults = useMemo(() => {
-    let filtered = resultsWithUserTags;
-
-    // Filter by stage
-    if (selectedStages.length > 0) {
-      filtered = filtered.filter((result) =>
-        selectedStages.includes(result.stage.toLowerCase())
-      );
-    }
-
-    // Filter by type
-    if (selectedTypes.length > 0) {
-      filtered = filtered.filter((result) =>
-        selectedTypes.includes(result.type)
-      );
-    }
-
-    // Filter by tags
-    if (selectedTags.length > 0) {
-      filtered = filtered.filter((result) =>
-        result.tags && selectedTags.some((tag) => result.tags!.includes(tag))
-      );
-    }
-
-    return filtered;
-  }, [resultsWithUserTags, selectedStages, selectedTypes, selectedTags]);
+  // Group results by type
+  const groupedResults = useMemo(() => groupResultsByType(resultsWithUserTags), [resultsWithUserTags]);
 
-  // Group filtered results
-  const groupedResults = useMemo(() => groupResultsByType(filteredResults), [filteredResults]);
+  // Type counts (before type filter applied) come from the server
+  const typeCounts = data?.pages[0]?.typeCounts ?? {};
 
-  // Type counts (before type filter applied)
-  const typeCounts = useMemo(() => {
-    let results = resultsWithUserTags;
-    // Apply stage and tag filters but not type filter for counts
-    if (selectedStages.length > 0) {
-      results = results.filter((r) => selectedStages.includes(r.stage.toLowerCase()));
-    }
-    if (selectedTags.length > 0) {
-      results = results.filter((r) => r.tags && selectedTags.some((tag) => r.tags!.includes(tag)));
-    }
-    return getTypeCounts(results);
-  }, [resultsWithUserTags, selectedStages, selectedTags]);
-
-  // Available tags from filtered results
+  // Tags of every hit, not just the loaded pages, plus the user's own tags
   const availableTags = useMemo(() => {
-    const fromResults = extractTags(filteredResults);
+    const fromResults = data?.pages[0]?.tags ?? [];
     return [...new Set([...fromResults, ...userTags])].sort();
-  }, [filteredResults, userTags]);
+  }, [data, userTags]);
 
   // Toggle section expansion
   const toggleSection = (type: string) => {
@@ -226,9 +260,9 @@ export default function SearchPage() {
   };
 
   // Handle result click - open modal
-  const handleResultClick = (result: SearchResult) => {
+  const handleResultClick = useCallback((result: SearchResult) => {
     setSelectedFilePath(result.path);
-  };
+  }, []);
 
   // Handle modal close
   const handleModalClose = () => {
@@ -368,7 +402,7 @@ export default function SearchPage() {
             </form>
 
             <p className="text-gray-600 text-sm flex-shrink-0">
-              {filteredResults.length} result{filteredResults.length !== 1 ? 's' : ''}
+              {totalResults} result{totalResults !== 1 ? 's' : ''}
               {query === '*' ? ' (all components)' : ''} in {executionTime}s
             </p>
           </div>
@@ -422,7 +456,7 @@ export default function SearchPage() {
       {/* Results */}
       <main className="flex-1 px-4 py-6">
         <div className="max-w-6xl mx-auto">
-          {filteredResults.length === 0 ? (
+          {resultsWithUserTags.length === 0 ? (
             <div className="text-center py-12">
               <p className="text-gray-600 text-lg mb-4">
                 {query === '*'
@@ -477,41 +511,30 @@ export default function SearchPage() {
                     {isExpanded && (
                       <div className="divide-y divide-border">
                         {typeResults.map((result) => (
-                          <div key={result.id} className="p-4 hover:bg-gray-50 dark:hover:bg-gray-800 transition-colors">
-                            <SearchResultCard
-                              result={{
-                                id: result.id,
-                                name: result.name,
-                                type: result.type.toLowerCase() as 'skill' | 'command' | 'agent' | 'rule' | 'hook',
-                                stage: (result.stage?.toLowerCase() || 'discovery') as any,
-                                path: result.path || '',
-                                relevanceScore: result.score || 0,
-                                summary: result.description || '',
-                                tags: result.tags,
-                                isFavorite: false,
-                              }}
-                              query={query}
-                              onClick={() => handleResultClick(result)}
-                              onCopyPath={(path) => {
-                                navigator.clipboard.writeText(path);
-                              }}
-                              onToggleFavorite={() => {
-                                // Favorite functionality
-                              }}
-                            />
-                            {/* Show content preview if available */}
-                            {result.content && (
-                              <div className="mt-2 ml-12 text-sm text-gray-600 line-clamp-2">
-                                {result.content.slice(0, 200)}...
-                              </div>
-                            )}
-                          </div>
+                          <SearchResultRow
+                            key={result.id}
+                            result={result}
+                            query={query}
+                            onOpen={handleResultClick}
+                          />
                         ))}
                       </div>
                     )}
                   </section>
                 );
               })}
+
+              {hasNextPage && (
+                <div className="text-center">
+                  <button
+                    onClick={() => fetchNextPage()}
+                    disabled={isFetchingNextPage}
+                    className="px-4 py-2 text-blue-600 border border-border rounded-lg hover:bg-gray-50 disabled:opacity-50"
+                  >
+                    {isFetchingNextPage ? 'Loading...' : `Load more (${resultsWithUserTags.length} of ${totalResults} shown)`}
+                  </button>
+                </div>
+              )}
             </div>
           )}
         </div>
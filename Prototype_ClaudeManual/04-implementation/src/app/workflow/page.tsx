@@ -12,11 +12,15 @@ interface WorkflowFile {
   type: 'file' | 'folder';
   stage: string;
   children?: WorkflowFile[];
+  parent?: string;
+  /** Folders: entries directly inside, shown as a count; 0 means nothing to expand */
+  childCount?: number;
 }
 
-interface WorkflowHierarchy {
+interface WorkflowLevel {
   workflowPath: string;
   defaultPath: string;
+  parent: string;
   items: WorkflowFile[];
 }
 
@@ -38,11 +42,10 @@ const stageColors: Record<string, string> = {
   ChangeManagement: 'bg-gray-500',
 };
 
-async function fetchWorkflowHierarchy(workflowPath?: string): Promise<WorkflowHierarchy> {
-  const url = workflowPath
-    ? `/api/workflows?workflowPath=${encodeURIComponent(workflowPath)}`
-    : '/api/workflows';
-  const response = await fetch(url);
+// Folders are listed one level at a time, when they are first expanded
+async function fetchWorkflowLevel(workflowPath: string, parent: string): Promise<WorkflowLevel> {
+  const params = new URLSearchParams({ workflowPath, parent });
+  const response = await fetch(`/api/workflows?${params}`);
   if (!response.ok) throw new Error('Failed to load workflows');
   return response.json();
 }
@@ -56,6 +59,7 @@ async function fetchWorkflowContent(filePath: string): Promise<WorkflowContent>
 // Recursive tree component
 function WorkflowTree({
   items,
+  workflowPath,
   expandedFolders,
   onToggleFolder,
   onSelectFile,
@@ -63,6 +67,7 @@ function WorkflowTree({
   level = 0,
 }: {
   items: WorkflowFile[];
+  workflowPath: string;
   expandedFolders: Set<string>;
   onToggleFolder: (path: string) => void;
   onSelectFile: (item: WorkflowFile) => void;
@@ -75,23 +80,30 @@ function WorkflowTree({
         <li key={item.id}>
           {item.type === 'folder' ? (
             <div>
+              {/* Empty folders (childCount 0) have nothing to expand */}
               <button
                 onClick={() => onToggleFolder(item.path)}
-                className="flex items-center gap-2 w-full text-left px-2 py-1.5 rounded hover:bg-surface-2"
+                disabled={item.childCount === 0}
+                aria-expanded={item.childCount === 0 ? undefined : expandedFolders.has(item.path)}
+                className="flex items-center gap-2 w-full text-left px-2 py-1.5 rounded hover:bg-surface-2 disabled:cursor-default"
               >
                 <span className="text-sm">
                   {expandedFolders.has(item.path) ? '📂' : '📁'}
                 </span>
                 <span className="font-medium">{item.name}</span>
+                {item.childCount !== undefined && (
+                  <span className="text-xs text-secondary">{item.childCount}</span>
+                )}
                 <span
                   className={`text-xs px-1.5 py-0.5 rounded text-white ${stageColors[item.stage] || 'bg-gray-400'}`}
                 >
                   {item.stage}
                 </span>
               </button>
-              {expandedFolders.has(item.path) && item.children && (
-                <WorkflowTree
-                  items={item.children}
+              {expandedFolders.has(item.path) && (
+                <WorkflowFolder
+                  folder={item.path}
+                  workflowPath={workflowPath}
                   expandedFolders={expandedFolders}
                   onToggleFolder={onToggleFolder}
                   onSelectFile={onSelectFile}
@@ -117,6 +129,34 @@ function WorkflowTree({
   );
 }
 
+// Children of an expanded folder, fetched on first expand
+function WorkflowFolder({
+  folder,
+  workflowPath,
+  ...treeProps
+}: {
+  folder: string;
+  workflowPath: string;
+  expandedFolders: Set<string>;
+  onToggleFolder: (path: string) => void;
+  onSelectFile: (item: WorkflowFile) => void;
+  selectedFilePath: string | null;
+  level: number;
+}) {
+  const { data, isLoading, error } = useQuery({
+    queryKey: ['workflow-hierarchy', workflowPath, folder],
+    queryFn: () => fetchWorkflowLevel(workflowPath, folder),
+  });
+
+  if (isLoading) {
+    return <p className="ml-6 px-2 py-1 text-xs text-secondary">Loading...</p>;
+  }
+  if (error || !data) {
+    return <p className="ml-6 px-2 py-1 text-xs text-red-500">Failed to load folder</p>;
+  }
+  return <WorkflowTree items={data.items} workflowPath={workflowPath} {...treeProps} />;
+}
+
 export default function WorkflowViewerPage() {
   const [selectedFile, setSelectedFile] = useState<WorkflowFile | null>(null);
   const [expandedFolders, setExpandedFolders] = useState<Set<string>>(new Set());
@@ -133,14 +173,14 @@ export default function WorkflowViewerPage() {
     }
   }, []);
 
-  // Fetch workflow hierarchy
+  // Fetch top-level workflow entries
   const {
     data: hierarchy,
     isLoading: hierarchyLoading,
     error: hierarchyError,
   } = useQuery({
-    queryKey: ['workflow-hierarchy', workflowPath],
-    queryFn: () => fetchWorkflowHierarchy(workflowPath),
+    queryKey: ['workflow-hierarchy', workflowPath, ''],
+    queryFn: () => fetchWorkflowLevel(workflowPath, ''),
   });
 
   // Fetch selected file content
@@ -170,25 +210,6 @@ export default function WorkflowViewerPage() {
     setSelectedFile(item);
   };
 
-  // Expand all folders by default on first load
-  useEffect(() => {
-    if (hierarchy?.items && expandedFolders.size === 0) {
-      const allFolderPaths = new Set<string>();
-      const collectFolders = (items: WorkflowFile[]) => {
-        for (const item of items) {
-          if (item.type === 'folder') {
-            allFolderPaths.add(item.path);
-            if (item.children) {
-              collectFolders(item.children);
-            }
-          }
-        }
-      };
-      collectFolders(hierarchy.items);
-      setExpandedFolders(allFolderPaths);
-    }
-  }, [hierarchy]);
-
   if (hierarchyLoading) {
     return (
       <div className="min-h-screen bg-background text-foreground flex items-center justify-center">
@@ -234,6 +255,7 @@ export default function WorkflowViewerPage() {
           {hierarchy?.items && hierarchy.items.length > 0 ? (
             <WorkflowTree
               items={hierarchy.items}
+              workflowPath={workflowPath}
               expandedFolders={expandedFolders}
               onToggleFolder={handleToggleFolder}
               onSelectFile={handleSelectFile}
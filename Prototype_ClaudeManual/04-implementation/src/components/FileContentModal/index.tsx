@@ -2,7 +2,9 @@
 
 import React, { useEffect, useRef, useState } from 'react';
 import { createPortal } from 'react-dom';
-import { MarkdownRenderer } from '../MarkdownRenderer';
+import { MermaidDiagram } from '../MermaidDiagram';
+import type { RenderedBlock, TocEntry } from '@/lib/markdownHtml';
+import 'highlight.js/styles/github.css';
 
 export interface FileContentModalProps {
   /** File path to display */
@@ -15,21 +17,29 @@ interface FileContent {
   path: string;
   fileName: string;
   extension: string;
-  content: string;
   size: number;
   modifiedAt: string;
+  /** Other files: the file as text */
+  content?: string;
+  /** Markdown files: rendered on the server */
+  frontmatter?: string | null;
+  blocks?: RenderedBlock[];
+  toc?: TocEntry[];
 }
 
-// Extract frontmatter and body from markdown content
-function extractFrontmatter(content: string): { frontmatter: string | null; body: string } {
-  const match = content.match(/^---\n([\s\S]*?)\n---\n?([\s\S]*)$/);
-  if (match) {
-    return {
-      frontmatter: match[1].trim(),
-      body: match[2].trim()
-    };
+// Markdown arrives rendered (and revalidated by ETag), so opening a large doc does no parsing here
+function contentUrl(filePath: string): string {
+  const format = filePath.endsWith('.md') ? '&format=html' : '';
+  return `/api/file-content?path=${encodeURIComponent(filePath)}${format}`;
+}
+
+// Copy buttons in rendered code blocks share one click handler
+function handleCodeCopy(e: React.MouseEvent) {
+  const button = (e.target as HTMLElement).closest('[data-copy-code]');
+  const code = button?.parentElement?.querySelector('code')?.textContent;
+  if (code) {
+    navigator.clipboard.writeText(code);
   }
-  return { frontmatter: null, body: content };
 }
 
 export function FileContentModal({ filePath, onClose }: FileContentModalProps) {
@@ -50,7 +60,7 @@ export function FileContentModal({ filePath, onClose }: FileContentModalProps) {
       setLoading(true);
       setError(null);
       try {
-        const response = await fetch(`/api/file-content?path=${encodeURIComponent(filePath)}`);
+        const response = await fetch(contentUrl(filePath));
         if (!response.ok) {
           const data = await response.json();
           throw new Error(data.error || 'Failed to load file');
@@ -236,35 +246,59 @@ export function FileContentModal({ filePath, onClose }: FileContentModalProps) {
 
           {!loading && !error && fileContent && (
             <div className="prose dark:prose-invert max-w-none">
-              {fileContent.extension === 'md' ? (
-                (() => {
-                  const { frontmatter, body } = extractFrontmatter(fileContent.content);
-                  return (
-                    <>
-                      {frontmatter && (
-                        <div className="mb-6">
-                          <div className="flex items-center gap-2 mb-2">
-                            <span className="text-xs font-semibold uppercase tracking-wider text-secondary">Frontmatter</span>
-                            <span className="text-xs bg-blue-100 dark:bg-blue-900 text-blue-800 dark:text-blue-200 px-2 py-0.5 rounded">YAML</span>
-                          </div>
-                          <pre className="bg-gray-900 dark:bg-gray-950 p-4 rounded-lg overflow-auto border border-gray-700">
-                            <code className="text-sm text-gray-100 font-mono">{frontmatter}</code>
-                          </pre>
-                        </div>
-                      )}
-                      {body && (
-                        <div>
-                          {frontmatter && (
-                            <div className="flex items-center gap-2 mb-2">
-                              <span className="text-xs font-semibold uppercase tracking-wider text-secondary">Content</span>
-                            </div>
-                          )}
-                          <MarkdownRenderer content={body} />
+              {fileContent.blocks ? (
+                <>
+                  {fileContent.frontmatter && (
+                    <div className="mb-6">
+                      <div className="flex items-center gap-2 mb-2">
+                        <span className="text-xs font-semibold uppercase tracking-wider text-secondary">Frontmatter</span>
+                        <span className="text-xs bg-blue-100 dark:bg-blue-900 text-blue-800 dark:text-blue-200 px-2 py-0.5 rounded">YAML</span>
+                      </div>
+                      <pre className="bg-gray-900 dark:bg-gray-950 p-4 rounded-lg overflow-auto border border-gray-700">
+                        <code className="text-sm text-gray-100 font-mono">{fileContent.frontmatter}</code>
+                      </pre>
+                    </div>
+                  )}
+                  {fileContent.toc && fileContent.toc.length > 1 && (
+                    <nav aria-label="Table of contents" className="mb-6">
+                      <span className="text-xs font-semibold uppercase tracking-wider text-secondary">Contents</span>
+                      <ul className="mt-2 space-y-1 text-sm">
+                        {fileContent.toc.map((entry) => (
+                          <li key={entry.id} style={{ paddingLeft: `${(entry.level - 1) * 0.75}rem` }}>
+                            <a
+                              href={`#${entry.id}`}
+                              onClick={(e) => {
+                                e.preventDefault();
+                                document.getElementById(entry.id)?.scrollIntoView({ behavior: 'smooth' });
+                              }}
+                              className="text-blue-600 hover:text-blue-800 hover:underline"
+                            >
+                              {entry.text}
+                            </a>
+                          </li>
+                        ))}
+                      </ul>
+                    </nav>
+                  )}
+                  {fileContent.blocks.length > 0 && (
+                    <div>
+                      {fileContent.frontmatter && (
+                        <div className="flex items-center gap-2 mb-2">
+                          <span className="text-xs font-semibold uppercase tracking-wider text-secondary">Content</span>
                         </div>
                       )}
-                    </>
-                  );
-                })()
+                      <div className="markdown-html" onClick={handleCodeCopy}>
+                        {fileContent.blocks.map((block, index) =>
+                          block.type === 'mermaid' ? (
+                            <MermaidDiagram key={index} code={block.code} />
+                          ) : (
+                            <div key={index} dangerouslySetInnerHTML={{ __html: block.html }} />
+                          )
+                        )}
+                      </div>
+                    </div>
+                  )}
+                </>
               ) : fileContent.extension === 'py' ? (
                 <pre className="bg-gray-900 dark:bg-gray-950 p-4 rounded-lg overflow-auto border border-gray-700">
                   <code className="text-sm text-gray-100 font-mono">{fileContent.content}</code>
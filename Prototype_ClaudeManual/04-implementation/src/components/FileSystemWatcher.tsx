@@ -0,0 +1,8 @@
+'use client';
+
+import { useFileSystemWatcher } from '@/hooks/useFileSystemWatcher';
+
+export function FileSystemWatcher() {
+  useFileSystemWatcher();
+  return null; // This component only keeps the live-reload stream open
+}
@@ -1,6 +1,8 @@
 'use client';
 
-import React, { useEffect, useRef, useState } from 'react';
+import React, { useEffect, useId, useMemo, useRef, useState } from 'react';
+import { diagramKey, instantiateSvg, peekCachedSvg, renderMermaidSvg } from '@/lib/mermaidRenderer';
+import { useInView } from '@/hooks/useInView';
 
 export interface MermaidDiagramProps {
   /** Mermaid diagram code */
@@ -9,73 +11,57 @@ export interface MermaidDiagramProps {
   theme?: 'light' | 'dark';
 }
 
-// Flag to track if mermaid has been initialized
-let mermaidInitialized = false;
-
 export const MermaidDiagram: React.FC<MermaidDiagramProps> = ({
   code,
   theme = 'light',
 }) => {
   const containerRef = useRef<HTMLDivElement>(null);
-  const [svg, setSvg] = useState<string>('');
+  // useId contains characters that are not valid in the CSS id selectors Mermaid emits
+  const instanceId = useId().replace(/[^a-zA-Z0-9_-]/g, '');
+  const source = code.trim();
+  const key = useMemo(() => diagramKey(source, theme), [source, theme]);
+  // Diagrams seen before (e.g. when a doc is reopened) show immediately
+  const [rendered, setRendered] = useState<{ key: string; svg: string } | null>(() => {
+    const svg = peekCachedSvg(key);
+    return svg === undefined ? null : { key, svg };
+  });
   const [error, setError] = useState<string | null>(null);
-  const [isLoading, setIsLoading] = useState(true);
-
-  useEffect(() => {
-    const renderDiagram = async () => {
-      if (!code.trim()) {
-        setError('No diagram code provided');
-        setIsLoading(false);
-        return;
-      }
+  // Only lay out diagrams that are about to scroll into view
+  const isVisible = useInView(containerRef);
 
-      try {
-        setIsLoading(true);
-        setError(null);
-
-        // Dynamically import mermaid only when needed
-        const mermaid = (await import('mermaid')).default;
-
-        // Initialize mermaid only once
-        if (!mermaidInitialized) {
-          mermaid.initialize({
-            startOnLoad: false,
-            theme: theme === 'dark' ? 'dark' : 'default',
-            securityLevel: 'loose',
-            fontFamily: 'system-ui, -apple-system, sans-serif',
-            suppressErrorRendering: true,
-          });
-          mermaidInitialized = true;
-        }
+  const svg = rendered?.key === key ? rendered.svg : peekCachedSvg(key);
+  const html = useMemo(
+    () => (svg === undefined ? undefined : instantiateSvg(svg, key, instanceId)),
+    [svg, key, instanceId]
+  );
 
-        // Generate unique ID for this diagram
-        const id = `mermaid-${Math.random().toString(36).substring(2, 11)}`;
+  useEffect(() => {
+    if (!source) {
+      setError('No diagram code provided');
+      return;
+    }
+    setError(null);
+    if (svg !== undefined || !isVisible) return;
 
-        // Render the diagram
-        const { svg: renderedSvg } = await mermaid.render(id, code.trim());
-        setSvg(renderedSvg);
-      } catch (err) {
+    let cancelled = false;
+    renderMermaidSvg(source, theme)
+      .then((renderedSvg) => {
+        if (!cancelled) setRendered({ key, svg: renderedSvg });
+      })
+      .catch((err) => {
+        if (cancelled) return;
         console.error('Mermaid rendering error:', err);
         setError(err instanceof Error ? err.message : 'Failed to render diagram');
-      } finally {
-        setIsLoading(false);
-      }
-    };
-
-    renderDiagram();
-  }, [code, theme]);
+      });
 
-  if (isLoading) {
-    return (
-      <div className="my-4 p-4 bg-gray-50 rounded-lg border border-gray-200 text-center">
-        <div className="animate-pulse text-gray-500">Rendering diagram...</div>
-      </div>
-    );
-  }
+    return () => {
+      cancelled = true;
+    };
+  }, [source, theme, key, svg, isVisible]);
 
   if (error) {
     return (
-      <div className="my-4">
+      <div ref={containerRef} className="mermaid-diagram my-4">
         <div className="p-3 bg-red-50 border border-red-200 rounded-t-lg text-red-600 text-sm">
           Failed to render Mermaid diagram: {error}
         </div>
@@ -86,11 +72,22 @@ export const MermaidDiagram: React.FC<MermaidDiagramProps> = ({
     );
   }
 
+  if (html === undefined) {
+    return (
+      <div
+        ref={containerRef}
+        className="mermaid-diagram my-4 p-4 bg-gray-50 rounded-lg border border-gray-200 text-center"
+      >
+        <div className="animate-pulse text-gray-500">Rendering diagram...</div>
+      </div>
+    );
+  }
+
   return (
     <div
       ref={containerRef}
-      className="my-4 p-4 bg-white rounded-lg border border-gray-200 overflow-x-auto"
-      dangerouslySetInnerHTML={{ __html: svg }}
+      className="mermaid-diagram my-4 p-4 bg-white rounded-lg border border-gray-200 overflow-x-auto"
+      dangerouslySetInnerHTML={{ __html: html }}
     />
   );
 };
@@ -1,10 +1,17 @@
 import React, { useState, useMemo, useCallback, useEffect } from 'react';
-import type { NavigationTreeProps, TreeNode, Stage } from '../../types/navigation';
+import type { NavigationTreeProps, Stage } from '../../types/navigation';
+import { buildSearchTexts, filterTree, flattenVisibleTree } from '../../lib/treeFilter';
+import { useTreeSearch } from '../../hooks/useTreeSearch';
+import { useVirtualWindow } from '../../hooks/useVirtualWindow';
+
+// Rows have a fixed height so only the ones in view are rendered
+const ROW_HEIGHT = 36;
+const NO_STAGES: Stage[] = [];
 
 export function NavigationTree({
   items,
   selectedId,
-  stageFilter = [],
+  stageFilter = NO_STAGES,
   searchQuery = '',
   showCountBadges = false,
   favorites = [],
@@ -15,86 +22,18 @@ export function NavigationTree({
   error,
 }: NavigationTreeProps) {
   const [expandedKeys, setExpandedKeys] = useState<Set<string>>(new Set());
-  const [nodesToExpand, setNodesToExpand] = useState<string[]>([]);
-
-  // Filter tree by stage - checks stages[] array if available (PF-003)
-  const filterByStage = useCallback((nodes: TreeNode[], stages: Stage[]): TreeNode[] => {
-    if (stages.length === 0) return nodes;
-
-    return nodes
-      .map((node) => {
-        // Check if any of the node's stages match the filter
-        // Use stages[] if available, otherwise fall back to stage
-        const nodeStages = node.stages || (node.stage ? [node.stage] : []);
-        const matchesStage = nodeStages.length === 0 || nodeStages.some(s => stages.includes(s));
-
-        const filteredChildren = node.children
-          ? filterByStage(node.children, stages)
-          : [];
-
-        return {
-          ...node,
-          children: filteredChildren,
-          count: filteredChildren.length,
-        };
-      })
-      .filter((node) => {
-        const nodeStages = node.stages || (node.stage ? [node.stage] : []);
-        const matchesStage = nodeStages.length === 0 || nodeStages.some(s => stages.includes(s));
-        return matchesStage || (node.children && node.children.length > 0);
-      });
-  }, []);
-
-  // Filter tree by search query
-  const searchTree = useCallback((nodes: TreeNode[], query: string): { filtered: TreeNode[], toExpand: string[] } => {
-    if (!query) return { filtered: nodes, toExpand: [] };
 
-    const lowerQuery = query.toLowerCase();
-    const result: TreeNode[] = [];
-    const toExpand: string[] = [];
-
-    for (const node of nodes) {
-      const matchesLabel = node.label.toLowerCase().includes(lowerQuery);
-      const matchesDescription = node.description?.toLowerCase().includes(lowerQuery);
-      const matchesPath = node.path?.toLowerCase().includes(lowerQuery);
-
-      const childResult = node.children
-        ? searchTree(node.children, query)
-        : { filtered: [], toExpand: [] };
-
-      if (matchesLabel || matchesDescription || matchesPath || childResult.filtered.length > 0) {
-        result.push({
-          ...node,
-          children: childResult.filtered,
-        });
-
-        // Mark for expansion
-        if (node.children && node.children.length > 0) {
-          toExpand.push(node.id, ...childResult.toExpand);
-        }
-      }
-    }
+  // Search text is derived once per tree; each query only scans (or narrows) it
+  const searchTexts = useMemo(() => buildSearchTexts(items), [items]);
+  const { matches, pending } = useTreeSearch(searchTexts, searchQuery);
 
-    return { filtered: result, toExpand };
-  }, []);
-
-  // Apply filters
-  const { filteredItems, toExpand } = useMemo(() => {
-    let result = items;
-
-    if (stageFilter.length > 0) {
-      result = filterByStage(result, stageFilter);
-    }
-
-    let nodesToExpand: string[] = [];
-    if (searchQuery) {
-      const searchResult = searchTree(result, searchQuery);
-      nodesToExpand = searchResult.toExpand;
-      result = searchResult.filtered;
-    }
-
-    return { filteredItems: result, toExpand: nodesToExpand };
-  }, [items, stageFilter, searchQuery, filterByStage, searchTree]);
+  // Apply stage filter (PF-003) and search
+  const stageKey = stageFilter.join(',');
+  const { filtered: filteredItems, toExpand } = useMemo(
+    () => filterTree(items, stageFilter, matches),
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+    [items, stageKey, matches]
+  );
 
   // Auto-expand nodes based on search
   useEffect(() => {
@@ -103,6 +42,10 @@ export function NavigationTree({
     }
   }, [toExpand]);
 
+  const rows = useMemo(() => flattenVisibleTree(filteredItems, expandedKeys), [filteredItems, expandedKeys]);
+  const { ref, start, end, totalHeight } = useVirtualWindow(rows.length, ROW_HEIGHT);
+  const favoriteSet = useMemo(() => new Set(favorites), [favorites]);
+
   // Toggle expansion
   const toggleExpand = useCallback((nodeId: string) => {
     setExpandedKeys((prev) => {
@@ -120,66 +63,6 @@ export function NavigationTree({
     });
   }, [onExpandChange]);
 
-  // Render tree items recursively
-  const renderTreeItems = (nodes: TreeNode[], level: number = 0): React.ReactNode => {
-    return nodes.map((node) => {
-      const isFavorite = favorites.includes(node.id);
-      const isSelected = selectedId === node.id;
-      const isExpanded = expandedKeys.has(node.id);
-      const hasChildren = node.children && node.children.length > 0;
-
-      return (
-        <li
-          key={node.id}
-          role="treeitem"
-          aria-selected={isSelected}
-          aria-expanded={hasChildren ? isExpanded : undefined}
-          style={{ listStyle: 'none', paddingLeft: level > 0 ? '1rem' : 0 }}
-        >
-          <div
-            onClick={() => {
-              if (hasChildren) {
-                toggleExpand(node.id);
-              } else {
-                onSelect(node.id);
-              }
-            }}
-            onKeyDown={(e) => {
-              if (e.key === 'Enter' || e.key === ' ') {
-                e.preventDefault();
-                if (hasChildren) {
-                  toggleExpand(node.id);
-                } else {
-                  onSelect(node.id);
-                }
-              }
-            }}
-            tabIndex={0}
-            style={{
-              padding: '0.5rem',
-              cursor: 'pointer',
-              backgroundColor: isSelected ? '#dbeafe' : 'transparent',
-              fontWeight: isSelected ? 600 : 400,
-            }}
-          >
-            {isFavorite && <span>⭐ </span>}
-            <span>{node.label}</span>
-            {showCountBadges && node.count !== undefined && node.count > 0 && (
-              <span style={{ marginLeft: '0.5rem', fontSize: '0.875rem', color: '#6b7280' }}>
-                {node.count}
-              </span>
-            )}
-          </div>
-          {hasChildren && isExpanded && (
-            <ul role="group" style={{ paddingLeft: 0 }}>
-              {renderTreeItems(node.children!, level + 1)}
-            </ul>
-          )}
-        </li>
-      );
-    });
-  };
-
   // Loading state
   if (loading) {
     return <div style={{ padding: '1rem' }}>Loading...</div>;
@@ -190,15 +73,79 @@ export function NavigationTree({
     return <div style={{ padding: '1rem' }}>Failed to load tree: {error}</div>;
   }
 
-  // Empty state
+  // Empty state; a search still waiting for its first answer is not empty yet
   if (filteredItems.length === 0) {
-    return <div style={{ padding: '1rem' }}>No items found</div>;
+    return <div style={{ padding: '1rem' }}>{pending ? 'Searching...' : 'No items found'}</div>;
   }
 
   return (
-    <div style={{ padding: '1rem', fontFamily: 'monospace', fontSize: '0.875rem' }}>
-      <ul role="tree" aria-label="Framework navigation" style={{ paddingLeft: 0 }}>
-        {renderTreeItems(filteredItems)}
+    <div style={{ height: '100%', overflowY: 'auto', padding: '1rem', fontFamily: 'monospace', fontSize: '0.875rem' }}>
+      <ul
+        ref={ref}
+        role="tree"
+        aria-label="Framework navigation"
+        style={{ paddingLeft: 0, margin: 0, position: 'relative', height: totalHeight }}
+      >
+        {rows.slice(start, end).map(({ node, level, hasChildren, isExpanded }, index) => {
+          const isFavorite = favoriteSet.has(node.id);
+          const isSelected = selectedId === node.id;
+          const activate = () => {
+            if (hasChildren) {
+              toggleExpand(node.id);
+            } else {
+              onSelect(node.id);
+            }
+          };
+
+          return (
+            <li
+              key={node.id}
+              role="treeitem"
+              aria-level={level + 1}
+              aria-selected={isSelected}
+              aria-expanded={hasChildren ? isExpanded : undefined}
+              style={{
+                listStyle: 'none',
+                position: 'absolute',
+                top: (start + index) * ROW_HEIGHT,
+                left: 0,
+                right: 0,
+                height: ROW_HEIGHT,
+                paddingLeft: `${level}rem`,
+              }}
+            >
+              <div
+                onClick={activate}
+                onKeyDown={(e) => {
+                  if (e.key === 'Enter' || e.key === ' ') {
+                    e.preventDefault();
+                    activate();
+                  }
+                }}
+                tabIndex={0}
+                style={{
+                  height: '100%',
+                  boxSizing: 'border-box',
+                  padding: '0.5rem',
+                  cursor: 'pointer',
+                  whiteSpace: 'nowrap',
+                  overflow: 'hidden',
+                  textOverflow: 'ellipsis',
+                  backgroundColor: isSelected ? '#dbeafe' : 'transparent',
+                  fontWeight: isSelected ? 600 : 400,
+                }}
+              >
+                {isFavorite && <span>⭐ </span>}
+                <span>{node.label}</span>
+                {showCountBadges && node.count !== undefined && node.count > 0 && (
+                  <span style={{ marginLeft: '0.5rem', fontSize: '0.875rem', color: '#6b7280' }}>
+                    {node.count}
+                  </span>
+                )}
+              </div>
+            </li>
+          );
+        })}
       </ul>
     </div>
   );
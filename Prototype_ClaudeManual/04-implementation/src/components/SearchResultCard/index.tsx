@@ -11,6 +11,13 @@ export type Stage =
   | 'security'
   | 'grc';
 
+export interface SearchResultHighlight {
+  /** 'name' ranges index into `name`, 'description' ranges into `summary`, 'content' ranges into `content` */
+  field: 'name' | 'description' | 'content';
+  start: number;
+  end: number;
+}
+
 export interface SearchResult {
   id: string;
   name: string;
@@ -18,10 +25,14 @@ export interface SearchResult {
   stage: Stage;
   path: string;
   summary: string;
+  /** Snippet of the body around the first match */
+  content?: string;
   relevanceScore: number;
   /** User-defined tags (PF-002) */
   tags?: string[];
   isFavorite: boolean;
+  /** Match offsets from the search index; falls back to highlighting `query` when absent */
+  highlights?: SearchResultHighlight[];
 }
 
 export interface SearchResultCardProps {
@@ -65,6 +76,34 @@ function highlightQuery(text: string, query: string): React.ReactNode {
   });
 }
 
+const markStyle = { backgroundColor: '#fef3c7', fontWeight: 600, padding: '0 2px' };
+
+function highlightRanges(text: string, ranges: SearchResultHighlight[]): React.ReactNode {
+  const parts: React.ReactNode[] = [];
+  let cursor = 0;
+  ranges.forEach((range, index) => {
+    if (range.start > cursor) {
+      parts.push(<React.Fragment key={`t${index}`}>{text.slice(cursor, range.start)}</React.Fragment>);
+    }
+    parts.push(<mark key={`m${index}`} style={markStyle}>{text.slice(range.start, range.end)}</mark>);
+    cursor = range.end;
+  });
+  if (cursor < text.length) {
+    parts.push(<React.Fragment key="rest">{text.slice(cursor)}</React.Fragment>);
+  }
+  return parts;
+}
+
+function highlightField(
+  text: string,
+  query: string,
+  field: SearchResultHighlight['field'],
+  highlights?: SearchResultHighlight[]
+): React.ReactNode {
+  if (!highlights) return highlightQuery(text, query);
+  return highlightRanges(text, highlights.filter(h => h.field === field));
+}
+
 function getRelevanceBadgeVariant(score: number): string {
   if (score >= 0.8) return 'bg-green-100 text-green-800'; // High relevance
   if (score >= 0.5) return 'bg-blue-100 text-blue-800'; // Medium relevance
@@ -110,7 +149,7 @@ export const SearchResultCard: React.FC<SearchResultCardProps> = ({
       <div className="flex items-start justify-between mb-3">
         <div className="flex-1">
           <h3 className="text-lg font-semibold text-gray-900 mb-2">
-            {highlightQuery(result.name, query)}
+            {highlightField(result.name, query, 'name', result.highlights)}
           </h3>
 
           {/* Badges */}
@@ -142,9 +181,16 @@ export const SearchResultCard: React.FC<SearchResultCardProps> = ({
 
       {/* Summary */}
       <p className="text-sm text-gray-600 mb-3">
-        {highlightQuery(result.summary, query)}
+        {highlightField(result.summary, query, 'description', result.highlights)}
       </p>
 
+      {/* Content snippet */}
+      {result.content && (
+        <p className="text-sm text-gray-600 line-clamp-2 mb-3">
+          {highlightField(result.content, query, 'content', result.highlights)}...
+        </p>
+      )}
+
       {/* Path */}
       <p className="text-xs text-gray-500 font-mono mb-3">{result.path}</p>
 
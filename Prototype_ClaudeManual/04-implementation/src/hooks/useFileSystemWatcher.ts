@@ -2,38 +2,106 @@
 
 import { useEffect } from 'react';
 import { useQueryClient } from '@tanstack/react-query';
+import type { QueryClient } from '@tanstack/react-query';
+import type { CatalogChange, CatalogChangeEvent } from '@/lib/catalog/types';
+
+const EVENTS_URL = '/api/events';
+
+// Query keys whose data comes from the .claude/ catalog
+const LIST_SCOPES = ['skills', 'commands', 'agents'] as const;
+const CONTENT_SCOPES = ['architecture-content', 'workflow-content'];
+const CATALOG_SCOPES = [
+  ...LIST_SCOPES,
+  'search',
+  'architecture-hierarchy',
+  'workflow-hierarchy',
+  ...CONTENT_SCOPES,
+];
 
 /**
- * File system watcher hook (placeholder for production implementation)
- *
- * In production, this would:
- * 1. Connect to a WebSocket server that watches file system changes
- * 2. Invalidate relevant queries when files change
- * 3. Show notifications for file updates
+ * Invalidate only the queries a batch of file changes can affect:
+ * - the skills/commands/agents list of a changed kind
+ * - search results (every kind is searchable)
+ * - folder trees, when files were added or removed
+ * - open architecture/workflow documents whose file changed
+ */
+export function invalidateForChanges(queryClient: QueryClient, changes: CatalogChange[]): void {
+  if (changes.length === 0) return;
+  const kinds = new Set(changes.map((change) => change.kind));
+  const structural = changes.filter((change) => change.action !== 'changed');
+
+  for (const scope of LIST_SCOPES) {
+    if (kinds.has(scope)) queryClient.invalidateQueries({ queryKey: [scope] });
+  }
+  queryClient.invalidateQueries({ queryKey: ['search'] });
+
+  if (structural.some((change) => change.kind === 'architecture' || change.kind === 'workflows')) {
+    queryClient.invalidateQueries({ queryKey: ['architecture-hierarchy'] });
+  }
+  if (structural.some((change) => change.kind === 'workflows')) {
+    queryClient.invalidateQueries({ queryKey: ['workflow-hierarchy'] });
+  }
+
+  // Documents are keyed by their path relative to the configured folder
+  const documentPaths = changes
+    .filter((change) => change.kind === 'architecture' || change.kind === 'workflows')
+    .map((change) => change.path);
+  if (documentPaths.length > 0) {
+    queryClient.invalidateQueries({
+      predicate: (query) => {
+        const [scope, filePath] = query.queryKey;
+        if (!CONTENT_SCOPES.includes(scope as string) || typeof filePath !== 'string') return false;
+        const normalized = filePath.replace(/\\/g, '/');
+        return documentPaths.some((changed) => changed === normalized || changed.endsWith(`/${normalized}`));
+      },
+    });
+  }
+}
+
+/** Refetch everything served from the catalog (e.g. after missing events while disconnected) */
+export function invalidateCatalogQueries(queryClient: QueryClient): void {
+  queryClient.invalidateQueries({
+    predicate: (query) => CATALOG_SCOPES.includes(query.queryKey[0] as string),
+  });
+}
+
+/**
+ * Live reload for `.claude/` content.
  *
- * For prototype, this is a stub that logs events.
+ * Subscribes to the server's change stream (`/api/events`) and invalidates
+ * the React Query keys touched by each batch of file changes.
  */
 export function useFileSystemWatcher() {
   const queryClient = useQueryClient();
 
   useEffect(() => {
-    // Placeholder: In production, this would connect to a WebSocket
-    console.log('[FileSystemWatcher] Initialized (placeholder)');
+    if (typeof EventSource === 'undefined') return;
 
-    // Simulate periodic refresh for demo purposes
-    const interval = setInterval(() => {
-      // In production, this would be triggered by actual file changes
-      console.log('[FileSystemWatcher] Checking for updates...');
+    const source = new EventSource(EVENTS_URL);
+    let lastVersion: number | null = null;
+
+    const handleReady = (message: MessageEvent<string>) => {
+      const { version } = JSON.parse(message.data) as { version: number };
+      // A reconnect may have missed events; the version tells us whether it did
+      if (lastVersion !== null && version !== lastVersion) {
+        invalidateCatalogQueries(queryClient);
+      }
+      lastVersion = version;
+    };
+
+    const handleChange = (message: MessageEvent<string>) => {
+      const event = JSON.parse(message.data) as CatalogChangeEvent;
+      lastVersion = event.version;
+      invalidateForChanges(queryClient, event.changes);
+    };
 
-      // Example: Invalidate all queries to refetch data
-      // queryClient.invalidateQueries({ queryKey: ['skills'] });
-      // queryClient.invalidateQueries({ queryKey: ['commands'] });
-      // queryClient.invalidateQueries({ queryKey: ['agents'] });
-    }, 30000); // Check every 30 seconds (placeholder)
+    source.addEventListener('ready', handleReady);
+    source.addEventListener('change', handleChange);
 
     return () => {
-      clearInterval(interval);
-      console.log('[FileSystemWatcher] Cleaned up');
+      source.removeEventListener('ready', handleReady);
+      source.removeEventListener('change', handleChange);
+      source.close();
     };
   }, [queryClient]);
 }
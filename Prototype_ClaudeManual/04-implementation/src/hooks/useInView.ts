@@ -0,0 +1,33 @@
+'use client';
+
+import { useEffect, useState } from 'react';
+import type { RefObject } from 'react';
+
+/**
+ * Becomes true once the element scrolls within `rootMargin` of the viewport,
+ * and stays true. Without IntersectionObserver the element counts as visible.
+ */
+export function useInView(ref: RefObject<Element | null>, rootMargin = '200px'): boolean {
+  const [inView, setInView] = useState(false);
+
+  useEffect(() => {
+    if (inView) return;
+    const element = ref.current;
+    if (!element) return;
+    if (typeof IntersectionObserver === 'undefined') {
+      setInView(true);
+      return;
+    }
+
+    const observer = new IntersectionObserver((entries) => {
+      if (entries.some((entry) => entry.isIntersecting)) {
+        setInView(true);
+        observer.disconnect();
+      }
+    }, { rootMargin });
+    observer.observe(element);
+    return () => observer.disconnect();
+  }, [ref, rootMargin, inView]);
+
+  return inView;
+}
@@ -0,0 +1,83 @@
+'use client';
+
+import { useEffect, useMemo, useRef, useState } from 'react';
+import { IncrementalMatcher } from '@/lib/treeFilter';
+import type { TreeSearchRequest, TreeSearchResponse } from '@/lib/treeFilter.worker';
+
+// Trees with at least this many nodes are matched in a Web Worker
+export const WORKER_MIN_NODES = 5000;
+
+const NO_MATCHES: ReadonlySet<number> = new Set();
+
+interface WorkerResult {
+  texts: string[];
+  query: string;
+  matches: ReadonlySet<number>;
+}
+
+export interface TreeSearch {
+  /** Ordinals of the nodes whose search text contains the query (null without a query) */
+  matches: ReadonlySet<number> | null;
+  /** The worker has not yet answered the current query; `matches` is the previous answer, if any */
+  pending: boolean;
+}
+
+/**
+ * Match a tree's search texts against `query`.
+ *
+ * Small trees are matched inline, memoized per query. Large trees are matched
+ * in a worker so typing never blocks a frame; until the worker answers, the
+ * previous result is kept (even across a change of `texts`, where it is only
+ * approximate) and the search is reported as pending. Before the first answer
+ * nothing matches: showing the unfiltered tree would flash every node.
+ */
+export function useTreeSearch(texts: string[], query: string): TreeSearch {
+  const useWorker = texts.length >= WORKER_MIN_NODES && typeof Worker !== 'undefined';
+  const matcherRef = useRef<IncrementalMatcher | null>(null);
+  const workerRef = useRef<Worker | null>(null);
+  const requestIdRef = useRef(0);
+  const [workerResult, setWorkerResult] = useState<WorkerResult | null>(null);
+
+  const inlineMatches = useMemo(() => {
+    if (useWorker || !query) return null;
+    matcherRef.current ??= new IncrementalMatcher();
+    matcherRef.current.setTexts(texts);
+    return new Set(matcherRef.current.match(query));
+  }, [texts, query, useWorker]);
+
+  useEffect(() => {
+    if (!useWorker) return;
+    const worker = new Worker(new URL('../lib/treeFilter.worker.ts', import.meta.url));
+    workerRef.current = worker;
+    return () => {
+      worker.terminate();
+      workerRef.current = null;
+    };
+  }, [useWorker]);
+
+  useEffect(() => {
+    const worker = workerRef.current;
+    if (!useWorker || !worker) return;
+    worker.postMessage({ type: 'texts', texts } satisfies TreeSearchRequest);
+  }, [useWorker, texts]);
+
+  useEffect(() => {
+    const worker = workerRef.current;
+    if (!useWorker || !worker || !query) return;
+
+    const id = ++requestIdRef.current;
+    worker.onmessage = (event: MessageEvent<TreeSearchResponse>) => {
+      // Drop answers to queries that have since been replaced
+      if (event.data.id !== requestIdRef.current) return;
+      setWorkerResult({ texts, query, matches: new Set(event.data.matches) });
+    };
+    worker.postMessage({ type: 'match', id, query } satisfies TreeSearchRequest);
+  }, [useWorker, texts, query]);
+
+  if (!query) return { matches: null, pending: false };
+  if (!useWorker) return { matches: inlineMatches, pending: false };
+  return {
+    matches: workerResult?.matches ?? NO_MATCHES,
+    pending: !workerResult || workerResult.texts !== texts || workerResult.query !== query,
+  };
+}
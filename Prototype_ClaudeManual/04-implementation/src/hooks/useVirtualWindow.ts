@@ -0,0 +1,89 @@
+'use client';
+
+import { useCallback, useEffect, useState } from 'react';
+
+// Assumed viewport when the list has not been laid out (e.g. first render, jsdom)
+const DEFAULT_VIEWPORT_HEIGHT = 800;
+const CLIPPING_OVERFLOW = /auto|scroll|hidden|clip/;
+
+export interface VirtualWindow {
+  /** Attach to the element that contains the rows */
+  ref: (element: HTMLElement | null) => void;
+  /** First row to render */
+  start: number;
+  /** One past the last row to render */
+  end: number;
+  /** Height of all rows together, for the scroll spacer */
+  totalHeight: number;
+}
+
+interface VisibleSpan {
+  /** Offset of the first visible pixel from the top of the list */
+  top: number;
+  height: number;
+}
+
+// Ancestors that clip the list; whichever of them (or the page) scrolls, the
+// visible part of the list is the intersection of their boxes with the viewport
+function clippingAncestors(list: HTMLElement): HTMLElement[] {
+  const ancestors: HTMLElement[] = [];
+  for (let node = list.parentElement; node; node = node.parentElement) {
+    if (CLIPPING_OVERFLOW.test(getComputedStyle(node).overflowY)) ancestors.push(node);
+  }
+  return ancestors;
+}
+
+function measureVisible(list: HTMLElement, clips: HTMLElement[]): VisibleSpan {
+  const rect = list.getBoundingClientRect();
+  if (rect.height === 0) {
+    // No layout: assume the list starts at the top of its scrollers
+    return { top: clips.reduce((sum, node) => sum + node.scrollTop, 0), height: DEFAULT_VIEWPORT_HEIGHT };
+  }
+
+  let clipTop = 0;
+  let clipBottom = window.innerHeight;
+  for (const node of clips) {
+    const bounds = node.getBoundingClientRect();
+    clipTop = Math.max(clipTop, bounds.top);
+    clipBottom = Math.min(clipBottom, bounds.bottom);
+  }
+  return { top: clipTop - rect.top, height: Math.max(0, clipBottom - clipTop) };
+}
+
+/**
+ * Window over a list of fixed-height rows: only the rows on screen, plus
+ * `overscan` rows on either side, need to be rendered. The list itself, any
+ * ancestor or the page may be the element that scrolls.
+ */
+export function useVirtualWindow(count: number, rowHeight: number, overscan = 10): VirtualWindow {
+  const [list, setList] = useState<HTMLElement | null>(null);
+  const [visible, setVisible] = useState<VisibleSpan>({ top: 0, height: DEFAULT_VIEWPORT_HEIGHT });
+
+  const update = useCallback((next: VisibleSpan) => {
+    setVisible((prev) => (prev.top === next.top && prev.height === next.height ? prev : next));
+  }, []);
+
+  useEffect(() => {
+    if (!list) return;
+    const clips = clippingAncestors(list);
+    const measure = () => update(measureVisible(list, clips));
+    measure();
+
+    // Capture sees scroll events from every element, not just the document
+    document.addEventListener('scroll', measure, { capture: true, passive: true });
+    window.addEventListener('resize', measure);
+    const observer = typeof ResizeObserver === 'undefined' ? null : new ResizeObserver(measure);
+    observer?.observe(list);
+    clips.forEach((node) => observer?.observe(node));
+    return () => {
+      document.removeEventListener('scroll', measure, { capture: true });
+      window.removeEventListener('resize', measure);
+      observer?.disconnect();
+    };
+  }, [list, update]);
+
+  const start = Math.max(0, Math.floor(visible.top / rowHeight) - overscan);
+  const end = Math.max(start, Math.min(count, Math.ceil((visible.top + visible.height) / rowHeight) + overscan));
+
+  return { ref: setList, start, end, totalHeight: count * rowHeight };
+}
@@ -0,0 +1,379 @@
+// Frontmatter and markdown section parsing shared by every catalog source.
+// These used to be copy-pasted into each API route.
+
+export interface HookEntry {
+  type: string;
+  command: string;
+}
+
+export interface HookMatcher {
+  matcher?: string;
+  once?: boolean;
+  hooks: HookEntry[];
+}
+
+export interface ParsedHooks {
+  PreToolUse?: HookMatcher[];
+  PostToolUse?: HookMatcher[];
+  Stop?: HookMatcher[];
+  [key: string]: HookMatcher[] | undefined;
+}
+
+export interface ParsedSkills {
+  required: string[];
+  optional: string[];
+}
+
+export interface ParsedFrontmatter {
+  /** Flat `key: value` pairs (nested blocks are skipped) */
+  frontmatter: Record<string, string>;
+  /** Raw frontmatter text between the `---` fences */
+  frontmatterText: string;
+  /** Markdown body after the frontmatter */
+  body: string;
+  hooks: ParsedHooks | undefined;
+}
+
+export interface SearchFrontmatter {
+  name?: string;
+  description?: string;
+  tags?: string[];
+  [key: string]: string | string[] | undefined;
+}
+
+export function parseSkillsSection(frontmatterText: string): ParsedSkills {
+  const skills: ParsedSkills = { required: [], optional: [] };
+
+  // Find skills section
+  const skillsMatch = frontmatterText.match(/^skills:\s*$/m);
+  if (!skillsMatch) return skills;
+
+  const startIdx = skillsMatch.index! + skillsMatch[0].length;
+  const lines = frontmatterText.substring(startIdx).split('\n');
+
+  let currentList: 'required' | 'optional' | null = null;
+
+  for (const line of lines) {
+    // Stop if we hit another top-level key (no leading whitespace)
+    if (line && !line.startsWith(' ') && !line.startsWith('\t') && line.includes(':')) {
+      break;
+    }
+
+    const trimmed = line.trim();
+
+    if (trimmed === 'required:') {
+      currentList = 'required';
+    } else if (trimmed === 'optional:') {
+      currentList = 'optional';
+    } else if (trimmed.startsWith('- ') && currentList) {
+      const skillName = trimmed.substring(2).trim();
+      skills[currentList].push(skillName);
+    }
+  }
+
+  return skills;
+}
+
+export function parseHooksSection(frontmatterText: string): ParsedHooks | undefined {
+  // Find hooks section
+  const hooksMatch = frontmatterText.match(/^hooks:\s*$/m);
+  if (!hooksMatch) return undefined;
+
+  const startIdx = hooksMatch.index! + hooksMatch[0].length;
+  const lines = frontmatterText.substring(startIdx).split('\n');
+
+  const hooks: ParsedHooks = {};
+  let currentHookType: string | null = null;
+  let currentMatcher: HookMatcher | null = null;
+  let currentHookEntry: Partial<HookEntry> | null = null;
+  let commandLines: string[] = [];
+
+  for (const line of lines) {
+    // Stop if we hit another top-level key (no leading whitespace, has colon, not inside hooks)
+    if (line && !line.startsWith(' ') && !line.startsWith('\t') && line.includes(':')) {
+      break;
+    }
+
+    const trimmed = line.trim();
+    const indent = line.search(/\S/);
+
+    // Hook type (PreToolUse:, Stop:, etc.) - 2 space indent
+    if (indent === 2 && trimmed.endsWith(':') && !trimmed.startsWith('-')) {
+      // Save previous hook entry
+      if (currentHookEntry && currentHookEntry.type && currentMatcher) {
+        if (commandLines.length > 0) {
+          currentHookEntry.command = commandLines.join(' ').trim();
+          commandLines = [];
+        }
+        currentMatcher.hooks.push(currentHookEntry as HookEntry);
+        currentHookEntry = null;
+      }
+      // Save previous matcher
+      if (currentMatcher && currentHookType) {
+        if (!hooks[currentHookType]) hooks[currentHookType] = [];
+        hooks[currentHookType]!.push(currentMatcher);
+        currentMatcher = null;
+      }
+
+      currentHookType = trimmed.slice(0, -1);
+      continue;
+    }
+
+    // Array item start (- matcher: or - hooks:)
+    if (trimmed.startsWith('- ') && currentHookType) {
+      // Save previous hook entry
+      if (currentHookEntry && currentHookEntry.type && currentMatcher) {
+        if (commandLines.length > 0) {
+          currentHookEntry.command = commandLines.join(' ').trim();
+          commandLines = [];
+        }
+        currentMatcher.hooks.push(currentHookEntry as HookEntry);
+        currentHookEntry = null;
+      }
+      // Save previous matcher if starting new one
+      if (trimmed.startsWith('- matcher:') || trimmed.startsWith('- hooks:')) {
+        if (currentMatcher) {
+          if (!hooks[currentHookType]) hooks[currentHookType] = [];
+          hooks[currentHookType]!.push(currentMatcher);
+        }
+        currentMatcher = { hooks: [] };
+      }
+
+      const content = trimmed.substring(2);
+      if (content.startsWith('matcher:')) {
+        const matcherValue = content.substring(8).trim().replace(/^["']|["']$/g, '');
+        if (currentMatcher) currentMatcher.matcher = matcherValue;
+      } else if (content.startsWith('type:')) {
+        currentHookEntry = { type: content.substring(5).trim() };
+      }
+      continue;
+    }
+
+    // Properties within matcher (once:, hooks:)
+    if (currentMatcher && indent >= 6) {
+      if (trimmed.startsWith('once:')) {
+        currentMatcher.once = trimmed.substring(5).trim() === 'true';
+      } else if (trimmed === 'hooks:') {
+        // hooks array start
+      } else if (trimmed.startsWith('- type:')) {
+        // Save previous hook entry
+        if (currentHookEntry && currentHookEntry.type) {
+          if (commandLines.length > 0) {
+            currentHookEntry.command = commandLines.join(' ').trim();
+            commandLines = [];
+          }
+          currentMatcher.hooks.push(currentHookEntry as HookEntry);
+        }
+        currentHookEntry = { type: trimmed.substring(7).trim() };
+      } else if (trimmed.startsWith('command:')) {
+        if (currentHookEntry) {
+          const cmdValue = trimmed.substring(8).trim();
+          if (cmdValue.startsWith('>-') || cmdValue.startsWith('>')) {
+            // Multiline command starts
+            commandLines = [];
+          } else {
+            currentHookEntry.command = cmdValue.replace(/^["']|["']$/g, '');
+          }
+        }
+      } else if (currentHookEntry && !trimmed.startsWith('-') && !trimmed.includes(':')) {
+        // Continuation of multiline command
+        commandLines.push(trimmed);
+      }
+    }
+  }
+
+  // Save final entries
+  if (currentHookEntry && currentHookEntry.type && currentMatcher) {
+    if (commandLines.length > 0) {
+      currentHookEntry.command = commandLines.join(' ').trim();
+    }
+    currentMatcher.hooks.push(currentHookEntry as HookEntry);
+  }
+  if (currentMatcher && currentHookType) {
+    if (!hooks[currentHookType]) hooks[currentHookType] = [];
+    hooks[currentHookType]!.push(currentMatcher);
+  }
+
+  return Object.keys(hooks).length > 0 ? hooks : undefined;
+}
+
+export function parseYamlFrontmatter(content: string): ParsedFrontmatter {
+  const frontmatterMatch = content.match(/^---\n([\s\S]*?)\n---\n?([\s\S]*)$/);
+  if (!frontmatterMatch) return { frontmatter: {}, frontmatterText: '', body: content, hooks: undefined };
+
+  const frontmatterText = frontmatterMatch[1];
+  const frontmatter: Record<string, string> = {};
+  const lines = frontmatterText.split('\n');
+  let currentKey = '';
+  let currentValue = '';
+
+  for (const line of lines) {
+    const keyMatch = line.match(/^(\w[\w-]*):(.*)$/);
+    if (keyMatch && !line.trim().endsWith(':')) {
+      if (currentKey) {
+        frontmatter[currentKey] = currentValue.trim();
+      }
+      currentKey = keyMatch[1];
+      currentValue = keyMatch[2].trim();
+    } else if (keyMatch && line.trim().endsWith(':')) {
+      if (currentKey) {
+        frontmatter[currentKey] = currentValue.trim();
+      }
+      currentKey = '';
+      currentValue = '';
+    } else if (currentKey && line.startsWith('  ') && !line.includes('- ')) {
+      currentValue += ' ' + line.trim();
+    }
+  }
+  if (currentKey) {
+    frontmatter[currentKey] = currentValue.trim();
+  }
+
+  const hooks = parseHooksSection(frontmatterText);
+
+  return { frontmatter, frontmatterText, body: frontmatterMatch[2] || '', hooks };
+}
+
+/**
+ * Frontmatter parser used for search documents: keeps list values
+ * (e.g. `tags:`) as arrays instead of dropping nested blocks.
+ */
+export function parseSearchFrontmatter(content: string): SearchFrontmatter {
+  const frontmatterMatch = content.match(/^---\n([\s\S]*?)\n---/);
+  if (!frontmatterMatch) return {};
+
+  const frontmatter: SearchFrontmatter = {};
+  const lines = frontmatterMatch[1].split('\n');
+  let currentKey = '';
+  let currentValue = '';
+  let inArray = false;
+  let arrayValues: string[] = [];
+
+  for (const line of lines) {
+    // Check for array item
+    if (inArray && line.match(/^\s+-\s+(.+)$/)) {
+      const match = line.match(/^\s+-\s+(.+)$/);
+      if (match) {
+        arrayValues.push(match[1].replace(/^["']|["']$/g, '').trim());
+      }
+      continue;
+    }
+
+    // Check for new key
+    const keyMatch = line.match(/^(\w[\w-]*):(.*)$/);
+    if (keyMatch) {
+      // Save previous key
+      if (currentKey) {
+        if (inArray) {
+          frontmatter[currentKey] = arrayValues;
+        } else {
+          frontmatter[currentKey] = currentValue.trim();
+        }
+      }
+
+      currentKey = keyMatch[1];
+      const value = keyMatch[2].trim();
+
+      // Check if this starts an array
+      if (value === '' || value === '[]') {
+        inArray = true;
+        arrayValues = [];
+        currentValue = '';
+      } else {
+        inArray = false;
+        currentValue = value;
+      }
+    } else if (currentKey && line.startsWith('  ') && !inArray) {
+      currentValue += ' ' + line.trim();
+    }
+  }
+
+  // Save last key
+  if (currentKey) {
+    if (inArray) {
+      frontmatter[currentKey] = arrayValues;
+    } else {
+      frontmatter[currentKey] = currentValue.trim();
+    }
+  }
+
+  return frontmatter;
+}
+
+export function stripFrontmatter(content: string): string {
+  return content.replace(/^---\n[\s\S]*?\n---\n?/, '');
+}
+
+export function extractSection(body: string, sectionName: string): string {
+  // Look for ## Section Name or ### Section Name
+  const patterns = [
+    new RegExp(`##\\s*${sectionName}[\\s\\S]*?(?=\\n##|$)`, 'i'),
+    new RegExp(`###\\s*${sectionName}[\\s\\S]*?(?=\\n###|\\n##|$)`, 'i'),
+  ];
+
+  for (const pattern of patterns) {
+    const match = body.match(pattern);
+    if (match) {
+      // Remove the header line and return content
+      return match[0].replace(/^##?\s*[^\n]+\n/, '').trim();
+    }
+  }
+  return '';
+}
+
+export function extractBullets(body: string, sectionName: string): string[] {
+  const section = extractSection(body, sectionName);
+  if (!section) return [];
+
+  const bullets = section.match(/^[-*]\s+(.+)$/gm);
+  if (bullets) {
+    return bullets.map(b => b.replace(/^[-*]\s+/, '').trim());
+  }
+  return [];
+}
+
+export function extractPurpose(body: string, description: string): string {
+  // Try to find first paragraph after the title
+  const titleMatch = body.match(/^#\s+[^\n]+\n\n([^\n#]+)/);
+  if (titleMatch) {
+    return titleMatch[1].trim();
+  }
+  // Fall back to description
+  return description;
+}
+
+/** First 500 characters of a named section, or '' when absent */
+export function extractSectionPreview(body: string, sectionName: string): string {
+  const section = extractSection(body, sectionName);
+  if (section) {
+    // Limit to reasonable length
+    return section.substring(0, 500);
+  }
+  return '';
+}
+
+export function parseList(value: string | undefined): string[] {
+  if (!value) return [];
+  return value.split(',').map(t => t.trim()).filter(Boolean);
+}
+
+export function unquote(value: string): string {
+  return value.replace(/^["']|["']$/g, '');
+}
+
+export function formatName(filename: string): string {
+  return filename
+    .replace(/-/g, ' ')
+    .replace(/_/g, ' ')
+    .split(' ')
+    .map(w => w.charAt(0).toUpperCase() + w.slice(1))
+    .join(' ');
+}
+
+// Skill names split on hyphens and underscores only; words separated by spaces keep their case
+export function formatSkillName(name: string): string {
+  return name
+    .split(/[-_]/)
+    .map(w => w.charAt(0).toUpperCase() + w.slice(1))
+    .join(' ');
+}
@@ -0,0 +1,482 @@
+import { promises as fs } from 'fs';
+import type { Stats } from 'fs';
+import path from 'path';
+import { SearchIndex } from '@/lib/search';
+import { ingest, mapWithConcurrency, readAndParse } from './ingest';
+import type { IngestJob } from './ingest';
+import { AGENT_STAGE_ORDER, COMMAND_STAGE_ORDER, SKILL_STAGE_ORDER, byStageThenName } from './parsers';
+import { getSharedParsePool } from './parsePool';
+import type { ParsePool } from './parsePool';
+import { defaultSnapshotPath, readSnapshot, writeSnapshot } from './snapshot';
+import type { SnapshotEntry } from './snapshot';
+import { classifyPath, getProjectRoot, kindsForPath, listSourceFiles, toRelativePath } from './sources';
+import { CATALOG_KINDS } from './types';
+import type {
+  Agent,
+  CatalogChange,
+  CatalogChangeEvent,
+  CatalogKind,
+  Command,
+  ParsedFile,
+  SearchableItem,
+  Skill,
+} from './types';
+import { CatalogWatcher } from './watcher';
+
+export * from './types';
+export { classifyPath, getProjectRoot } from './sources';
+export { ParsePool } from './parsePool';
+export { SNAPSHOT_VERSION } from './snapshot';
+
+/** Max files stat'ed at the same time during a refresh */
+const IO_CONCURRENCY = 64;
+
+export interface CatalogOptions {
+  /** Worker pool used to parse large batches; null parses on the main thread */
+  parsePool?: ParsePool | null;
+  /** File the parsed catalog is persisted to between restarts; null disables the snapshot */
+  snapshotPath?: string | null;
+}
+
+interface CatalogEntry {
+  kind: CatalogKind;
+  mtimeMs: number;
+  size: number;
+  /** Content hash, so a touched but unchanged file is not parsed again */
+  hash: string;
+  parsed: ParsedFile;
+}
+
+interface CatalogViews {
+  version: number;
+  skills: Skill[];
+  commands: Command[];
+  agents: Agent[];
+  searchItems: SearchableItem[];
+}
+
+function idOf(parsed: ParsedFile): string | null {
+  return parsed.record?.id ?? parsed.searchItem?.id ?? null;
+}
+
+/**
+ * Process-wide index of everything under `.claude/`.
+ *
+ * Each file is parsed once and cached by path; a refresh only stats the tree
+ * and re-parses files whose mtime or size changed, spreading large batches
+ * (a cold start) across worker threads. Derived lists are rebuilt
+ * only when the catalog version moves, and the search index is patched per file.
+ *
+ * The parsed catalog and its tokenized search documents are persisted to a
+ * snapshot under `_state/`. A fresh process restores it and only stats the
+ * tree, so startup re-parses just the files that changed since it was saved.
+ *
+ * Once `watch()` is active, filesystem events patch individual files and
+ * requests stop re-stating the tree. All updates run one at a time.
+ */
+export class Catalog {
+  readonly projectRoot: string;
+  private entries = new Map<string, CatalogEntry>();
+  private version = 0;
+  private views: CatalogViews | null = null;
+  private inFlight: Promise<void> | null = null;
+  private searchIndex = new SearchIndex();
+  private updates: Promise<unknown> = Promise.resolve();
+  private loaded = false;
+  private watcher: CatalogWatcher | null = null;
+  private pendingChanges = new Map<string, CatalogChange>();
+  private listeners = new Set<(event: CatalogChangeEvent) => void>();
+  private parsePool: ParsePool | null;
+  private snapshotPath: string | null;
+  private snapshotDirty = false;
+  private snapshotWrite: Promise<void> | null = null;
+
+  constructor(projectRoot: string, options: CatalogOptions = {}) {
+    this.projectRoot = projectRoot;
+    this.parsePool = options.parsePool === undefined ? getSharedParsePool() : options.parsePool;
+    this.snapshotPath = options.snapshotPath === undefined ? defaultSnapshotPath(projectRoot) : options.snapshotPath;
+  }
+
+  /** Bring the catalog in line with the filesystem. Concurrent callers share one pass. */
+  refresh(): Promise<void> {
+    // File events keep a watched catalog current; only wait for updates already queued
+    if (this.watcher && this.loaded) {
+      return this.updates.then(() => undefined);
+    }
+    if (!this.inFlight) {
+      this.inFlight = this.enqueue(async () => {
+        if (!this.loaded) {
+          await this.restoreSnapshot();
+        }
+        await this.sync(CATALOG_KINDS);
+        if (this.loaded) {
+          this.publish();
+        } else {
+          // Nobody needs to hear about the initial load file by file
+          this.pendingChanges.clear();
+          this.loaded = true;
+        }
+        this.saveSnapshot();
+      }).finally(() => {
+        this.inFlight = null;
+      });
+    }
+    return this.inFlight;
+  }
+
+  /**
+   * Re-read specific project-relative paths (files or directories) instead of
+   * the whole tree. Returns the changes that were applied.
+   */
+  applyChanges(relativePaths: Iterable<string>): Promise<CatalogChange[]> {
+    const paths = Array.from(new Set(relativePaths));
+    return this.enqueue(async () => {
+      const rescan = new Set<CatalogKind>();
+
+      await mapWithConcurrency(paths, IO_CONCURRENCY, async (relativePath) => {
+        const kind = classifyPath(relativePath);
+        if (kind) {
+          if (!(await this.indexFile(kind, relativePath))) this.deleteEntry(relativePath);
+          return;
+        }
+
+        // Directory renames and deletions only report the directory itself
+        const stat = await fs.stat(path.join(this.projectRoot, relativePath)).catch(() => null);
+        if (stat?.isDirectory()) {
+          for (const affected of kindsForPath(relativePath)) rescan.add(affected);
+        } else if (!stat) {
+          for (const key of this.entries.keys()) {
+            if (key.startsWith(`${relativePath}/`)) this.deleteEntry(key);
+          }
+        }
+      });
+
+      if (rescan.size > 0) {
+        await this.sync(Array.from(rescan));
+      }
+      this.saveSnapshot();
+      return this.publish();
+    });
+  }
+
+  /** Follow filesystem events for this catalog. Falls back to per-request rescans if watching fails. */
+  watch(): boolean {
+    if (this.watcher) return true;
+
+    const watcher = new CatalogWatcher(this.projectRoot, {
+      onChange: (paths) => {
+        this.applyChanges(paths).catch((error) => console.error('Error applying file changes:', error));
+      },
+      onError: (error) => {
+        console.error('Catalog watcher failed, falling back to rescans:', error);
+        this.watcher = null;
+      },
+    });
+    if (!watcher.start()) return false;
+
+    this.watcher = watcher;
+    return true;
+  }
+
+  unwatch(): void {
+    this.watcher?.close();
+    this.watcher = null;
+  }
+
+  get isWatching(): boolean {
+    return this.watcher !== null;
+  }
+
+  /** Incremented on every file added, changed or removed */
+  get currentVersion(): number {
+    return this.version;
+  }
+
+  /** Listen for change batches. Returns an unsubscribe function. */
+  subscribe(listener: (event: CatalogChangeEvent) => void): () => void {
+    this.listeners.add(listener);
+    return () => {
+      this.listeners.delete(listener);
+    };
+  }
+
+  async getSkills(): Promise<Skill[]> {
+    await this.refresh();
+    return this.getViews().skills;
+  }
+
+  async getCommands(): Promise<Command[]> {
+    await this.refresh();
+    return this.getViews().commands;
+  }
+
+  async getAgents(): Promise<Agent[]> {
+    await this.refresh();
+    return this.getViews().agents;
+  }
+
+  async getSearchItems(): Promise<SearchableItem[]> {
+    await this.refresh();
+    return this.getViews().searchItems;
+  }
+
+  /** Full-text index over every searchable item */
+  async getSearchIndex(): Promise<SearchIndex> {
+    await this.refresh();
+    return this.searchIndex;
+  }
+
+  /** Wait until the snapshot reflects every update applied so far */
+  async flushSnapshot(): Promise<void> {
+    await this.updates;
+    while (this.snapshotWrite) {
+      await this.snapshotWrite;
+    }
+  }
+
+  /** Number of files currently indexed */
+  get size(): number {
+    return this.entries.size;
+  }
+
+  // Run catalog mutations one at a time, in call order
+  private enqueue<T>(task: () => Promise<T>): Promise<T> {
+    const result = this.updates.then(task);
+    this.updates = result.catch(() => undefined);
+    return result;
+  }
+
+  private async sync(kinds: CatalogKind[]): Promise<void> {
+    const listed = await Promise.all(
+      kinds.map(async (kind) => {
+        const files = await listSourceFiles(kind, this.projectRoot);
+        return files.map(file => ({ kind, file }));
+      })
+    );
+    const files = listed.flat();
+    const seen = new Set<string>();
+    const stale = new Map<string, IngestJob & { stat: Stats }>();
+
+    await mapWithConcurrency(files, IO_CONCURRENCY, async ({ kind, file }) => {
+      const relativePath = toRelativePath(this.projectRoot, file);
+      const stat = await this.statFile(relativePath);
+      if (!stat) return;
+      seen.add(relativePath);
+      if (!this.isFresh(kind, relativePath, stat)) {
+        stale.set(relativePath, { ...this.ingestJob(kind, relativePath), stat });
+      }
+    });
+
+    await ingest(Array.from(stale.values()), ({ relativePath, hash, parsed }) => {
+      const { kind, stat } = stale.get(relativePath)!;
+      if (parsed) {
+        this.setEntry(relativePath, { kind, mtimeMs: stat.mtimeMs, size: stat.size, hash: hash!, parsed });
+      } else if (hash) {
+        this.touchEntry(relativePath, stat);
+      } else {
+        seen.delete(relativePath);
+      }
+    }, { pool: this.parsePool });
+
+    for (const [relativePath, entry] of this.entries) {
+      if (!seen.has(relativePath) && kinds.includes(entry.kind)) {
+        this.deleteEntry(relativePath);
+      }
+    }
+  }
+
+  /** Re-parse one file if its mtime or size moved. Returns false if it is no longer a readable file. */
+  private async indexFile(kind: CatalogKind, relativePath: string): Promise<boolean> {
+    const stat = await this.statFile(relativePath);
+    if (!stat) return false;
+    if (this.isFresh(kind, relativePath, stat)) return true;
+
+    const [{ hash, parsed }] = await readAndParse([this.ingestJob(kind, relativePath)]);
+    if (!hash) return false;
+
+    if (parsed) {
+      this.setEntry(relativePath, { kind, mtimeMs: stat.mtimeMs, size: stat.size, hash, parsed });
+    } else {
+      this.touchEntry(relativePath, stat);
+    }
+    return true;
+  }
+
+  /** Job for (re)reading a file, carrying the cached hash when the file keeps its kind */
+  private ingestJob(kind: CatalogKind, relativePath: string): IngestJob {
+    const cached = this.entries.get(relativePath);
+    return {
+      kind,
+      relativePath,
+      file: path.join(this.projectRoot, relativePath),
+      hash: cached?.kind === kind ? cached.hash : undefined,
+    };
+  }
+
+  /** Stat a regular file; null when it is missing or not a file */
+  private async statFile(relativePath: string): Promise<Stats | null> {
+    try {
+      const stat = await fs.stat(path.join(this.projectRoot, relativePath));
+      return stat.isFile() ? stat : null;
+    } catch (err) {
+      if ((err as NodeJS.ErrnoException).code !== 'ENOENT') {
+        console.error(`Error indexing ${relativePath}:`, err);
+      }
+      return null;
+    }
+  }
+
+  private isFresh(kind: CatalogKind, relativePath: string, stat: Stats): boolean {
+    const cached = this.entries.get(relativePath);
+    return !!cached && cached.kind === kind && cached.mtimeMs === stat.mtimeMs && cached.size === stat.size;
+  }
+
+  private setEntry(relativePath: string, entry: CatalogEntry): void {
+    const { searchText, searchTerms, ...parsed } = entry.parsed;
+    if (parsed.searchItem) {
+      this.searchIndex.add(relativePath, parsed.searchItem, searchText ?? '', searchTerms);
+    } else {
+      this.searchIndex.remove(relativePath);
+    }
+    const action = this.entries.has(relativePath) ? 'changed' : 'added';
+    this.entries.set(relativePath, { ...entry, parsed });
+    this.version++;
+    this.snapshotDirty = true;
+    this.recordChange({ path: relativePath, kind: entry.kind, id: idOf(parsed), action });
+  }
+
+  private deleteEntry(relativePath: string): void {
+    const entry = this.entries.get(relativePath);
+    if (!entry) return;
+    this.searchIndex.remove(relativePath);
+    this.entries.delete(relativePath);
+    this.version++;
+    this.snapshotDirty = true;
+    this.recordChange({ path: relativePath, kind: entry.kind, id: idOf(entry.parsed), action: 'removed' });
+  }
+
+  /** Record a new mtime for a file whose content did not change */
+  private touchEntry(relativePath: string, stat: Stats): void {
+    const entry = this.entries.get(relativePath)!;
+    entry.mtimeMs = stat.mtimeMs;
+    entry.size = stat.size;
+    this.snapshotDirty = true;
+  }
+
+  /** Seed the catalog from the last snapshot; the following sync re-parses whatever changed since */
+  private async restoreSnapshot(): Promise<void> {
+    if (!this.snapshotPath) return;
+    const saved = await readSnapshot(this.snapshotPath);
+    if (!saved) return;
+
+    for (const { path: relativePath, kind, mtimeMs, size, hash, parsed, search } of saved) {
+      this.setEntry(relativePath, {
+        kind,
+        mtimeMs,
+        size,
+        hash,
+        parsed: { ...parsed, searchText: search?.body, searchTerms: search?.analyzed },
+      });
+    }
+    this.snapshotDirty = false;
+  }
+
+  /** Persist the catalog in the background. Writes never overlap; changes made meanwhile are saved next. */
+  private saveSnapshot(): void {
+    if (!this.snapshotPath || !this.snapshotDirty || this.snapshotWrite) return;
+    this.snapshotDirty = false;
+
+    const entries: SnapshotEntry[] = [];
+    for (const [relativePath, { kind, mtimeMs, size, hash, parsed }] of this.entries) {
+      const document = parsed.searchItem ? this.searchIndex.getDocument(relativePath) : null;
+      entries.push({
+        path: relativePath,
+        kind,
+        mtimeMs,
+        size,
+        hash,
+        parsed: { record: parsed.record, searchItem: parsed.searchItem },
+        ...(document && { search: { body: document.body, analyzed: document.analyzed } }),
+      });
+    }
+
+    this.snapshotWrite = writeSnapshot(this.snapshotPath, entries)
+      .catch((error) => console.warn('Failed to save catalog snapshot:', error))
+      .finally(() => {
+        this.snapshotWrite = null;
+        this.saveSnapshot();
+      });
+  }
+
+  private recordChange(change: CatalogChange): void {
+    // Collapse repeated changes to one file within a batch
+    const previous = this.pendingChanges.get(change.path);
+    if (previous?.action === 'added') {
+      if (change.action === 'removed') {
+        this.pendingChanges.delete(change.path);
+        return;
+      }
+      change = { ...change, action: 'added' };
+    } else if (previous?.action === 'removed' && change.action === 'added') {
+      change = { ...change, action: 'changed' };
+    }
+    this.pendingChanges.set(change.path, change);
+  }
+
+  private publish(): CatalogChange[] {
+    const changes = Array.from(this.pendingChanges.values());
+    this.pendingChanges.clear();
+    if (changes.length === 0) return changes;
+
+    const event: CatalogChangeEvent = { version: this.version, changes };
+    for (const listener of this.listeners) {
+      try {
+        listener(event);
+      } catch (error) {
+        console.error('Catalog listener failed:', error);
+      }
+    }
+    return changes;
+  }
+
+  private getViews(): CatalogViews {
+    if (this.views && this.views.version === this.version) return this.views;
+
+    const byKind = new Map<CatalogKind, ParsedFile[]>(CATALOG_KINDS.map(kind => [kind, []]));
+    const paths = Array.from(this.entries.keys()).sort();
+    for (const relativePath of paths) {
+      const entry = this.entries.get(relativePath)!;
+      byKind.get(entry.kind)!.push(entry.parsed);
+    }
+
+    const records = <T>(kind: CatalogKind) =>
+      byKind.get(kind)!.flatMap(parsed => (parsed.record ? [parsed.record as T] : []));
+
+    this.views = {
+      version: this.version,
+      skills: records<Skill>('skills').sort(byStageThenName(SKILL_STAGE_ORDER)),
+      commands: records<Command>('commands').sort(byStageThenName(COMMAND_STAGE_ORDER)),
+      agents: records<Agent>('agents').sort(byStageThenName(AGENT_STAGE_ORDER)),
+      searchItems: CATALOG_KINDS.flatMap(kind =>
+        byKind.get(kind)!.flatMap(parsed => (parsed.searchItem ? [parsed.searchItem] : []))
+      ),
+    };
+    return this.views;
+  }
+}
+
+// Kept on globalThis so every route bundle (and dev-mode hot reloads) share one instance
+const globalForCatalog = globalThis as unknown as { __claudeManualCatalogs?: Map<string, Catalog> };
+
+/** Get the shared catalog for a project root (defaults to the repository root) */
+export function getCatalog(projectRoot: string = getProjectRoot()): Catalog {
+  if (!globalForCatalog.__claudeManualCatalogs) {
+    globalForCatalog.__claudeManualCatalogs = new Map();
+  }
+  let catalog = globalForCatalog.__claudeManualCatalogs.get(projectRoot);
+  if (!catalog) {
+    catalog = new Catalog(projectRoot);
+    globalForCatalog.__claudeManualCatalogs.set(projectRoot, catalog);
+  }
+  return catalog;
+}
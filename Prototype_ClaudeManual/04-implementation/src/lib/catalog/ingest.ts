@@ -0,0 +1,107 @@
+import { createHash } from 'crypto';
+import { promises as fs } from 'fs';
+import { analyzeDocument } from '@/lib/search/searchIndex';
+import { parseCatalogFile } from './parsers';
+import type { ParsePool } from './parsePool';
+import type { CatalogKind, ParsedFile } from './types';
+
+/** Files handed to one read/parse task */
+const BATCH_SIZE = 32;
+/** Max files read at the same time when parsing on the main thread */
+const INLINE_CONCURRENCY = 64;
+/** Below this many files the cost of messaging workers outweighs the gain */
+const MIN_POOL_FILES = 256;
+
+export interface IngestJob {
+  kind: CatalogKind;
+  relativePath: string;
+  /** Absolute path to read */
+  file: string;
+  /** Content hash from the last parse; matching content is not parsed again */
+  hash?: string;
+}
+
+export interface IngestResult {
+  relativePath: string;
+  /** Content hash, or null when the file could not be read */
+  hash: string | null;
+  /** Null when the file could not be read or its content still matches `hash` */
+  parsed: ParsedFile | null;
+}
+
+export interface IngestOptions {
+  /** Worker pool for parsing; null or an unavailable pool parses on the main thread */
+  pool?: ParsePool | null;
+  batchSize?: number;
+  minPoolFiles?: number;
+}
+
+export async function mapWithConcurrency<T>(items: T[], limit: number, fn: (item: T) => Promise<void>): Promise<void> {
+  let next = 0;
+  const workers = Array.from({ length: Math.min(limit, items.length) }, async () => {
+    while (next < items.length) {
+      await fn(items[next++]);
+    }
+  });
+  await Promise.all(workers);
+}
+
+export function hashContent(content: string): string {
+  return createHash('sha1').update(content).digest('base64url');
+}
+
+/** Read, parse and tokenize one batch of files. Runs on the main thread or inside a parse worker. */
+export async function readAndParse(jobs: IngestJob[]): Promise<IngestResult[]> {
+  return Promise.all(
+    jobs.map(async ({ kind, relativePath, file, hash: previousHash }): Promise<IngestResult> => {
+      try {
+        const content = await fs.readFile(file, 'utf-8');
+        // Touched but identical (e.g. after a checkout): keep the previous parse
+        const hash = hashContent(content);
+        if (hash === previousHash) {
+          return { relativePath, hash, parsed: null };
+        }
+
+        const parsed = parseCatalogFile(kind, relativePath, content);
+        // Tokenize here too so workers take that load off the indexing thread
+        if (parsed.searchItem) {
+          parsed.searchTerms = analyzeDocument(parsed.searchItem, parsed.searchText ?? '');
+        }
+        return { relativePath, hash, parsed };
+      } catch (err) {
+        if ((err as NodeJS.ErrnoException).code !== 'ENOENT') {
+          console.error(`Error indexing ${relativePath}:`, err);
+        }
+        return { relativePath, hash: null, parsed: null };
+      }
+    })
+  );
+}
+
+/**
+ * Read and parse files in fixed-size batches, emitting one result per file as
+ * soon as its batch finishes. Large sets are spread across the worker pool;
+ * a batch the pool cannot take is parsed on the main thread instead.
+ */
+export async function ingest(
+  jobs: IngestJob[],
+  onResult: (result: IngestResult) => void,
+  options: IngestOptions = {}
+): Promise<void> {
+  const { pool = null, batchSize = BATCH_SIZE, minPoolFiles = MIN_POOL_FILES } = options;
+  const batches: IngestJob[][] = [];
+  for (let i = 0; i < jobs.length; i += batchSize) {
+    batches.push(jobs.slice(i, i + batchSize));
+  }
+
+  const usePool = pool !== null && pool.available && jobs.length >= minPoolFiles;
+  // Keep each worker busy with one batch queued behind the current one
+  const concurrency = usePool ? pool.size * 2 : Math.max(1, Math.floor(INLINE_CONCURRENCY / batchSize));
+
+  await mapWithConcurrency(batches, concurrency, async (batch) => {
+    const results = usePool && pool.available
+      ? await pool.run(batch).catch(() => readAndParse(batch))
+      : await readAndParse(batch);
+    for (const result of results) onResult(result);
+  });
+}
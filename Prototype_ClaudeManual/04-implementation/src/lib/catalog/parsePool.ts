@@ -0,0 +1,159 @@
+import os from 'os';
+import { Worker } from 'worker_threads';
+import type { IngestJob, IngestResult } from './ingest';
+
+/** Workers are shut down after this long without work */
+const IDLE_TIMEOUT_MS = 10_000;
+const MAX_POOL_SIZE = 8;
+
+export interface ParsePoolOptions {
+  /** Number of worker threads; 0 disables the pool */
+  size?: number;
+  /** Override how workers are spawned (e.g. with a prebuilt worker bundle) */
+  createWorker?: () => Worker;
+}
+
+interface Task {
+  jobs: IngestJob[];
+  resolve: (results: IngestResult[]) => void;
+  reject: (error: Error) => void;
+}
+
+interface PoolWorker {
+  worker: Worker;
+  task: Task | null;
+}
+
+/** One worker per core, leaving one for the event loop that serves requests */
+export function defaultPoolSize(): number {
+  const cores = typeof os.availableParallelism === 'function' ? os.availableParallelism() : os.cpus().length;
+  return Math.max(0, Math.min(cores - 1, MAX_POOL_SIZE));
+}
+
+function spawnParseWorker(): Worker {
+  // Written out literally so the bundler emits the worker as its own chunk
+  return new Worker(new URL('./parseWorker.ts', import.meta.url));
+}
+
+/**
+ * worker_threads pool that reads and parses batches of catalog files.
+ *
+ * Workers are started on first use and stopped when idle. If a worker fails
+ * to load or crashes, the pool marks itself unavailable and rejects pending
+ * batches so callers can parse them on the main thread.
+ */
+export class ParsePool {
+  readonly size: number;
+  private createWorker: () => Worker;
+  private workers: PoolWorker[] = [];
+  private queue: Task[] = [];
+  private idleTimer: ReturnType<typeof setTimeout> | null = null;
+  private failed = false;
+
+  constructor(options: ParsePoolOptions = {}) {
+    this.size = options.size ?? defaultPoolSize();
+    this.createWorker = options.createWorker ?? spawnParseWorker;
+  }
+
+  get available(): boolean {
+    return this.size > 0 && !this.failed;
+  }
+
+  run(jobs: IngestJob[]): Promise<IngestResult[]> {
+    if (!this.available) {
+      return Promise.reject(new Error('Parse pool is unavailable'));
+    }
+    return new Promise((resolve, reject) => {
+      this.queue.push({ jobs, resolve, reject });
+      this.dispatch();
+    });
+  }
+
+  /** Stop all workers and reject queued batches */
+  close(): void {
+    this.stop(new Error('Parse pool closed'));
+  }
+
+  private dispatch(): void {
+    if (this.idleTimer) {
+      clearTimeout(this.idleTimer);
+      this.idleTimer = null;
+    }
+
+    while (this.queue.length > 0) {
+      let idle = this.workers.find(entry => !entry.task);
+      if (!idle && this.workers.length < this.size) {
+        try {
+          idle = this.spawn();
+        } catch (error) {
+          this.fail(error as Error);
+          return;
+        }
+      }
+      if (!idle) break;
+
+      idle.task = this.queue.shift()!;
+      idle.worker.postMessage(idle.task.jobs);
+    }
+
+    if (this.workers.length > 0 && this.workers.every(entry => !entry.task)) {
+      this.idleTimer = setTimeout(() => this.stop(), IDLE_TIMEOUT_MS);
+      this.idleTimer.unref?.();
+    }
+  }
+
+  private spawn(): PoolWorker {
+    const entry: PoolWorker = { worker: this.createWorker(), task: null };
+    // Idle workers must not keep the process alive
+    entry.worker.unref();
+
+    entry.worker.on('message', (results: IngestResult[]) => {
+      const task = entry.task;
+      entry.task = null;
+      task?.resolve(results);
+      this.dispatch();
+    });
+    entry.worker.on('error', (error) => this.fail(error));
+    entry.worker.on('exit', (code) => {
+      if (this.workers.includes(entry) && code !== 0) {
+        this.fail(new Error(`Parse worker exited with code ${code}`));
+      }
+    });
+
+    this.workers.push(entry);
+    return entry;
+  }
+
+  private fail(error: Error): void {
+    if (!this.failed) {
+      console.warn('Parse workers unavailable, parsing on the main thread:', error.message);
+    }
+    this.failed = true;
+    this.stop(error);
+  }
+
+  private stop(error?: Error): void {
+    if (this.idleTimer) clearTimeout(this.idleTimer);
+    this.idleTimer = null;
+
+    const workers = this.workers;
+    const queue = this.queue;
+    this.workers = [];
+    this.queue = [];
+
+    const reason = error ?? new Error('Parse pool stopped');
+    for (const entry of workers) {
+      entry.task?.reject(reason);
+      void entry.worker.terminate();
+    }
+    for (const task of queue) task.reject(reason);
+  }
+}
+
+let sharedPool: ParsePool | null = null;
+
+/** Pool shared by every catalog in the process */
+export function getSharedParsePool(): ParsePool {
+  if (!sharedPool) sharedPool = new ParsePool();
+  return sharedPool;
+}
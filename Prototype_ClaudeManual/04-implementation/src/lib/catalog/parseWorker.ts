@@ -0,0 +1,8 @@
+import { parentPort } from 'worker_threads';
+import { readAndParse } from './ingest';
+import type { IngestJob } from './ingest';
+
+// Entry point for ParsePool workers: each message is one batch of files to read and parse
+parentPort?.on('message', async (jobs: IngestJob[]) => {
+  parentPort!.postMessage(await readAndParse(jobs));
+});
@@ -0,0 +1,402 @@
+import path from 'path';
+import {
+  extractBullets,
+  extractPurpose,
+  extractSectionPreview,
+  formatName,
+  formatSkillName,
+  parseList,
+  parseSearchFrontmatter,
+  parseSkillsSection,
+  parseYamlFrontmatter,
+  stripFrontmatter,
+  unquote,
+} from './frontmatter';
+import type { Agent, CatalogKind, Command, ParsedFile, SearchableItem, Skill } from './types';
+
+// Pure parsers: (project-relative path, file content) -> catalog records.
+// No filesystem access here so the same code can run in the route handlers,
+// a worker thread or a test.
+
+export const SKILL_STAGE_ORDER = ['Discovery', 'Prototype', 'ProductSpecs', 'SolArch', 'Implementation', 'GRC', 'Security', 'Shared', 'Utility'];
+export const COMMAND_STAGE_ORDER = ['Discovery', 'Prototype', 'ProductSpecs', 'SolArch', 'Implementation', 'GRC', 'Security', 'Traceability', 'Kaizen', 'Rules', 'Utility'];
+export const AGENT_STAGE_ORDER = ['Discovery', 'Prototype', 'ProductSpecs', 'SolArch', 'Implementation', 'Quality', 'GRC', 'Process', 'Reflexion', 'Traceability', 'Utility'];
+
+function determineSkillStage(skillName: string): string {
+  const name = skillName.toLowerCase();
+  if (name.startsWith('discovery_') || name.startsWith('discovery-')) return 'Discovery';
+  if (name.startsWith('prototype_') || name.startsWith('prototype-')) return 'Prototype';
+  if (name.startsWith('productspecs_') || name.startsWith('productspecs-')) return 'ProductSpecs';
+  if (name.startsWith('solarch_') || name.startsWith('solarch-') || name.startsWith('solutionarchitecture_')) return 'SolArch';
+  if (name.startsWith('implementation_') || name.startsWith('implementation-')) return 'Implementation';
+  if (name.startsWith('grc_')) return 'GRC';
+  if (name.startsWith('security_')) return 'Security';
+  if (name.startsWith('shared_')) return 'Shared';
+  return 'Utility';
+}
+
+function determineCommandStage(filename: string): string {
+  const name = filename.toLowerCase();
+  if (name.startsWith('discovery')) return 'Discovery';
+  if (name.startsWith('prototype')) return 'Prototype';
+  if (name.startsWith('productspecs')) return 'ProductSpecs';
+  if (name.startsWith('solarch')) return 'SolArch';
+  if (name.startsWith('htec-sdd') || name.startsWith('implementation')) return 'Implementation';
+  if (name.startsWith('grc')) return 'GRC';
+  if (name.startsWith('security')) return 'Security';
+  if (name.startsWith('kaizen')) return 'Kaizen';
+  if (name.startsWith('rules')) return 'Rules';
+  if (name.startsWith('trace') || name.startsWith('traceability')) return 'Traceability';
+  return 'Utility';
+}
+
+function determineAgentStage(filename: string): string {
+  const name = filename.toLowerCase();
+  if (name.startsWith('discovery')) return 'Discovery';
+  if (name.startsWith('prototype')) return 'Prototype';
+  if (name.startsWith('productspecs')) return 'ProductSpecs';
+  if (name.startsWith('solarch')) return 'SolArch';
+  if (name.startsWith('implementation') || name.startsWith('planning')) return 'Implementation';
+  if (name.startsWith('quality')) return 'Quality';
+  if (name.startsWith('compliance') || name.startsWith('privacy') || name.startsWith('security')) return 'GRC';
+  if (name.startsWith('process-integrity')) return 'Process';
+  if (name.startsWith('reflexion')) return 'Reflexion';
+  if (name.startsWith('trace')) return 'Traceability';
+  return 'Utility';
+}
+
+function determineSearchStage(name: string): string {
+  const lowerName = name.toLowerCase();
+  if (lowerName.startsWith('discovery')) return 'Discovery';
+  if (lowerName.startsWith('prototype')) return 'Prototype';
+  if (lowerName.startsWith('productspecs')) return 'ProductSpecs';
+  if (lowerName.startsWith('solarch') || lowerName.startsWith('solutionarchitecture')) return 'SolArch';
+  if (lowerName.startsWith('htec-sdd') || lowerName.startsWith('implementation') || lowerName.startsWith('planning')) return 'Implementation';
+  if (lowerName.startsWith('quality')) return 'Quality';
+  if (lowerName.startsWith('grc') || lowerName.startsWith('compliance') || lowerName.startsWith('privacy') || lowerName.startsWith('security')) return 'GRC';
+  if (lowerName.startsWith('process-integrity')) return 'Process';
+  if (lowerName.startsWith('reflexion')) return 'Reflexion';
+  if (lowerName.startsWith('trace') || lowerName.startsWith('traceability')) return 'Traceability';
+  if (lowerName.startsWith('kaizen')) return 'Kaizen';
+  if (lowerName.startsWith('rules')) return 'Rules';
+  return 'Utility';
+}
+
+function determineAgentColor(stage: string): string {
+  const colorMap: Record<string, string> = {
+    'Discovery': 'blue',
+    'Prototype': 'green',
+    'ProductSpecs': 'purple',
+    'SolArch': 'indigo',
+    'Implementation': 'purple',
+    'Quality': 'orange',
+    'GRC': 'red',
+    'Process': 'yellow',
+    'Reflexion': 'pink',
+    'Traceability': 'teal',
+    'Utility': 'gray'
+  };
+  return colorMap[stage] || 'gray';
+}
+
+function getContentBody(content: string): string {
+  // Truncate to first 500 chars for search preview
+  return stripFrontmatter(content).slice(0, 500).trim();
+}
+
+interface SearchItemOptions {
+  id: string;
+  /** Used when the frontmatter has no `name` */
+  fallbackName: string;
+  type: SearchableItem['type'];
+  stage: string;
+  path: string;
+  /** Used when the frontmatter has no `description`; when omitted the file must have frontmatter to be searchable */
+  defaultDescription?: string;
+}
+
+function buildSearchItem(content: string, options: SearchItemOptions): SearchableItem | undefined {
+  const frontmatter = parseSearchFrontmatter(content);
+  if (options.defaultDescription === undefined && !frontmatter.description && !frontmatter.name) return undefined;
+  const tags = Array.isArray(frontmatter.tags) ? frontmatter.tags : [];
+  return {
+    id: options.id,
+    name: frontmatter.name ? formatName(String(frontmatter.name)) : formatName(options.fallbackName),
+    description: unquote(String(frontmatter.description || options.defaultDescription || '')),
+    stage: options.stage,
+    path: options.path,
+    type: options.type,
+    tags,
+    content: getContentBody(content)
+  };
+}
+
+function parseSkill(relativePath: string, content: string): ParsedFile {
+  const skillId = path.basename(path.dirname(relativePath));
+  const { frontmatter, body, hooks } = parseYamlFrontmatter(content);
+  const skillName = frontmatter.name || skillId;
+  const description = unquote(frontmatter.description || '');
+
+  // Extract content from body
+  const purpose = extractPurpose(body, description);
+  const whenToUse = extractBullets(body, 'When to Use(?: This Skill)?');
+  const workflow = extractSectionPreview(body, 'Workflow|Execution|Process|The Method|How It Works');
+
+  // Build example from whenToUse or description
+  const example = whenToUse.length > 0
+    ? `Use when: ${whenToUse.slice(0, 3).join(', ')}`
+    : `Invoke via: /${skillName}`;
+
+  const allowedTools = parseList(frontmatter['allowed-tools']);
+  const skill: Skill = {
+    id: skillId,
+    name: formatSkillName(skillName),
+    type: 'skill',
+    description: description,
+    stage: determineSkillStage(skillId),
+    path: relativePath,
+    model: frontmatter.model || null,
+    context: frontmatter.context || null,
+    agent: frontmatter.agent || null,
+    allowed_tools: allowedTools,
+    skills_required: [],
+    frontmatter: {
+      model: frontmatter.model || null,
+      context: frontmatter.context || null,
+      agent: frontmatter.agent || null,
+      allowed_tools: allowedTools,
+      skills_required: [],
+      hooks: hooks,
+    },
+    rawContent: body,
+    content: {
+      purpose: purpose || description,
+      example: example,
+      workflow: workflow || 'See SKILL.md for detailed workflow'
+    }
+  };
+
+  return {
+    record: skill,
+    searchItem: buildSearchItem(content, {
+      id: skillId,
+      fallbackName: skillId,
+      type: 'Skill',
+      stage: determineSearchStage(skillId),
+      path: relativePath,
+    }),
+  };
+}
+
+function parseCommand(relativePath: string, content: string): ParsedFile {
+  const commandId = path.basename(relativePath).replace('.md', '');
+  const { frontmatter, frontmatterText, body, hooks } = parseYamlFrontmatter(content);
+  const searchItem = buildSearchItem(content, {
+    id: commandId,
+    fallbackName: commandId,
+    type: 'Command',
+    stage: determineSearchStage(commandId),
+    path: relativePath,
+  });
+
+  // Skip files without proper frontmatter
+  if (!frontmatter.description && !frontmatter.name) return { searchItem };
+
+  const skills = parseSkillsSection(frontmatterText);
+  const description = unquote(frontmatter.description || '');
+
+  // Extract content from body
+  const purpose = extractPurpose(body, description);
+  const usage = extractSectionPreview(body, 'Usage|Synopsis|How to Use|Quick Start');
+  const workflow = extractSectionPreview(body, 'Workflow|Execution|Process|Steps|Phases');
+
+  // Build example from argument_hint
+  const argHint = frontmatter['argument-hint'] || '';
+  const example = argHint
+    ? `/${commandId} ${argHint}`
+    : `/${commandId}`;
+
+  // Combine skills for invokes_skills (backward compatibility)
+  const allSkills = [...skills.required, ...skills.optional];
+  const allowedTools = parseList(frontmatter['allowed-tools']);
+
+  const command: Command = {
+    id: commandId,
+    name: frontmatter.name ? formatName(frontmatter.name) : formatName(commandId),
+    type: 'command',
+    description: description,
+    stage: determineCommandStage(commandId),
+    path: relativePath,
+    model: frontmatter.model || null,
+    allowed_tools: allowedTools,
+    argument_hint: frontmatter['argument-hint'] || null,
+    invokes_skills: allSkills,
+    orchestrates_agents: [],
+    frontmatter: {
+      model: frontmatter.model || null,
+      argument_hint: frontmatter['argument-hint'] || null,
+      allowed_tools: allowedTools,
+      invokes_skills: allSkills,
+      skills_required: skills.required.length > 0 ? skills.required : undefined,
+      skills_optional: skills.optional.length > 0 ? skills.optional : undefined,
+      orchestrates_agents: [],
+      hooks: hooks,
+    },
+    rawContent: body,
+    content: {
+      purpose: purpose || description,
+      example: example,
+      workflow: workflow || usage || 'See command documentation for details'
+    }
+  };
+
+  return { record: command, searchItem };
+}
+
+function parseAgent(relativePath: string, content: string): ParsedFile {
+  const agentId = path.basename(relativePath).replace('.md', '');
+  const { frontmatter, body, hooks } = parseYamlFrontmatter(content);
+  const searchItem = buildSearchItem(content, {
+    id: agentId,
+    fallbackName: agentId,
+    type: 'Agent',
+    stage: determineSearchStage(agentId),
+    path: relativePath,
+  });
+
+  // Skip files without proper frontmatter
+  if (!frontmatter.description && !frontmatter.name) return { searchItem };
+
+  const description = unquote(frontmatter.description || '');
+  const stage = determineAgentStage(agentId);
+
+  // Extract content from body
+  const purpose = extractPurpose(body, description);
+  const capabilities = extractBullets(body, 'Capabilities|Features|What It Does|Responsibilities');
+  const workflow = extractSectionPreview(body, 'Workflow|Execution|Process|How It Works');
+
+  // Build example from capabilities or stage
+  const example = capabilities.length > 0
+    ? `Capabilities: ${capabilities.slice(0, 3).join(', ')}`
+    : `Spawned during ${stage} stage`;
+
+  const agent: Agent = {
+    id: agentId,
+    name: frontmatter.name ? formatName(frontmatter.name) : formatName(agentId),
+    type: 'agent',
+    description: description,
+    model: frontmatter.model || 'sonnet',
+    checkpoint: null,
+    path: relativePath,
+    tools: parseList(frontmatter['allowed-tools']),
+    color: determineAgentColor(stage),
+    stage: stage,
+    loads_skills: [],
+    spawned_by: [],
+    frontmatter: {
+      model: frontmatter.model || 'sonnet',
+      checkpoint: null,
+      color: determineAgentColor(stage),
+      loads_skills: [],
+      spawned_by: [],
+      hooks: hooks,
+    },
+    rawContent: body,
+    content: {
+      purpose: purpose || description,
+      example: example,
+      workflow: workflow || 'See agent documentation for detailed workflow'
+    }
+  };
+
+  return { record: agent, searchItem };
+}
+
+function parseHook(relativePath: string, content: string): ParsedFile {
+  const hookId = path.basename(relativePath).replace('.py', '');
+
+  // Extract docstring or first comment
+  let description = '';
+  const docstringMatch = content.match(/^"""([\s\S]*?)"""/m) || content.match(/^'''([\s\S]*?)'''/m);
+  if (docstringMatch) {
+    description = docstringMatch[1].trim().split('\n')[0];
+  } else {
+    const commentMatch = content.match(/^#\s*(.+)$/m);
+    if (commentMatch) {
+      description = commentMatch[1].trim();
+    }
+  }
+
+  return {
+    searchItem: {
+      id: hookId,
+      name: formatName(hookId),
+      description: description || `Python hook: ${hookId}`,
+      stage: determineSearchStage(hookId),
+      path: relativePath,
+      type: 'Hook',
+      tags: [],
+      content: content.slice(0, 500)
+    }
+  };
+}
+
+function parseWorkflow(relativePath: string, content: string): ParsedFile {
+  const fileName = path.basename(relativePath, '.md');
+  const parentDir = path.basename(path.dirname(relativePath));
+  return {
+    searchItem: buildSearchItem(content, {
+      id: `workflow-${fileName}`,
+      fallbackName: fileName,
+      type: 'Workflow',
+      stage: determineSearchStage(parentDir),
+      path: relativePath,
+      defaultDescription: `Workflow: ${fileName}`,
+    }),
+  };
+}
+
+function parseArchitectureDoc(relativePath: string, content: string): ParsedFile {
+  const fileName = path.basename(relativePath, '.md');
+  const parentDir = path.basename(path.dirname(relativePath));
+  return {
+    searchItem: buildSearchItem(content, {
+      id: `arch-${fileName}`,
+      fallbackName: fileName,
+      type: 'Architecture',
+      stage: parentDir === 'architecture' ? 'Utility' : determineSearchStage(parentDir),
+      path: relativePath,
+      defaultDescription: `Architecture doc: ${fileName}`,
+    }),
+  };
+}
+
+const PARSERS: Record<CatalogKind, (relativePath: string, content: string) => ParsedFile> = {
+  skills: parseSkill,
+  commands: parseCommand,
+  agents: parseAgent,
+  hooks: parseHook,
+  workflows: parseWorkflow,
+  architecture: parseArchitectureDoc,
+};
+
+/**
+ * Parse one catalog file.
+ * @param relativePath Path relative to the project root, using forward slashes
+ */
+export function parseCatalogFile(kind: CatalogKind, relativePath: string, content: string): ParsedFile {
+  const parsed = PARSERS[kind](relativePath, content);
+  if (parsed.searchItem) {
+    parsed.searchText = kind === 'hooks' ? content : stripFrontmatter(content);
+  }
+  return parsed;
+}
+
+/** Sort comparator: stage order first, then name */
+export function byStageThenName(stageOrder: string[]) {
+  return (a: { stage: string; name: string }, b: { stage: string; name: string }): number => {
+    const stageCompare = stageOrder.indexOf(a.stage) - stageOrder.indexOf(b.stage);
+    if (stageCompare !== 0) return stageCompare;
+    return a.name.localeCompare(b.name);
+  };
+}
@@ -0,0 +1,70 @@
+import { createHash } from 'crypto';
+import { promises as fs } from 'fs';
+import path from 'path';
+import { promisify } from 'util';
+import { gunzip, gzip } from 'zlib';
+import type { AnalyzedDocument } from '@/lib/search/searchIndex';
+import type { CatalogKind, ParsedFile } from './types';
+
+const gzipAsync = promisify(gzip);
+const gunzipAsync = promisify(gunzip);
+
+/**
+ * Bump whenever parsers, record shapes or tokenization change:
+ * a snapshot with any other version is ignored and rebuilt from source.
+ */
+export const SNAPSHOT_VERSION = 2;
+
+export const SNAPSHOT_FILE = 'claude_manual_catalog.json.gz';
+
+export interface SnapshotEntry {
+  /** Project-relative path */
+  path: string;
+  kind: CatalogKind;
+  mtimeMs: number;
+  size: number;
+  hash: string;
+  parsed: Pick<ParsedFile, 'record' | 'searchItem'>;
+  /** Indexed search document, present when the file is searchable */
+  search?: { body: string; analyzed: AnalyzedDocument };
+}
+
+interface SnapshotFile {
+  version: number;
+  savedAt: string;
+  entries: SnapshotEntry[];
+}
+
+/**
+ * Where the catalog snapshot for a project lives: the app's own build cache
+ * (`.next/cache/`, gitignored), keyed by project root, never the project's tracked `_state/`
+ */
+export function defaultSnapshotPath(projectRoot: string, cacheDir = path.join(process.cwd(), '.next', 'cache')): string {
+  const rootKey = createHash('sha1').update(path.resolve(projectRoot)).digest('hex').slice(0, 12);
+  return path.join(cacheDir, 'claude-manual', `${rootKey}-${SNAPSHOT_FILE}`);
+}
+
+/** Load a snapshot. Returns null when it is missing, unreadable or from another schema version. */
+export async function readSnapshot(file: string): Promise<SnapshotEntry[] | null> {
+  try {
+    const data = JSON.parse((await gunzipAsync(await fs.readFile(file))).toString('utf-8')) as SnapshotFile;
+    if (data.version !== SNAPSHOT_VERSION || !Array.isArray(data.entries)) return null;
+    return data.entries;
+  } catch (err) {
+    if ((err as NodeJS.ErrnoException).code !== 'ENOENT') {
+      console.warn(`Ignoring unreadable catalog snapshot ${file}:`, (err as Error).message);
+    }
+    return null;
+  }
+}
+
+/** Write a snapshot atomically (temp file + rename) so readers never see a partial file */
+export async function writeSnapshot(file: string, entries: SnapshotEntry[]): Promise<void> {
+  const data: SnapshotFile = { version: SNAPSHOT_VERSION, savedAt: new Date().toISOString(), entries };
+  const compressed = await gzipAsync(JSON.stringify(data));
+
+  await fs.mkdir(path.dirname(file), { recursive: true });
+  const tempFile = `${file}.${process.pid}.tmp`;
+  await fs.writeFile(tempFile, compressed);
+  await fs.rename(tempFile, file);
+}
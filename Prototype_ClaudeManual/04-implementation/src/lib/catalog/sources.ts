@@ -0,0 +1,114 @@
+import { promises as fs } from 'fs';
+import path from 'path';
+import type { CatalogKind } from './types';
+
+// Where each catalog kind lives under `.claude/` and which files belong to it.
+
+export const SOURCE_DIRS: Record<CatalogKind, string> = {
+  skills: '.claude/skills',
+  commands: '.claude/commands',
+  agents: '.claude/agents',
+  hooks: '.claude/hooks',
+  workflows: '.claude/architecture/Workflows',
+  architecture: '.claude/architecture',
+};
+
+/**
+ * Resolve the project root that contains `.claude/`.
+ * 04-implementation -> Prototype_ClaudeManual -> claudeManual (2 levels up)
+ */
+export function getProjectRoot(): string {
+  return path.resolve(process.cwd(), '../..');
+}
+
+export function toRelativePath(projectRoot: string, absolutePath: string): string {
+  return path.relative(projectRoot, absolutePath).replace(/\\/g, '/');
+}
+
+/** Decide which catalog kind a project-relative path belongs to, if any */
+export function classifyPath(relativePath: string): CatalogKind | null {
+  const parts = relativePath.split('/');
+  if (parts[0] !== '.claude' || parts.length < 3) return null;
+  const fileName = parts[parts.length - 1];
+
+  switch (parts[1]) {
+    case 'skills':
+      return parts.length === 4 && fileName === 'SKILL.md' ? 'skills' : null;
+    case 'commands':
+      // Skip reference files and backup files
+      return parts.length === 3 && fileName.endsWith('.md') && !fileName.includes('REFERENCE') ? 'commands' : null;
+    case 'agents':
+      // Skip README and registry files
+      return parts.length === 3 && fileName.endsWith('.md') && fileName !== 'README.md' && !fileName.includes('REGISTRY') ? 'agents' : null;
+    case 'hooks':
+      return parts.length === 3 && fileName.endsWith('.py') ? 'hooks' : null;
+    case 'architecture':
+      if (!fileName.endsWith('.md')) return null;
+      return parts[2] === 'Workflows' ? 'workflows' : 'architecture';
+    default:
+      return null;
+  }
+}
+
+/** Kinds whose source directory contains, or sits inside, a project-relative path */
+export function kindsForPath(relativePath: string): CatalogKind[] {
+  const target = relativePath.replace(/\/+$/, '');
+  return (Object.keys(SOURCE_DIRS) as CatalogKind[]).filter((kind) => {
+    const dir = SOURCE_DIRS[kind];
+    return target === dir || target.startsWith(`${dir}/`) || dir.startsWith(`${target}/`);
+  });
+}
+
+async function readDirSafe(dir: string) {
+  try {
+    return await fs.readdir(dir, { withFileTypes: true });
+  } catch {
+    return [];
+  }
+}
+
+async function listMarkdownRecursive(dir: string, skipDir?: string): Promise<string[]> {
+  const results: string[] = [];
+  const entries = await readDirSafe(dir);
+  const nested = await Promise.all(
+    entries.map(async (entry) => {
+      const fullPath = path.join(dir, entry.name);
+      if (entry.isDirectory()) {
+        if (fullPath === skipDir) return [];
+        return listMarkdownRecursive(fullPath, skipDir);
+      }
+      if (entry.isFile() && entry.name.endsWith('.md')) {
+        results.push(fullPath);
+      }
+      return [];
+    })
+  );
+  for (const files of nested) results.push(...files);
+  return results;
+}
+
+/** List the absolute paths of every file that belongs to a catalog kind */
+export async function listSourceFiles(kind: CatalogKind, projectRoot: string): Promise<string[]> {
+  const dir = path.join(projectRoot, SOURCE_DIRS[kind]);
+
+  switch (kind) {
+    case 'skills': {
+      const entries = await readDirSafe(dir);
+      return entries
+        .filter(entry => entry.isDirectory())
+        .map(entry => path.join(dir, entry.name, 'SKILL.md'));
+    }
+    case 'workflows':
+      return listMarkdownRecursive(dir);
+    case 'architecture':
+      // Workflows have their own source
+      return listMarkdownRecursive(dir, path.join(projectRoot, SOURCE_DIRS.workflows));
+    default: {
+      const entries = await readDirSafe(dir);
+      return entries
+        .filter(entry => !entry.isDirectory())
+        .map(entry => path.join(dir, entry.name))
+        .filter(fullPath => classifyPath(toRelativePath(projectRoot, fullPath)) === kind);
+    }
+  }
+}
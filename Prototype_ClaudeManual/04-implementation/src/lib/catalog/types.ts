@@ -0,0 +1,136 @@
+import type { AnalyzedDocument } from '@/lib/search/searchIndex';
+import type { ParsedHooks } from './frontmatter';
+
+export type CatalogKind = 'skills' | 'commands' | 'agents' | 'hooks' | 'workflows' | 'architecture';
+
+export const CATALOG_KINDS: CatalogKind[] = ['skills', 'commands', 'agents', 'hooks', 'workflows', 'architecture'];
+
+export interface ItemContent {
+  purpose: string;
+  example: string;
+  workflow: string;
+}
+
+export interface SkillFrontmatter {
+  model?: string | null;
+  context?: string | null;
+  agent?: string | null;
+  allowed_tools?: string[];
+  skills_required?: string[];
+  hooks?: ParsedHooks;
+  [key: string]: unknown;
+}
+
+export interface Skill {
+  id: string;
+  name: string;
+  type: 'skill';
+  description: string;
+  stage: string;
+  path: string;
+  model: string | null;
+  context: string | null;
+  agent: string | null;
+  allowed_tools: string[];
+  skills_required: string[];
+  frontmatter: SkillFrontmatter;
+  rawContent: string;
+  content: ItemContent;
+}
+
+export interface CommandFrontmatter {
+  model?: string | null;
+  argument_hint?: string | null;
+  allowed_tools?: string[];
+  invokes_skills?: string[];
+  skills_required?: string[];
+  skills_optional?: string[];
+  orchestrates_agents?: string[];
+  hooks?: ParsedHooks;
+  [key: string]: unknown;
+}
+
+export interface Command {
+  id: string;
+  name: string;
+  type: 'command';
+  description: string;
+  stage: string;
+  path: string;
+  model: string | null;
+  allowed_tools: string[];
+  argument_hint: string | null;
+  invokes_skills: string[];
+  orchestrates_agents: string[];
+  frontmatter: CommandFrontmatter;
+  rawContent: string;
+  content: ItemContent;
+}
+
+export interface AgentFrontmatter {
+  model?: string | null;
+  checkpoint?: number | null;
+  color?: string;
+  loads_skills?: string[];
+  spawned_by?: string[];
+  hooks?: ParsedHooks;
+  [key: string]: unknown;
+}
+
+export interface Agent {
+  id: string;
+  name: string;
+  type: 'agent';
+  description: string;
+  model: string | null;
+  checkpoint: number | null;
+  path: string;
+  tools: string[];
+  color: string;
+  stage: string;
+  loads_skills: string[];
+  spawned_by: string[];
+  frontmatter: AgentFrontmatter;
+  rawContent: string;
+  content: ItemContent;
+}
+
+export interface SearchableItem {
+  id: string;
+  name: string;
+  description: string;
+  stage: string;
+  path: string;
+  type: 'Skill' | 'Command' | 'Agent' | 'Hook' | 'Workflow' | 'Architecture';
+  tags?: string[];
+  content?: string;
+}
+
+/** Everything the catalog derives from a single file */
+export interface ParsedFile {
+  /** Full record served by /api/skills, /api/commands or /api/agents */
+  record?: Skill | Command | Agent;
+  /** Projection served by /api/search (absent when the file is not searchable) */
+  searchItem?: SearchableItem;
+  /** Full document text for the search index (not kept after indexing) */
+  searchText?: string;
+  /** Search fields tokenized ahead of indexing (not kept after indexing) */
+  searchTerms?: AnalyzedDocument;
+}
+
+/** One catalog file that was added, edited or deleted */
+export interface CatalogChange {
+  /** Project-relative path, e.g. `.claude/skills/Discovery_JTBD/SKILL.md` */
+  path: string;
+  kind: CatalogKind;
+  /** Id of the record or search item the file produces */
+  id: string | null;
+  action: 'added' | 'changed' | 'removed';
+}
+
+/** A batch of changes applied to the catalog together */
+export interface CatalogChangeEvent {
+  /** Catalog version after the batch was applied */
+  version: number;
+  changes: CatalogChange[];
+}
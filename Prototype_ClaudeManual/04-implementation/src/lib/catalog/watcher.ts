@@ -0,0 +1,110 @@
+import { watch } from 'fs';
+import type { FSWatcher } from 'fs';
+import path from 'path';
+
+// Directories watched recursively (Workflows live under architecture)
+export const WATCHED_DIRS = [
+  '.claude/skills',
+  '.claude/commands',
+  '.claude/agents',
+  '.claude/hooks',
+  '.claude/architecture',
+];
+
+/** Quiet period before a batch of events is flushed */
+const DEBOUNCE_MS = 100;
+/** Longest a batch waits while events keep arriving */
+const MAX_WAIT_MS = 1000;
+
+export interface CatalogWatcherOptions {
+  /** Project-relative directories to watch (default: the catalog sources) */
+  dirs?: string[];
+  /** Called with the distinct project-relative paths touched since the last flush */
+  onChange: (paths: string[]) => void;
+  /** Called when a watcher dies; the caller should fall back to rescanning */
+  onError?: (error: Error) => void;
+  debounceMs?: number;
+  maxWaitMs?: number;
+}
+
+/**
+ * Recursive fs watcher over the catalog sources (or any other project directories).
+ *
+ * Editors tend to emit several events per save (write, rename, chmod), so
+ * events are collected into a set of paths and flushed once things go quiet.
+ */
+export class CatalogWatcher {
+  readonly projectRoot: string;
+  private options: CatalogWatcherOptions;
+  private watchers: FSWatcher[] = [];
+  private pending = new Set<string>();
+  private firstPendingAt = 0;
+  private timer: ReturnType<typeof setTimeout> | null = null;
+
+  constructor(projectRoot: string, options: CatalogWatcherOptions) {
+    this.projectRoot = projectRoot;
+    this.options = options;
+  }
+
+  /**
+   * Start watching every directory. Returns false (and watches nothing)
+   * when one of them is missing or the platform lacks recursive fs.watch.
+   */
+  start(): boolean {
+    for (const dir of this.options.dirs ?? WATCHED_DIRS) {
+      try {
+        const watcher = watch(path.join(this.projectRoot, dir), { recursive: true }, (_event, fileName) => {
+          // A missing file name means "something in here changed"
+          this.enqueue(fileName ? `${dir}/${fileName.toString().replace(/\\/g, '/')}` : dir);
+        });
+        watcher.on('error', (error) => this.fail(error));
+        this.watchers.push(watcher);
+      } catch {
+        this.close();
+        return false;
+      }
+    }
+    return true;
+  }
+
+  /** Deliver pending events now instead of waiting for the debounce */
+  flush(): void {
+    if (this.timer) {
+      clearTimeout(this.timer);
+      this.timer = null;
+    }
+    if (this.pending.size === 0) return;
+
+    const paths = Array.from(this.pending);
+    this.pending.clear();
+    this.options.onChange(paths);
+  }
+
+  close(): void {
+    for (const watcher of this.watchers) watcher.close();
+    this.watchers = [];
+    if (this.timer) clearTimeout(this.timer);
+    this.timer = null;
+    this.pending.clear();
+  }
+
+  private enqueue(relativePath: string): void {
+    const now = Date.now();
+    if (this.pending.size === 0) this.firstPendingAt = now;
+    this.pending.add(relativePath);
+
+    const debounceMs = this.options.debounceMs ?? DEBOUNCE_MS;
+    const maxWaitMs = this.options.maxWaitMs ?? MAX_WAIT_MS;
+    const delay = Math.max(0, Math.min(debounceMs, this.firstPendingAt + maxWaitMs - now));
+
+    if (this.timer) clearTimeout(this.timer);
+    this.timer = setTimeout(() => this.flush(), delay);
+    // Never keep the process alive just to deliver events
+    this.timer.unref?.();
+  }
+
+  private fail(error: Error): void {
+    this.close();
+    this.options.onError?.(error);
+  }
+}
@@ -0,0 +1,380 @@
+import { createHash } from 'crypto';
+import { promises as fs } from 'fs';
+import type { Dirent } from 'fs';
+import path from 'path';
+import { NextResponse } from 'next/server';
+import type { NextRequest } from 'next/server';
+
+// Folder-by-folder listing of a markdown documentation tree (architecture, workflows).
+
+/** One file or folder, flat: children are listed separately */
+export interface DocTreeNode {
+  /** Path relative to the tree root, with forward slashes */
+  path: string;
+  name: string;
+  type: 'file' | 'folder';
+  /** Path of the containing folder ('' at the root) */
+  parent: string;
+  /** Folders only: markdown files and subfolders directly inside */
+  childCount?: number;
+}
+
+export interface DocTreeOptions {
+  /** Leave out folders without a markdown file anywhere below them (child counts exclude them too) */
+  skipEmptyFolders?: boolean;
+}
+
+export interface DocTreeLevel {
+  nodes: DocTreeNode[];
+  /** Changes whenever the listing (or a child count) would change */
+  version: string;
+}
+
+// Lines per chunk when streaming NDJSON
+const NDJSON_BATCH = 64;
+
+interface TreeState {
+  /** Tree-relative folder path -> mtime (a folder's mtime moves when entries are added, removed or renamed) */
+  folders: Map<string, number>;
+  version: string;
+}
+
+const treeStates = new Map<string, TreeState>();
+
+function joinTreePath(parent: string, name: string): string {
+  return parent ? `${parent}/${name}` : name;
+}
+
+function hashVersion(basePath: string, parts: string[]): string {
+  return createHash('sha1').update(basePath).update('\n').update(parts.sort().join('\n')).digest('base64url');
+}
+
+/** Markdown files and folders in a directory, sorted by name; empty when it cannot be read */
+async function readEntries(dirPath: string): Promise<Dirent[]> {
+  try {
+    const entries = await fs.readdir(dirPath, { withFileTypes: true });
+    return entries
+      .filter(entry => entry.isDirectory() || (entry.isFile() && entry.name.endsWith('.md')))
+      .sort((a, b) => (a.name < b.name ? -1 : a.name > b.name ? 1 : 0));
+  } catch (error) {
+    console.error(`Error scanning directory ${dirPath}:`, error);
+    return [];
+  }
+}
+
+type MarkdownCheck = (folder: string) => Promise<boolean>;
+
+// Whether a folder has a markdown file anywhere below it, memoized for one listing.
+// Folders read along the way are added to `visited` so a listing version covers them.
+function markdownCheck(basePath: string, visited?: string[]): MarkdownCheck {
+  const results = new Map<string, Promise<boolean>>();
+  const check = (folder: string): Promise<boolean> => {
+    let result = results.get(folder);
+    if (!result) {
+      result = (async () => {
+        const dirPath = path.join(basePath, folder);
+        if (visited) visited.push(`${folder}:${(await fs.stat(dirPath)).mtimeMs}`);
+        const entries = await readEntries(dirPath);
+        if (entries.some(entry => !entry.isDirectory())) return true;
+        for (const entry of entries) {
+          if (await check(joinTreePath(folder, entry.name))) return true;
+        }
+        return false;
+      })();
+      results.set(folder, result);
+    }
+    return result;
+  };
+  return check;
+}
+
+// Entries of `folder` that are listed: all of them, or only files and non-empty folders
+async function countListed(folder: string, entries: Dirent[], check: MarkdownCheck | null): Promise<number> {
+  if (!check) return entries.length;
+  const listed = await Promise.all(
+    entries.map(entry => !entry.isDirectory() || check(joinTreePath(folder, entry.name)))
+  );
+  return listed.filter(Boolean).length;
+}
+
+/** Resolve a tree-relative path, or null when it points outside the tree */
+export function resolveTreePath(basePath: string, relativePath: string): string | null {
+  const root = path.resolve(basePath);
+  const resolved = path.resolve(root, relativePath);
+  return resolved === root || resolved.startsWith(root + path.sep) ? resolved : null;
+}
+
+/** List one folder, with a child count for each subfolder so clients know what is expandable */
+export async function listTreeLevel(basePath: string, folder: string, options: DocTreeOptions = {}): Promise<DocTreeLevel> {
+  const dirPath = path.join(basePath, folder);
+  const [stat, entries] = await Promise.all([fs.stat(dirPath), readEntries(dirPath)]);
+  const parts = [`${folder}:${stat.mtimeMs}`];
+  const check = options.skipEmptyFolders ? markdownCheck(basePath, parts) : null;
+
+  const nodes = await Promise.all(
+    entries.map(async (entry): Promise<DocTreeNode> => {
+      const nodePath = joinTreePath(folder, entry.name);
+      if (!entry.isDirectory()) {
+        return { path: nodePath, name: entry.name, type: 'file', parent: folder };
+      }
+
+      const childPath = path.join(dirPath, entry.name);
+      const [childStat, children] = await Promise.all([fs.stat(childPath), readEntries(childPath)]);
+      parts.push(`${nodePath}:${childStat.mtimeMs}`);
+      const childCount = await countListed(nodePath, children, check);
+      return { path: nodePath, name: entry.name, type: 'folder', parent: folder, childCount };
+    })
+  );
+
+  return {
+    nodes: check ? nodes.filter(node => node.type === 'file' || node.childCount! > 0) : nodes,
+    version: hashVersion(basePath, parts),
+  };
+}
+
+async function collectFolders(basePath: string, folder: string, folders: Map<string, number>): Promise<void> {
+  const dirPath = path.join(basePath, folder);
+  const [stat, entries] = await Promise.all([fs.stat(dirPath), readEntries(dirPath)]);
+  folders.set(folder, stat.mtimeMs);
+  await Promise.all(
+    entries
+      .filter(entry => entry.isDirectory())
+      .map(entry => collectFolders(basePath, joinTreePath(folder, entry.name), folders))
+  );
+}
+
+async function foldersUnchanged(basePath: string, folders: Map<string, number>): Promise<boolean> {
+  const checks = await Promise.all(
+    Array.from(folders, async ([folder, mtimeMs]) => {
+      const stat = await fs.stat(path.join(basePath, folder)).catch(() => null);
+      return stat?.mtimeMs === mtimeMs;
+    })
+  );
+  return checks.every(Boolean);
+}
+
+/**
+ * Version of the whole tree's listing. Once computed, checking it again only
+ * stats the known folders; the tree is rescanned when one of them moved.
+ */
+export async function getTreeVersion(basePath: string): Promise<string> {
+  const cached = treeStates.get(basePath);
+  if (cached && (await foldersUnchanged(basePath, cached.folders))) {
+    return cached.version;
+  }
+
+  const folders = new Map<string, number>();
+  try {
+    await collectFolders(basePath, '', folders);
+  } catch (error) {
+    if ((error as NodeJS.ErrnoException).code !== 'ENOENT') throw error;
+    // A missing tree lists as empty until it appears
+    treeStates.delete(basePath);
+    return hashVersion(basePath, []);
+  }
+
+  const version = hashVersion(basePath, Array.from(folders, ([folder, mtimeMs]) => `${folder}:${mtimeMs}`));
+  treeStates.set(basePath, { folders, version });
+  return version;
+}
+
+async function* walkEntries(
+  basePath: string,
+  folder: string,
+  entries: Dirent[],
+  check: MarkdownCheck | null
+): AsyncGenerator<DocTreeNode> {
+  for (const entry of entries) {
+    const nodePath = joinTreePath(folder, entry.name);
+    if (!entry.isDirectory()) {
+      yield { path: nodePath, name: entry.name, type: 'file', parent: folder };
+      continue;
+    }
+
+    const children = await readEntries(path.join(basePath, nodePath));
+    const childCount = await countListed(nodePath, children, check);
+    if (check && childCount === 0) continue;
+    yield { path: nodePath, name: entry.name, type: 'folder', parent: folder, childCount };
+    yield* walkEntries(basePath, nodePath, children, check);
+  }
+}
+
+/** Every node in the tree, depth first, parents before their children */
+export async function* walkTree(basePath: string, options: DocTreeOptions = {}): AsyncGenerator<DocTreeNode> {
+  const check = options.skipEmptyFolders ? markdownCheck(basePath) : null;
+  yield* walkEntries(basePath, '', await readEntries(basePath), check);
+}
+
+/** Weak ETag for a listing version; `variant` keeps different representations apart */
+export function toETag(version: string, variant: string): string {
+  return `W/"${version}-${variant}"`;
+}
+
+/** Whether an If-None-Match header matches `etag` (weak comparison) */
+export function matchesETag(ifNoneMatch: string | null, etag: string): boolean {
+  if (!ifNoneMatch) return false;
+  const strip = (tag: string) => tag.trim().replace(/^W\//, '');
+  const target = strip(etag);
+  return ifNoneMatch.split(',').some(tag => tag.trim() === '*' || strip(tag) === target);
+}
+
+/** Stream values as newline-delimited JSON, pulling from `items` only as fast as the client reads */
+export function toNDJSONStream<T>(items: AsyncIterable<T>): ReadableStream<Uint8Array> {
+  const encoder = new TextEncoder();
+  const iterator = items[Symbol.asyncIterator]();
+
+  return new ReadableStream<Uint8Array>({
+    async pull(controller) {
+      let chunk = '';
+      for (let i = 0; i < NDJSON_BATCH; i++) {
+        const { done, value } = await iterator.next();
+        if (done) {
+          if (chunk) controller.enqueue(encoder.encode(chunk));
+          controller.close();
+          return;
+        }
+        chunk += `${JSON.stringify(value)}\n`;
+      }
+      controller.enqueue(encoder.encode(chunk));
+    },
+    async cancel() {
+      await iterator.return?.(undefined);
+    },
+  });
+}
+
+/** What the tree routes' items share; the rest of each item is up to the route */
+export interface DocTreeItem {
+  path: string;
+  type: 'file' | 'folder';
+  /** Containing folder ('' at the root), in per-folder and streamed listings */
+  parent?: string;
+  /** Folders in per-folder and streamed listings: entries directly inside */
+  childCount?: number;
+  /** Folders in the nested listing */
+  children?: DocTreeItem[];
+}
+
+export interface DocTreeRoute<T extends DocTreeItem> extends DocTreeOptions {
+  /** Query parameter overriding the project-relative tree location; listings echo it under this name */
+  pathParam: string;
+  defaultPath: string;
+  /** Names the tree in logs and error messages, e.g. 'architecture' */
+  label: string;
+  /** Shape a listed node for the client */
+  toItem: (basePath: string, node: DocTreeNode) => T;
+  /** Shape a file requested with ?file= for the client */
+  toContent: (file: string, filePath: string, content: string) => object;
+}
+
+// Nest the flat listing; parents come before their children
+async function nestTree<T extends DocTreeItem>(basePath: string, route: DocTreeRoute<T>): Promise<T[]> {
+  const root: DocTreeItem[] = [];
+  const folders = new Map<string, DocTreeItem[]>([['', root]]);
+
+  for await (const node of walkTree(basePath, route)) {
+    const item: DocTreeItem = route.toItem(basePath, node);
+    delete item.parent;
+    delete item.childCount;
+    if (item.type === 'folder') {
+      item.children = [];
+      folders.set(item.path, item.children);
+    }
+    folders.get(node.parent)!.push(item);
+  }
+  return root as T[];
+}
+
+async function* streamTree<T extends DocTreeItem>(basePath: string, route: DocTreeRoute<T>): AsyncGenerator<T> {
+  for await (const node of walkTree(basePath, route)) {
+    yield route.toItem(basePath, node);
+  }
+}
+
+/**
+ * GET handler shared by the documentation tree routes:
+ *   ?file=<path> - One file's content
+ *   ?parent=<folder> - One folder level with child counts (parent= for the root)
+ *   ?format=ndjson - The full flat listing, streamed one item per line
+ *   otherwise - The full listing nested into folders
+ * Listings carry an ETag; a matching If-None-Match returns 304.
+ */
+export async function serveDocTree<T extends DocTreeItem>(
+  request: NextRequest,
+  projectRoot: string,
+  route: DocTreeRoute<T>
+): Promise<NextResponse> {
+  const searchParams = request.nextUrl.searchParams;
+  const treePath = searchParams.get(route.pathParam) || route.defaultPath;
+  const absolutePath = path.resolve(projectRoot, treePath);
+  const paths = { [route.pathParam]: treePath, defaultPath: route.defaultPath };
+
+  const fileParam = searchParams.get('file');
+  if (fileParam) {
+    const filePath = resolveTreePath(absolutePath, fileParam);
+    if (!filePath) {
+      return NextResponse.json({ error: 'Invalid file path' }, { status: 400 });
+    }
+    try {
+      const content = await fs.readFile(filePath, 'utf-8');
+      return NextResponse.json(route.toContent(fileParam, filePath, content));
+    } catch (error) {
+      console.error('Error reading file:', error);
+      return NextResponse.json({ error: 'File not found' }, { status: 404 });
+    }
+  }
+
+  const ifNoneMatch = request.headers.get('if-none-match');
+  const cacheHeaders = (etag: string) => ({ ETag: etag, 'Cache-Control': 'no-cache' });
+
+  const parentParam = searchParams.get('parent');
+  if (parentParam !== null) {
+    const folderPath = resolveTreePath(absolutePath, parentParam);
+    if (!folderPath) {
+      return NextResponse.json({ error: 'Invalid folder path' }, { status: 400 });
+    }
+
+    try {
+      const parent = path.relative(absolutePath, folderPath).replace(/\\/g, '/');
+      const level = await listTreeLevel(absolutePath, parent, route);
+      const etag = toETag(level.version, 'level');
+      if (matchesETag(ifNoneMatch, etag)) {
+        return new NextResponse(null, { status: 304, headers: cacheHeaders(etag) });
+      }
+
+      return NextResponse.json({
+        ...paths,
+        parent,
+        items: level.nodes.map(node => route.toItem(absolutePath, node)),
+      }, { headers: cacheHeaders(etag) });
+    } catch (error) {
+      console.error(`Error listing ${route.label} folder:`, error);
+      return NextResponse.json({ error: 'Folder not found' }, { status: 404 });
+    }
+  }
+
+  try {
+    const streaming = searchParams.get('format') === 'ndjson';
+    const etag = toETag(await getTreeVersion(absolutePath), streaming ? 'ndjson' : 'tree');
+    if (matchesETag(ifNoneMatch, etag)) {
+      return new NextResponse(null, { status: 304, headers: cacheHeaders(etag) });
+    }
+
+    if (streaming) {
+      return new NextResponse(toNDJSONStream(streamTree(absolutePath, route)), {
+        headers: { ...cacheHeaders(etag), 'Content-Type': 'application/x-ndjson; charset=utf-8' },
+      });
+    }
+
+    return NextResponse.json({
+      ...paths,
+      items: await nestTree(absolutePath, route),
+    }, { headers: cacheHeaders(etag) });
+  } catch (error) {
+    console.error(`Error scanning ${route.label}:`, error);
+    return NextResponse.json({
+      error: `Failed to scan ${route.label} directory`,
+      [route.pathParam]: treePath,
+    }, { status: 500 });
+  }
+}
@@ -0,0 +1,238 @@
+import { createHash } from 'crypto';
+import hljs from 'highlight.js';
+import { Marked } from 'marked';
+import type { Token, Tokens } from 'marked';
+
+// Server-side markdown rendering for the file viewer: sanitized HTML plus a
+// table of contents, cached by content hash so a large doc is parsed once
+// rather than on every open in the browser.
+
+/** A run of HTML, or a Mermaid diagram the client renders itself */
+export type RenderedBlock =
+  | { type: 'html'; html: string }
+  | { type: 'mermaid'; code: string };
+
+export interface TocEntry {
+  level: number;
+  text: string;
+  /** Anchor id of the heading, also accepted as a `section` */
+  id: string;
+}
+
+export interface RenderedMarkdown {
+  /** Raw frontmatter text between the `---` fences */
+  frontmatter: string | null;
+  blocks: RenderedBlock[];
+  toc: TocEntry[];
+}
+
+interface LexedDocument {
+  frontmatter: string | null;
+  tokens: Token[];
+}
+
+/** Heading token with the anchor id assigned to it */
+interface AnchoredHeading extends Tokens.Heading {
+  anchor?: string;
+}
+
+/** Bump when the rendered output changes so stale HTML is not served */
+export const MARKDOWN_RENDER_VERSION = 1;
+const CACHE_ENTRIES = 64;
+
+const MERMAID_LANGUAGES = new Set(['mermaid', 'mmd']);
+// Relative links and anchors, or one of these schemes
+const SAFE_URL = /^(?:https?:|mailto:|#|\/|\.{1,2}\/|[^:]*$)/i;
+
+function escapeHtml(text: string): string {
+  return text
+    .replace(/&/g, '&amp;')
+    .replace(/</g, '&lt;')
+    .replace(/>/g, '&gt;')
+    .replace(/"/g, '&quot;')
+    .replace(/'/g, '&#39;');
+}
+
+function isSafeUrl(url: string): boolean {
+  return SAFE_URL.test(url.trim());
+}
+
+/** GitHub-style heading slug */
+function slugify(text: string): string {
+  return text
+    .toLowerCase()
+    .trim()
+    .replace(/[^\p{L}\p{N}\s_-]/gu, '')
+    .replace(/\s/g, '-');
+}
+
+function plainText(tokens: Token[]): string {
+  return tokens
+    .map(token => ('tokens' in token && token.tokens ? plainText(token.tokens) : 'text' in token ? token.text : ''))
+    .join('');
+}
+
+const markdown = new Marked({
+  gfm: true,
+  renderer: {
+    heading(token) {
+      const { anchor } = token as AnchoredHeading;
+      const id = anchor ? ` id="${escapeHtml(anchor)}"` : '';
+      return `<h${token.depth}${id}>${this.parser.parseInline(token.tokens)}</h${token.depth}>\n`;
+    },
+
+    code({ text, lang }) {
+      const language = (lang ?? '').split(/\s/)[0];
+      const highlighted = language && hljs.getLanguage(language)
+        ? hljs.highlight(text, { language, ignoreIllegals: true }).value
+        : escapeHtml(text);
+      const className = language ? `hljs language-${escapeHtml(language)}` : 'hljs';
+      return (
+        '<div class="code-block">' +
+        `<pre><code class="${className}">${highlighted}</code></pre>` +
+        '<button type="button" class="code-copy" data-copy-code>Copy</button>' +
+        '</div>\n'
+      );
+    },
+
+    // Raw HTML is dropped, as react-markdown does without rehype-raw
+    html() {
+      return '';
+    },
+
+    link({ href, title, tokens }) {
+      const text = this.parser.parseInline(tokens);
+      if (!isSafeUrl(href)) return text;
+      const external = /^https?:/i.test(href) ? ' target="_blank" rel="noopener noreferrer"' : '';
+      const titleAttr = title ? ` title="${escapeHtml(title)}"` : '';
+      return `<a href="${escapeHtml(href)}"${titleAttr}${external}>${text}</a>`;
+    },
+
+    image({ href, title, text }) {
+      if (!isSafeUrl(href)) return escapeHtml(text);
+      const titleAttr = title ? ` title="${escapeHtml(title)}"` : '';
+      return `<img src="${escapeHtml(href)}" alt="${escapeHtml(text)}"${titleAttr} loading="lazy">`;
+    },
+  },
+});
+
+function splitFrontmatter(content: string): { frontmatter: string | null; body: string } {
+  const match = content.match(/^---\n([\s\S]*?)\n---\n?([\s\S]*)$/);
+  if (match) {
+    return { frontmatter: match[1].trim(), body: match[2] };
+  }
+  return { frontmatter: null, body: content };
+}
+
+/** Lex a document and give each top-level heading a unique anchor */
+function lexDocument(content: string): LexedDocument {
+  const { frontmatter, body } = splitFrontmatter(content);
+  const tokens = markdown.lexer(body);
+  const seen = new Map<string, number>();
+
+  for (const token of tokens) {
+    if (token.type !== 'heading') continue;
+    const heading = token as AnchoredHeading;
+    const slug = slugify(plainText(heading.tokens)) || 'section';
+    const count = seen.get(slug) ?? 0;
+    seen.set(slug, count + 1);
+    heading.anchor = count ? `${slug}-${count}` : slug;
+  }
+
+  return { frontmatter, tokens };
+}
+
+/** Index range [start, end) of the tokens under heading `id`, up to the next heading at its level or above */
+function sectionRange(tokens: Token[], id: string): [number, number] | null {
+  const start = tokens.findIndex(token => (token as AnchoredHeading).anchor === id);
+  if (start === -1) return null;
+
+  const depth = (tokens[start] as Tokens.Heading).depth;
+  let end = start + 1;
+  while (end < tokens.length && !(tokens[end].type === 'heading' && (tokens[end] as Tokens.Heading).depth <= depth)) {
+    end++;
+  }
+  return [start, end];
+}
+
+function renderTokens(tokens: Token[]): RenderedBlock[] {
+  const blocks: RenderedBlock[] = [];
+  let pending: Token[] = [];
+
+  const flush = () => {
+    if (pending.length === 0) return;
+    blocks.push({ type: 'html', html: markdown.parser(pending) });
+    pending = [];
+  };
+
+  for (const token of tokens) {
+    const language = token.type === 'code' ? ((token as Tokens.Code).lang ?? '').split(/\s/)[0] : '';
+    if (MERMAID_LANGUAGES.has(language)) {
+      flush();
+      blocks.push({ type: 'mermaid', code: (token as Tokens.Code).text });
+    } else {
+      pending.push(token);
+    }
+  }
+  flush();
+  return blocks;
+}
+
+/** Render a document, or only the section under heading `section`; null when there is no such heading */
+export function renderMarkdown(content: string, section?: string): RenderedMarkdown | null {
+  const { frontmatter, tokens: allTokens } = lexDocument(content);
+  let tokens = allTokens;
+  if (section) {
+    const range = sectionRange(allTokens, section);
+    if (!range) return null;
+    tokens = allTokens.slice(...range);
+  }
+
+  const toc = tokens
+    .filter((token): token is AnchoredHeading => token.type === 'heading')
+    .map(heading => ({ level: heading.depth, text: plainText(heading.tokens), id: heading.anchor! }));
+
+  return { frontmatter, blocks: renderTokens(tokens), toc };
+}
+
+/** Markdown source of the section under heading `section`, or null when there is no such heading */
+export function extractSection(content: string, section: string): string | null {
+  const { tokens } = lexDocument(content);
+  const range = sectionRange(tokens, section);
+  if (!range) return null;
+  return tokens.slice(...range).map(token => token.raw).join('');
+}
+
+/** Hash identifying a file's content */
+function hashMarkdown(content: string): string {
+  return createHash('sha1').update(content).digest('base64url');
+}
+
+// Least recently used first; a hit is re-inserted at the end
+const renderCache = new Map<string, RenderedMarkdown | null>();
+
+/**
+ * `renderMarkdown` behind an LRU cache keyed by content hash, so reopening a
+ * doc (or a section of it) costs a hash and a lookup.
+ */
+export function getRenderedMarkdown(content: string, section?: string): RenderedMarkdown | null {
+  const key = `${MARKDOWN_RENDER_VERSION}:${hashMarkdown(content)}#${section ?? ''}`;
+  if (renderCache.has(key)) {
+    const cached = renderCache.get(key)!;
+    renderCache.delete(key);
+    renderCache.set(key, cached);
+    return cached;
+  }
+
+  const rendered = renderMarkdown(content, section);
+  renderCache.set(key, rendered);
+  if (renderCache.size > CACHE_ENTRIES) {
+    renderCache.delete(renderCache.keys().next().value!);
+  }
+  return rendered;
+}
+
+/** Forget cached renders (tests) */
+export function clearMarkdownCache(): void {
+  renderCache.clear();
+}
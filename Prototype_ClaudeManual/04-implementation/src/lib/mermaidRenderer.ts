@@ -0,0 +1,224 @@
+// Mermaid rendering with an SVG cache: an in-memory LRU backed by IndexedDB,
+// keyed by a hash of the diagram source and theme. Renders run one at a time
+// in idle periods, because Mermaid lays diagrams out against the live DOM and
+// cannot run in a worker.
+
+export type MermaidTheme = 'light' | 'dark';
+
+// Bump when render options or the stored SVG format change so stale SVGs are not reused
+const CACHE_VERSION = 2;
+const MEMORY_ENTRIES = 100;
+const PERSISTED_ENTRIES = 500;
+
+const DB_NAME = 'claudemanual-mermaid';
+const STORE_NAME = 'svg';
+
+interface PersistedSvg {
+  key: string;
+  svg: string;
+  savedAt: number;
+}
+
+/** Least-recently-used map of diagram key to rendered SVG */
+export class SvgLruCache {
+  private entries = new Map<string, string>();
+
+  constructor(private readonly maxEntries: number) {}
+
+  get(key: string): string | undefined {
+    const svg = this.entries.get(key);
+    if (svg !== undefined) {
+      // Re-insert to mark as most recently used
+      this.entries.delete(key);
+      this.entries.set(key, svg);
+    }
+    return svg;
+  }
+
+  set(key: string, svg: string): void {
+    this.entries.delete(key);
+    this.entries.set(key, svg);
+    if (this.entries.size > this.maxEntries) {
+      this.entries.delete(this.entries.keys().next().value!);
+    }
+  }
+
+  get size(): number {
+    return this.entries.size;
+  }
+
+  clear(): void {
+    this.entries.clear();
+  }
+}
+
+/** Cache key for a diagram: 64-bit FNV-1a over the render settings and source */
+export function diagramKey(code: string, theme: MermaidTheme): string {
+  const input = `${CACHE_VERSION}\u0000${theme}\u0000${code.trim()}`;
+  let h1 = 0x811c9dc5;
+  let h2 = 0x01000193;
+  for (let i = 0; i < input.length; i++) {
+    const c = input.charCodeAt(i);
+    h1 = Math.imul(h1 ^ c, 0x01000193);
+    h2 = Math.imul(h2 ^ c, 0x811c9dc5);
+  }
+  return (h1 >>> 0).toString(16).padStart(8, '0') + (h2 >>> 0).toString(16).padStart(8, '0');
+}
+
+const memoryCache = new SvgLruCache(MEMORY_ENTRIES);
+const inFlight = new Map<string, Promise<string>>();
+let renderQueue: Promise<unknown> = Promise.resolve();
+let initializedTheme: MermaidTheme | null = null;
+let dbPromise: Promise<IDBDatabase | null> | null = null;
+
+function requestToPromise<T>(request: IDBRequest<T>): Promise<T> {
+  return new Promise((resolve, reject) => {
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+  });
+}
+
+// Null when IndexedDB is unavailable (server, tests, private browsing); the memory cache still works
+function openDatabase(): Promise<IDBDatabase | null> {
+  if (!dbPromise) {
+    dbPromise = new Promise<IDBDatabase | null>((resolve) => {
+      if (typeof indexedDB === 'undefined') {
+        resolve(null);
+        return;
+      }
+      const request = indexedDB.open(DB_NAME, 1);
+      request.onupgradeneeded = () => {
+        const store = request.result.createObjectStore(STORE_NAME, { keyPath: 'key' });
+        store.createIndex('savedAt', 'savedAt');
+      };
+      request.onsuccess = () => resolve(request.result);
+      request.onerror = () => resolve(null);
+    });
+  }
+  return dbPromise;
+}
+
+async function readPersisted(key: string): Promise<string | null> {
+  try {
+    const db = await openDatabase();
+    if (!db) return null;
+    const entry = await requestToPromise<PersistedSvg | undefined>(
+      db.transaction(STORE_NAME).objectStore(STORE_NAME).get(key)
+    );
+    return entry?.svg ?? null;
+  } catch {
+    return null;
+  }
+}
+
+async function writePersisted(key: string, svg: string): Promise<void> {
+  try {
+    const db = await openDatabase();
+    if (!db) return;
+    const store = db.transaction(STORE_NAME, 'readwrite').objectStore(STORE_NAME);
+    await requestToPromise(store.put({ key, svg, savedAt: Date.now() } satisfies PersistedSvg));
+
+    // Drop the oldest entries once the store grows past its cap
+    const excess = (await requestToPromise(store.count())) - PERSISTED_ENTRIES;
+    if (excess <= 0) return;
+    let removed = 0;
+    const cursorRequest = store.index('savedAt').openCursor();
+    cursorRequest.onsuccess = () => {
+      const cursor = cursorRequest.result;
+      if (!cursor || removed >= excess) return;
+      cursor.delete();
+      removed++;
+      cursor.continue();
+    };
+  } catch (error) {
+    console.warn('Failed to persist Mermaid diagram:', error);
+  }
+}
+
+// Wait for an idle period so a render does not land in the middle of user input
+function whenIdle(): Promise<void> {
+  return new Promise((resolve) => {
+    if (typeof window !== 'undefined' && 'requestIdleCallback' in window) {
+      window.requestIdleCallback(() => resolve(), { timeout: 500 });
+    } else {
+      setTimeout(resolve, 0);
+    }
+  });
+}
+
+// Cached SVGs carry an id derived from their key. Mermaid scopes the SVG's <style>
+// rules and marker ids to it, so each mounted copy needs its own (see instantiateSvg).
+function renderId(key: string): string {
+  return `mermaid-${key}`;
+}
+
+async function renderNow(code: string, theme: MermaidTheme, key: string): Promise<string> {
+  await whenIdle();
+  const mermaid = (await import('mermaid')).default;
+
+  if (initializedTheme !== theme) {
+    mermaid.initialize({
+      startOnLoad: false,
+      theme: theme === 'dark' ? 'dark' : 'default',
+      securityLevel: 'loose',
+      fontFamily: 'system-ui, -apple-system, sans-serif',
+      suppressErrorRendering: true,
+    });
+    initializedTheme = theme;
+  }
+
+  const { svg } = await mermaid.render(renderId(key), code);
+  return svg;
+}
+
+/**
+ * Copy of a cached SVG whose element, style and marker ids are unique to one
+ * mount, so diagrams shown together never share ids or CSS.
+ */
+export function instantiateSvg(svg: string, key: string, instanceId: string): string {
+  return svg.split(renderId(key)).join(`${renderId(key)}-${instanceId}`);
+}
+
+/** SVG already held in memory, for rendering without a loading state */
+export function peekCachedSvg(key: string): string | undefined {
+  return memoryCache.get(key);
+}
+
+/**
+ * Render a diagram, reusing the memory or IndexedDB cache when possible.
+ * Concurrent requests for the same diagram share one render.
+ */
+export function renderMermaidSvg(code: string, theme: MermaidTheme): Promise<string> {
+  const key = diagramKey(code, theme);
+  const cached = memoryCache.get(key);
+  if (cached !== undefined) return Promise.resolve(cached);
+
+  let pending = inFlight.get(key);
+  if (!pending) {
+    pending = (async () => {
+      const persisted = await readPersisted(key);
+      if (persisted !== null) return persisted;
+
+      // One render at a time: Mermaid keeps global state and each render blocks while it lays out
+      const rendered = renderQueue.then(() => renderNow(code.trim(), theme, key));
+      renderQueue = rendered.catch(() => undefined);
+      const svg = await rendered;
+      void writePersisted(key, svg);
+      return svg;
+    })()
+      .then((svg) => {
+        memoryCache.set(key, svg);
+        return svg;
+      })
+      .finally(() => {
+        inFlight.delete(key);
+      });
+    inFlight.set(key, pending);
+  }
+  return pending;
+}
+
+/** Forget in-memory SVGs (tests) */
+export function clearMermaidMemoryCache(): void {
+  memoryCache.clear();
+}
@@ -0,0 +1,3 @@
+export * from './searchIndex';
+export { findToken, tokenize } from './tokenize';
+export type { Token } from './tokenize';
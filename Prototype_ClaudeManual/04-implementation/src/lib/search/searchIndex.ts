@@ -0,0 +1,485 @@
+import type { SearchableItem } from '@/lib/catalog/types';
+import { boundedEditDistance, findToken, tokenize } from './tokenize';
+
+// Fields indexed per document, with their BM25F boosts
+export const SEARCH_FIELDS = ['name', 'id', 'tags', 'description', 'stage', 'body'] as const;
+export type SearchField = typeof SEARCH_FIELDS[number];
+
+export const FIELD_BOOSTS: Record<SearchField, number> = {
+  name: 3,
+  id: 2,
+  tags: 2,
+  description: 1.5,
+  stage: 0.5,
+  body: 1,
+};
+
+const BOOSTS = SEARCH_FIELDS.map(field => FIELD_BOOSTS[field]);
+
+// BM25 parameters
+const K1 = 1.2;
+const B = 0.75;
+
+// Query expansion
+const MIN_PREFIX_LENGTH = 2;
+const MAX_EXPANSIONS = 64;
+const PREFIX_WEIGHT = 0.8;
+const MIN_FUZZY_LENGTH = 4;
+const FUZZY_WEIGHT = 0.6;
+
+// Result shaping
+export const DEFAULT_PAGE_SIZE = 20;
+export const MAX_PAGE_SIZE = 100;
+const SNIPPET_CONTEXT = 60;
+const SNIPPET_LENGTH = 240;
+const RANK_CACHE_SIZE = 50;
+
+export interface SearchHighlight {
+  field: 'name' | 'description' | 'content';
+  /** Offset into the returned field value */
+  start: number;
+  end: number;
+}
+
+export interface SearchHit extends SearchableItem {
+  /** Relevance relative to the best hit for the query (0-1) */
+  score: number;
+  highlights: SearchHighlight[];
+}
+
+export interface SearchOptions {
+  /** Only return these item types (e.g. 'Skill', 'Agent') */
+  types?: string[];
+  /** Only return items in these stages (case-insensitive) */
+  stages?: string[];
+  /** Only return items carrying one of these tags, or listed in `taggedIds` */
+  tags?: string[];
+  /** Items that carry one of `tags` outside the catalog (e.g. user tags kept by the browser) */
+  taggedIds?: string[];
+  limit?: number;
+  /** Opaque cursor from a previous page's `nextCursor` */
+  cursor?: string | null;
+}
+
+export interface SearchPage {
+  results: SearchHit[];
+  /** Total hits for the query and filters */
+  total: number;
+  nextCursor: string | null;
+  /** Hit counts per type, ignoring the type filter */
+  typeCounts: Record<string, number>;
+  /** Distinct catalog tags across all hits, ignoring the type and tag filters */
+  tags: string[];
+}
+
+/**
+ * Token counts for one document, flattened so they cross worker boundaries
+ * cheaply: `counts[i * SEARCH_FIELDS.length + field]` is how often `terms[i]`
+ * occurs in that field.
+ */
+export interface AnalyzedDocument {
+  terms: string[];
+  counts: number[];
+  fieldLengths: number[];
+}
+
+interface IndexedDoc {
+  key: string;
+  item: SearchableItem;
+  body: string;
+  fieldLengths: number[];
+  terms: string[];
+}
+
+interface Expansion {
+  term: string;
+  weight: number;
+}
+
+interface RankedQuery {
+  hits: { doc: number; score: number }[];
+  matchedTerms: Set<string>;
+}
+
+export function encodeCursor(offset: number): string {
+  return Buffer.from(String(offset)).toString('base64url');
+}
+
+export function decodeCursor(cursor: string | null | undefined): number {
+  if (!cursor) return 0;
+  const offset = Number.parseInt(Buffer.from(cursor, 'base64url').toString(), 10);
+  return Number.isFinite(offset) && offset > 0 ? offset : 0;
+}
+
+/** Tokenize a document's fields. Pure, so it can run in a parse worker ahead of `SearchIndex.add`. */
+export function analyzeDocument(item: SearchableItem, body: string): AnalyzedDocument {
+  const texts = [item.name, item.id, (item.tags || []).join(' '), item.description, item.stage, body];
+  const fieldCount = SEARCH_FIELDS.length;
+  const slots = new Map<string, number>();
+  const terms: string[] = [];
+  const counts: number[] = [];
+  const fieldLengths: number[] = [];
+
+  texts.forEach((text, field) => {
+    const tokens = tokenize(text);
+    fieldLengths.push(tokens.length);
+    for (const { term } of tokens) {
+      let slot = slots.get(term);
+      if (slot === undefined) {
+        slot = terms.length;
+        slots.set(term, slot);
+        terms.push(term);
+        for (let i = 0; i < fieldCount; i++) counts.push(0);
+      }
+      counts[slot * fieldCount + field]++;
+    }
+  });
+
+  return { terms, counts, fieldLengths };
+}
+
+function mergeRanges(highlights: SearchHighlight[]): SearchHighlight[] {
+  const sorted = [...highlights].sort((a, b) => a.start - b.start);
+  const merged: SearchHighlight[] = [];
+  for (const range of sorted) {
+    const last = merged[merged.length - 1];
+    if (last && range.start <= last.end) {
+      last.end = Math.max(last.end, range.end);
+    } else {
+      merged.push({ ...range });
+    }
+  }
+  return merged;
+}
+
+function highlightsFor(field: SearchHighlight['field'], text: string, terms: Set<string>): SearchHighlight[] {
+  const ranges = tokenize(text)
+    .filter(token => terms.has(token.term))
+    .map(token => ({ field, start: token.start, end: token.end }));
+  return mergeRanges(ranges);
+}
+
+/**
+ * Inverted index over catalog items with BM25F ranking.
+ *
+ * Documents are keyed by their project-relative path and can be added or
+ * removed one at a time. Query terms are ANDed; the last term also matches
+ * as a prefix (search-as-you-type) and terms with no exact match fall back
+ * to fuzzy matching (edit distance 1, or 2 for long words, same first letter).
+ */
+export class SearchIndex {
+  private docs = new Map<number, IndexedDoc>();
+  private docsByKey = new Map<string, number>();
+  private postings = new Map<string, Map<number, number[]>>();
+  private fieldTotals: number[] = SEARCH_FIELDS.map(() => 0);
+  private nextDocId = 0;
+  private version = 0;
+
+  private sortedTerms: string[] | null = null;
+  private fuzzyBuckets: Map<string, string[]> | null = null;
+  private rankCache = new Map<string, RankedQuery>();
+  private rankCacheVersion = 0;
+
+  get size(): number {
+    return this.docs.size;
+  }
+
+  /**
+   * Add or replace a document. `body` is the full text searched beyond the item's fields;
+   * pass `analyzed` when the document was already tokenized elsewhere.
+   */
+  add(key: string, item: SearchableItem, body: string, analyzed: AnalyzedDocument = analyzeDocument(item, body)): void {
+    this.remove(key);
+
+    const docId = this.nextDocId++;
+    const { terms, counts, fieldLengths } = analyzed;
+    const fieldCount = SEARCH_FIELDS.length;
+    fieldLengths.forEach((length, field) => {
+      this.fieldTotals[field] += length;
+    });
+
+    terms.forEach((term, slot) => {
+      let posting = this.postings.get(term);
+      if (!posting) {
+        posting = new Map();
+        this.postings.set(term, posting);
+        this.invalidateDictionary();
+      }
+      posting.set(docId, counts.slice(slot * fieldCount, (slot + 1) * fieldCount));
+    });
+
+    this.docs.set(docId, { key, item, body, fieldLengths, terms });
+    this.docsByKey.set(key, docId);
+    this.version++;
+  }
+
+  remove(key: string): boolean {
+    const docId = this.docsByKey.get(key);
+    if (docId === undefined) return false;
+    const doc = this.docs.get(docId)!;
+
+    for (const term of doc.terms) {
+      const posting = this.postings.get(term);
+      if (!posting) continue;
+      posting.delete(docId);
+      if (posting.size === 0) {
+        this.postings.delete(term);
+        this.invalidateDictionary();
+      }
+    }
+    doc.fieldLengths.forEach((length, field) => {
+      this.fieldTotals[field] -= length;
+    });
+
+    this.docs.delete(docId);
+    this.docsByKey.delete(key);
+    this.version++;
+    return true;
+  }
+
+  /** A document in its tokenized form, so it can be persisted and re-added without tokenizing */
+  getDocument(key: string): { item: SearchableItem; body: string; analyzed: AnalyzedDocument } | null {
+    const docId = this.docsByKey.get(key);
+    if (docId === undefined) return null;
+    const doc = this.docs.get(docId)!;
+    const counts: number[] = [];
+    for (const term of doc.terms) counts.push(...this.postings.get(term)!.get(docId)!);
+    return { item: doc.item, body: doc.body, analyzed: { terms: doc.terms, counts, fieldLengths: doc.fieldLengths } };
+  }
+
+  search(query: string, options: SearchOptions = {}): SearchPage {
+    const limit = Math.min(Math.max(options.limit ?? DEFAULT_PAGE_SIZE, 1), MAX_PAGE_SIZE);
+    const offset = decodeCursor(options.cursor);
+    const stages = options.stages?.map(s => s.toLowerCase()) ?? [];
+    const ranked = this.rank(query.trim() === '*' ? '*' : query, stages);
+
+    const tagSet = new Set<string>();
+    for (const { doc } of ranked.hits) {
+      for (const tag of this.docs.get(doc)!.item.tags ?? []) tagSet.add(tag);
+    }
+
+    // Tags filter before paging, so pages, totals and counts all reflect them
+    const tags = options.tags ?? [];
+    const taggedIds = new Set(options.taggedIds);
+    const tagged = tags.length > 0
+      ? ranked.hits.filter(({ doc }) => {
+        const item = this.docs.get(doc)!.item;
+        return taggedIds.has(item.id) || (item.tags ?? []).some(tag => tags.includes(tag));
+      })
+      : ranked.hits;
+
+    const typeCounts: Record<string, number> = {};
+    for (const { doc } of tagged) {
+      const type = this.docs.get(doc)!.item.type;
+      typeCounts[type] = (typeCounts[type] || 0) + 1;
+    }
+
+    const types = options.types ?? [];
+    const hits = types.length > 0
+      ? tagged.filter(({ doc }) => types.includes(this.docs.get(doc)!.item.type))
+      : tagged;
+
+    const topScore = hits.length > 0 ? hits[0].score : 0;
+    const page = hits.slice(offset, offset + limit);
+    const nextOffset = offset + page.length;
+
+    return {
+      results: page.map(({ doc, score }) => this.toHit(this.docs.get(doc)!, score, topScore, ranked.matchedTerms)),
+      total: hits.length,
+      nextCursor: nextOffset < hits.length ? encodeCursor(nextOffset) : null,
+      typeCounts,
+      tags: Array.from(tagSet).sort(),
+    };
+  }
+
+  private rank(query: string, stages: string[]): RankedQuery {
+    if (this.rankCacheVersion !== this.version) {
+      this.rankCache.clear();
+      this.rankCacheVersion = this.version;
+    }
+    const cacheKey = `${query}\u0000${stages.join(',')}`;
+    const cached = this.rankCache.get(cacheKey);
+    if (cached) {
+      // Refresh LRU position
+      this.rankCache.delete(cacheKey);
+      this.rankCache.set(cacheKey, cached);
+      return cached;
+    }
+
+    const ranked = query === '*' ? this.browse(stages) : this.score(query, stages);
+    this.rankCache.set(cacheKey, ranked);
+    if (this.rankCache.size > RANK_CACHE_SIZE) {
+      this.rankCache.delete(this.rankCache.keys().next().value!);
+    }
+    return ranked;
+  }
+
+  private matchesStage(docId: number, stages: string[]): boolean {
+    return stages.length === 0 || stages.includes(this.docs.get(docId)!.item.stage.toLowerCase());
+  }
+
+  // '*' lists everything (used for tag-only filtering), sorted by name
+  private browse(stages: string[]): RankedQuery {
+    const hits: RankedQuery['hits'] = [];
+    for (const docId of this.docs.keys()) {
+      if (this.matchesStage(docId, stages)) hits.push({ doc: docId, score: 1 });
+    }
+    hits.sort((a, b) => this.docs.get(a.doc)!.item.name.localeCompare(this.docs.get(b.doc)!.item.name));
+    return { hits, matchedTerms: new Set() };
+  }
+
+  private score(query: string, stages: string[]): RankedQuery {
+    const tokens = tokenize(query);
+    const queryTerms = Array.from(new Set(tokens.map(t => t.term)));
+    const empty: RankedQuery = { hits: [], matchedTerms: new Set() };
+    if (queryTerms.length === 0) return empty;
+
+    // Only the word being typed is treated as a prefix
+    const lastTerm = /\s$/.test(query) ? null : tokens[tokens.length - 1].term;
+    const expanded = queryTerms.map(term => this.expand(term, term === lastTerm));
+    if (expanded.some(expansions => expansions.length === 0)) return empty;
+
+    // Intersect starting from the most selective term
+    const order = expanded
+      .map(expansions => ({ expansions, df: expansions.reduce((sum, e) => sum + this.postings.get(e.term)!.size, 0) }))
+      .sort((a, b) => a.df - b.df);
+
+    const docCount = this.docs.size;
+    const averages = this.fieldTotals.map(total => (docCount > 0 ? total / docCount : 0) || 1);
+    const matchedTerms = new Set<string>();
+    let scores: Map<number, number> | null = null;
+
+    for (const { expansions } of order) {
+      const termScores = new Map<number, number>();
+
+      for (const { term, weight } of expansions) {
+        const posting = this.postings.get(term)!;
+        const idf = Math.log(1 + (docCount - posting.size + 0.5) / (posting.size + 0.5));
+        const candidates: Iterable<number> = scores && scores.size < posting.size ? scores.keys() : posting.keys();
+
+        for (const docId of candidates) {
+          const frequencies = posting.get(docId);
+          if (!frequencies) continue;
+          if (scores ? !scores.has(docId) : !this.matchesStage(docId, stages)) continue;
+
+          const lengths = this.docs.get(docId)!.fieldLengths;
+          let tf = 0;
+          for (let field = 0; field < frequencies.length; field++) {
+            if (frequencies[field] === 0) continue;
+            tf += (BOOSTS[field] * frequencies[field]) / (1 - B + (B * lengths[field]) / averages[field]);
+          }
+          const value = weight * idf * (tf / (K1 + tf));
+          // A document scores once per query term: its best-matching expansion
+          if (value > (termScores.get(docId) ?? 0)) termScores.set(docId, value);
+          matchedTerms.add(term);
+        }
+      }
+
+      if (scores) {
+        const previous: Map<number, number> = scores;
+        for (const [docId, value] of termScores) termScores.set(docId, value + previous.get(docId)!);
+      }
+      scores = termScores;
+      if (scores.size === 0) return empty;
+    }
+
+    const hits = Array.from(scores!, ([doc, score]) => ({ doc, score }));
+    hits.sort((a, b) => b.score - a.score || this.docs.get(a.doc)!.item.name.localeCompare(this.docs.get(b.doc)!.item.name));
+    return { hits, matchedTerms };
+  }
+
+  private expand(term: string, allowPrefix: boolean): Expansion[] {
+    const expansions: Expansion[] = [];
+    if (this.postings.has(term)) expansions.push({ term, weight: 1 });
+
+    if (allowPrefix && term.length >= MIN_PREFIX_LENGTH) {
+      const terms = this.getSortedTerms();
+      let index = lowerBound(terms, term);
+      while (index < terms.length && terms[index].startsWith(term) && expansions.length < MAX_EXPANSIONS) {
+        if (terms[index] !== term) expansions.push({ term: terms[index], weight: PREFIX_WEIGHT });
+        index++;
+      }
+    }
+
+    if (expansions.length === 0 && term.length >= MIN_FUZZY_LENGTH) {
+      const maxDistance = term.length >= 8 ? 2 : 1;
+      const buckets = this.getFuzzyBuckets();
+      for (let length = term.length - maxDistance; length <= term.length + maxDistance; length++) {
+        for (const candidate of buckets.get(`${term[0]}:${length}`) ?? []) {
+          const distance = boundedEditDistance(term, candidate, maxDistance);
+          if (distance <= maxDistance) {
+            expansions.push({ term: candidate, weight: FUZZY_WEIGHT / distance });
+            if (expansions.length >= MAX_EXPANSIONS) return expansions;
+          }
+        }
+      }
+    }
+
+    return expansions;
+  }
+
+  private toHit(doc: IndexedDoc, score: number, topScore: number, terms: Set<string>): SearchHit {
+    const { item, body } = doc;
+    const highlights = [
+      ...highlightsFor('name', item.name, terms),
+      ...highlightsFor('description', item.description, terms),
+    ];
+
+    // Show the part of the body around the first match instead of its opening lines
+    let content = item.content;
+    const firstMatch = terms.size > 0 ? findToken(body, terms) : undefined;
+    if (firstMatch) {
+      let start = Math.max(0, firstMatch.start - SNIPPET_CONTEXT);
+      if (start > 0) {
+        const space = body.indexOf(' ', start);
+        start = space !== -1 && space < firstMatch.start ? space + 1 : start;
+      }
+      content = body.slice(start, start + SNIPPET_LENGTH).trim();
+    }
+    if (content) highlights.push(...highlightsFor('content', content, terms));
+
+    return {
+      ...item,
+      content,
+      score: topScore > 0 ? Math.round((score / topScore) * 1000) / 1000 : 0,
+      highlights,
+    };
+  }
+
+  private invalidateDictionary(): void {
+    this.sortedTerms = null;
+    this.fuzzyBuckets = null;
+  }
+
+  private getSortedTerms(): string[] {
+    if (!this.sortedTerms) {
+      this.sortedTerms = Array.from(this.postings.keys()).sort();
+    }
+    return this.sortedTerms;
+  }
+
+  private getFuzzyBuckets(): Map<string, string[]> {
+    if (!this.fuzzyBuckets) {
+      const buckets = new Map<string, string[]>();
+      for (const term of this.postings.keys()) {
+        const bucketKey = `${term[0]}:${term.length}`;
+        const bucket = buckets.get(bucketKey);
+        if (bucket) bucket.push(term);
+        else buckets.set(bucketKey, [term]);
+      }
+      this.fuzzyBuckets = buckets;
+    }
+    return this.fuzzyBuckets;
+  }
+}
+
+function lowerBound(sorted: string[], value: string): number {
+  let low = 0;
+  let high = sorted.length;
+  while (low < high) {
+    const mid = (low + high) >>> 1;
+    if (sorted[mid] < value) low = mid + 1;
+    else high = mid;
+  }
+  return low;
+}
@@ -0,0 +1,94 @@
+export interface Token {
+  /** Normalized (lowercased) term */
+  term: string;
+  /** Offset of the first character in the source text */
+  start: number;
+  /** Offset one past the last character in the source text */
+  end: number;
+}
+
+// Letters (Latin incl. accents, Greek, Cyrillic) and digits
+const WORD_RE = /[A-Za-z0-9\u00C0-\u024F\u0370-\u03FF\u0400-\u04FF]+/g;
+// Parts of a camelCase / PascalCase word: "PreToolUse" -> Pre, Tool, Use
+const CAMEL_PART_RE = /[A-Z]?[a-z]+|[A-Z]+(?![a-z])|[0-9]+/g;
+
+/**
+ * Walk the word tokens of a text in order. Return `true` from `visit` to stop early.
+ * CamelCase words are emitted whole and then as their parts, so "tool" finds
+ * "PreToolUse".
+ */
+export function scanTokens(text: string, visit: (token: Token) => boolean | void): void {
+  const wordRe = new RegExp(WORD_RE.source, 'g');
+  let match: RegExpExecArray | null;
+
+  while ((match = wordRe.exec(text)) !== null) {
+    const word = match[0];
+    const start = match.index;
+    if (visit({ term: word.toLowerCase(), start, end: start + word.length })) return;
+
+    if (word.length > 3 && /[a-z][A-Z]|[A-Z]{2}[a-z]|[a-zA-Z][0-9]/.test(word)) {
+      const partRe = new RegExp(CAMEL_PART_RE.source, 'g');
+      let part: RegExpExecArray | null;
+      const parts: Token[] = [];
+      while ((part = partRe.exec(word)) !== null) {
+        parts.push({ term: part[0].toLowerCase(), start: start + part.index, end: start + part.index + part[0].length });
+      }
+      if (parts.length > 1) {
+        for (const token of parts) {
+          if (visit(token)) return;
+        }
+      }
+    }
+  }
+}
+
+/** Split text into lowercase word tokens with source offsets */
+export function tokenize(text: string): Token[] {
+  const tokens: Token[] = [];
+  scanTokens(text, token => {
+    tokens.push(token);
+  });
+  return tokens;
+}
+
+/** First token whose term is in `terms`, without tokenizing the rest of the text */
+export function findToken(text: string, terms: Set<string>): Token | undefined {
+  let found: Token | undefined;
+  scanTokens(text, token => {
+    if (terms.has(token.term)) {
+      found = token;
+      return true;
+    }
+  });
+  return found;
+}
+
+/**
+ * Optimal string alignment distance, giving up as soon as it exceeds maxDistance.
+ * Returns maxDistance + 1 when the strings are further apart than that.
+ */
+export function boundedEditDistance(a: string, b: string, maxDistance: number): number {
+  if (Math.abs(a.length - b.length) > maxDistance) return maxDistance + 1;
+
+  let prevPrev: number[] = [];
+  let prev = Array.from({ length: b.length + 1 }, (_, j) => j);
+
+  for (let i = 1; i <= a.length; i++) {
+    const current = [i];
+    let rowMin = i;
+    for (let j = 1; j <= b.length; j++) {
+      const cost = a[i - 1] === b[j - 1] ? 0 : 1;
+      let value = Math.min(prev[j] + 1, current[j - 1] + 1, prev[j - 1] + cost);
+      if (i > 1 && j > 1 && a[i - 1] === b[j - 2] && a[i - 2] === b[j - 1]) {
+        value = Math.min(value, prevPrev[j - 2] + 1);
+      }
+      current.push(value);
+      if (value < rowMin) rowMin = value;
+    }
+    if (rowMin > maxDistance) return maxDistance + 1;
+    prevPrev = prev;
+    prev = current;
+  }
+
+  return prev[b.length];
+}
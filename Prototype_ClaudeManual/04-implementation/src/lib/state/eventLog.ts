@@ -0,0 +1,243 @@
+import { InvalidCursorError, pageSize } from './paging';
+import { artifactIdsIn } from './traceability';
+import type { EventQuery, Page, StateEvent } from './types';
+
+/**
+ * Row ids ordered by (timestamp, id). Logs are appended in time order, so
+ * appends normally keep the list sorted; otherwise it is sorted on next use.
+ */
+class PostingList {
+  ids: number[] = [];
+  private sorted = true;
+
+  add(id: number, times: number[]): void {
+    const last = this.ids[this.ids.length - 1];
+    if (last !== undefined && times[last] > times[id]) this.sorted = false;
+    this.ids.push(id);
+  }
+
+  ordered(times: number[]): number[] {
+    if (!this.sorted) {
+      this.ids.sort((a, b) => times[a] - times[b] || a - b);
+      this.sorted = true;
+    }
+    return this.ids;
+  }
+}
+
+function parseTime(value: unknown): number {
+  const time = typeof value === 'string' ? Date.parse(value) : NaN;
+  // Untimed events sort first
+  return Number.isNaN(time) ? 0 : time;
+}
+
+function stringField(value: unknown): string | null {
+  return typeof value === 'string' && value ? value : null;
+}
+
+function eventTypeOf(record: Record<string, unknown>): string | null {
+  return stringField(record.event_type) ?? stringField(record.hook_event_name) ?? stringField(record.type);
+}
+
+/** Artifact ids mentioned in any string value of an event */
+function mentionedArtifacts(value: unknown, ids = new Set<string>()): Set<string> {
+  if (typeof value === 'string') {
+    for (const id of artifactIdsIn(value)) ids.add(id);
+  } else if (Array.isArray(value)) {
+    for (const item of value) mentionedArtifacts(item, ids);
+  } else if (typeof value === 'object' && value !== null) {
+    for (const item of Object.values(value)) mentionedArtifacts(item, ids);
+  }
+  return ids;
+}
+
+function encodeCursor(time: number, id: number): string {
+  return `${time.toString(36)}.${id.toString(36)}`;
+}
+
+function decodeCursor(cursor: string): { time: number; id: number } {
+  const [time, id] = cursor.split('.').map(part => parseInt(part, 36));
+  if (!Number.isFinite(time) || !Number.isInteger(id) || id < 0) throw new InvalidCursorError(cursor);
+  return { time, id };
+}
+
+/**
+ * Append-only store for log lines with posting lists per session, event type,
+ * log file, log name and mentioned artifact id.
+ *
+ * Lines are kept as the raw JSON text (far smaller than parsed objects) next to
+ * a column of timestamps, and are only parsed for the rows a query returns.
+ * A query walks the shortest matching posting list newest-first, checks the
+ * other filters by binary search, and pages with a (timestamp, id) cursor, so
+ * its cost follows the page size rather than the number of stored events.
+ */
+export class EventLog {
+  private lines: Array<string | null> = [];
+  private times: number[] = [];
+  private fileIds: number[] = [];
+  private files: Array<{ file: string; source: string }> = [];
+  private fileIndex = new Map<string, number>();
+  private all = new PostingList();
+  private postings = new Map<string, PostingList>();
+  private live = 0;
+
+  /** Number of stored events */
+  get size(): number {
+    return this.live;
+  }
+
+  /**
+   * Store one line of the log at `file` (its project-relative path, which
+   * identifies it); `source` is the log's display name. Returns false when
+   * the line is not a JSON object.
+   */
+  append(file: string, source: string, line: string): boolean {
+    let record: unknown;
+    try {
+      record = JSON.parse(line);
+    } catch {
+      return false;
+    }
+    if (typeof record !== 'object' || record === null || Array.isArray(record)) return false;
+    const fields = record as Record<string, unknown>;
+
+    const id = this.lines.length;
+    this.lines.push(line);
+    this.times.push(parseTime(fields.timestamp));
+    this.fileIds.push(this.internFile(file, source));
+    this.live++;
+
+    this.all.add(id, this.times);
+    this.index(`file:${file}`, id);
+    this.index(`source:${source}`, id);
+    const sessionId = stringField(fields.session_id);
+    if (sessionId) this.index(`session:${sessionId}`, id);
+    const eventType = eventTypeOf(fields);
+    if (eventType) this.index(`type:${eventType}`, id);
+    for (const artifactId of mentionedArtifacts(fields)) {
+      this.index(`artifact:${artifactId}`, id);
+    }
+    return true;
+  }
+
+  /** Drop every event from one log file (it was truncated, replaced or deleted). Ids of other events are kept. */
+  removeFile(file: string): void {
+    const removed = this.postings.get(`file:${file}`);
+    if (!removed) return;
+
+    for (const id of removed.ids) {
+      this.lines[id] = null;
+      this.live--;
+    }
+    this.all.ids = this.all.ids.filter(id => this.lines[id] !== null);
+    for (const [key, list] of this.postings) {
+      list.ids = list.ids.filter(id => this.lines[id] !== null);
+      if (list.ids.length === 0) this.postings.delete(key);
+    }
+  }
+
+  /** Events for a session */
+  countSession(sessionId: string): number {
+    return this.postings.get(`session:${sessionId}`)?.ids.length ?? 0;
+  }
+
+  /** Matching events, newest first */
+  query(query: EventQuery): Page<StateEvent> {
+    const limit = pageSize(query.limit);
+    const keys = [
+      query.sessionId && `session:${query.sessionId}`,
+      query.eventType && `type:${query.eventType}`,
+      query.source && `source:${query.source}`,
+      query.file && `file:${query.file}`,
+      query.artifactId && `artifact:${query.artifactId}`,
+    ].filter((key): key is string => !!key);
+
+    const lists: number[][] = [];
+    for (const key of keys) {
+      const list = this.postings.get(key);
+      if (!list) return { items: [], nextCursor: null };
+      lists.push(list.ordered(this.times));
+    }
+    if (lists.length === 0) lists.push(this.all.ordered(this.times));
+    const [driver, ...others] = lists.sort((a, b) => a.length - b.length);
+
+    let end = driver.length;
+    if (query.to) end = Math.min(end, this.lowerBound(driver, parseTime(query.to), Infinity));
+    if (query.cursor) {
+      const { time, id } = decodeCursor(query.cursor);
+      end = Math.min(end, this.lowerBound(driver, time, id));
+    }
+    const from = query.from ? parseTime(query.from) : -Infinity;
+
+    const ids: number[] = [];
+    let hasMore = false;
+    for (let i = end - 1; i >= 0; i--) {
+      const id = driver[i];
+      if (this.times[id] < from) break;
+      if (!others.every(list => this.contains(list, id))) continue;
+      if (ids.length === limit) {
+        hasMore = true;
+        break;
+      }
+      ids.push(id);
+    }
+
+    const last = ids[ids.length - 1];
+    return {
+      items: ids.map(id => this.toEvent(id)),
+      nextCursor: hasMore ? encodeCursor(this.times[last], last) : null,
+    };
+  }
+
+  private internFile(file: string, source: string): number {
+    let index = this.fileIndex.get(file);
+    if (index === undefined) {
+      index = this.files.push({ file, source }) - 1;
+      this.fileIndex.set(file, index);
+    }
+    return index;
+  }
+
+  private index(key: string, id: number): void {
+    let list = this.postings.get(key);
+    if (!list) {
+      list = new PostingList();
+      this.postings.set(key, list);
+    }
+    list.add(id, this.times);
+  }
+
+  /** First position in an ordered list at or after (time, id) */
+  private lowerBound(list: number[], time: number, id: number): number {
+    let low = 0;
+    let high = list.length;
+    while (low < high) {
+      const mid = (low + high) >>> 1;
+      const current = list[mid];
+      if (this.times[current] < time || (this.times[current] === time && current < id)) {
+        low = mid + 1;
+      } else {
+        high = mid;
+      }
+    }
+    return low;
+  }
+
+  private contains(list: number[], id: number): boolean {
+    return list[this.lowerBound(list, this.times[id], id)] === id;
+  }
+
+  private toEvent(id: number): StateEvent {
+    const data = JSON.parse(this.lines[id]!) as Record<string, unknown>;
+    const { file, source } = this.files[this.fileIds[id]];
+    return {
+      id,
+      source,
+      file,
+      timestamp: stringField(data.timestamp),
+      sessionId: stringField(data.session_id),
+      eventType: eventTypeOf(data),
+      data,
+    };
+  }
+}
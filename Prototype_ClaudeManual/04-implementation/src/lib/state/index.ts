@@ -0,0 +1,487 @@
+import { promises as fs } from 'fs';
+import type { Stats } from 'fs';
+import path from 'path';
+import { getProjectRoot } from '@/lib/catalog/sources';
+import { mapWithConcurrency } from '@/lib/catalog/ingest';
+import { CatalogWatcher } from '@/lib/catalog/watcher';
+import { EventLog } from './eventLog';
+import { offsetPage } from './paging';
+import { STATE_DIRS, classifyStatePath, listStateFiles, logSource } from './sources';
+import { TraceGraph, compareIds, parseRegistry } from './traceability';
+import type { RegistryContent } from './traceability';
+import type {
+  AgentSession,
+  Artifact,
+  ArtifactDetail,
+  ArtifactType,
+  CoverageReport,
+  EventQuery,
+  Page,
+  SessionQuery,
+  StateEvent,
+  StateFileKind,
+} from './types';
+
+export * from './types';
+export { InvalidCursorError, MAX_PAGE_SIZE, offsetPage } from './paging';
+
+/** Max files stat'ed at the same time during a refresh */
+const IO_CONCURRENCY = 64;
+/** Bytes read at a time when tailing a log */
+const READ_CHUNK = 1 << 20;
+/** Bytes kept from each end of a log's consumed prefix to notice in-place rewrites */
+const FINGERPRINT_BYTES = 256;
+
+interface FileState {
+  kind: StateFileKind;
+  mtimeMs: number;
+  size: number;
+  ino: number;
+  /** Logs: bytes consumed so far (up to the last complete line) */
+  offset: number;
+  /** Logs: the first and last bytes of the consumed prefix (see readFingerprint) */
+  fingerprint?: Buffer;
+}
+
+interface CallStack {
+  sessionId: string;
+  stack: string[];
+}
+
+interface SessionViews {
+  version: number;
+  /** Newest first */
+  sessions: AgentSession[];
+  byStatus: Map<string, AgentSession[]>;
+  byAgentType: Map<string, AgentSession[]>;
+  callStacks: Map<string, string[]>;
+}
+
+export interface SessionDetail {
+  sessionId: string;
+  callStack: string[] | null;
+  agentSession: AgentSession | null;
+  eventCount: number;
+}
+
+function isObject(value: unknown): value is Record<string, unknown> {
+  return typeof value === 'object' && value !== null && !Array.isArray(value);
+}
+
+function parseAgentSessions(data: unknown): AgentSession[] {
+  if (!isObject(data)) return [];
+  return [data.active_sessions, data.completed_sessions]
+    .flatMap(list => (Array.isArray(list) ? list : []))
+    .filter((session): session is AgentSession => isObject(session) && typeof session.session_id === 'string');
+}
+
+function parseCallStack(relativePath: string, data: unknown): CallStack {
+  const fallbackId = path.basename(relativePath, '.json').replace(/^call_stack_/, '');
+  if (!isObject(data)) return { sessionId: fallbackId, stack: [] };
+  return {
+    sessionId: typeof data.session_id === 'string' ? data.session_id : fallbackId,
+    stack: Array.isArray(data.stack) ? data.stack.filter((agent): agent is string => typeof agent === 'string') : [],
+  };
+}
+
+function groupBy(sessions: AgentSession[], key: 'status' | 'agent_type'): Map<string, AgentSession[]> {
+  const groups = new Map<string, AgentSession[]>();
+  for (const session of sessions) {
+    const value = session[key];
+    if (typeof value !== 'string') continue;
+    const group = groups.get(value);
+    if (group) group.push(session);
+    else groups.set(value, [session]);
+  }
+  return groups;
+}
+
+/** Parse a JSON file; undefined when it is unreadable or mid-write */
+async function readJson(file: string): Promise<unknown> {
+  try {
+    return JSON.parse(await fs.readFile(file, 'utf-8'));
+  } catch (error) {
+    if (!(error instanceof SyntaxError)) console.error(`Error reading ${file}:`, error);
+    return undefined;
+  }
+}
+
+/**
+ * The first and last FINGERPRINT_BYTES of a file's first `length` bytes. A log
+ * rewritten in place keeps its inode and may even grow past the old offset, so
+ * this is compared before tailing to tell an append from a rewrite.
+ */
+async function readFingerprint(file: string, length: number): Promise<Buffer> {
+  const headLength = Math.min(length, FINGERPRINT_BYTES);
+  const tailLength = Math.min(length - headLength, FINGERPRINT_BYTES);
+  const buffer = Buffer.alloc(headLength + tailLength);
+  const handle = await fs.open(file, 'r');
+  try {
+    await handle.read(buffer, 0, headLength, 0);
+    if (tailLength) await handle.read(buffer, headLength, tailLength, length - tailLength);
+    return buffer;
+  } finally {
+    await handle.close();
+  }
+}
+
+/**
+ * Hand each complete line between byte offsets `start` and `end` to `onLine`.
+ * Returns the bytes consumed; a trailing partial line is left for the next read.
+ */
+async function readLines(file: string, start: number, end: number, onLine: (line: string) => void): Promise<number> {
+  const handle = await fs.open(file, 'r');
+  try {
+    const buffer = Buffer.allocUnsafe(READ_CHUNK);
+    let position = start;
+    let carry = Buffer.alloc(0);
+    while (position < end) {
+      const { bytesRead } = await handle.read(buffer, 0, Math.min(READ_CHUNK, end - position), position);
+      if (bytesRead === 0) break;
+      position += bytesRead;
+
+      const chunk = carry.length ? Buffer.concat([carry, buffer.subarray(0, bytesRead)]) : buffer.subarray(0, bytesRead);
+      let lineStart = 0;
+      let newline: number;
+      while ((newline = chunk.indexOf(0x0a, lineStart)) !== -1) {
+        const line = chunk.toString('utf-8', lineStart, newline).trim();
+        if (line) onLine(line);
+        lineStart = newline + 1;
+      }
+      // Copy: the read buffer is reused
+      carry = Buffer.from(chunk.subarray(lineStart));
+    }
+    return position - start - carry.length;
+  } finally {
+    await handle.close();
+  }
+}
+
+/**
+ * Process-wide, indexed view of the framework's state under `_state/` and the
+ * registries under `traceability/`.
+ *
+ * Logs are tailed: each refresh reads only the bytes appended since the last
+ * one, and re-reads a log from the start when it was truncated, replaced or
+ * rewritten in place.
+ * JSON files are re-read when their mtime or size moves. Queries go to
+ * in-memory indexes (see EventLog) and to views that are rebuilt only when
+ * their inputs change, so the coverage report is computed once per registry
+ * change rather than per request.
+ *
+ * Once `watch()` is active, filesystem events re-read individual files and
+ * requests stop re-stating the directories. All updates run one at a time.
+ */
+export class StateStore {
+  readonly projectRoot: string;
+  /** Distinguishes this process's versions from those of an earlier one */
+  private readonly instance = Date.now().toString(36);
+  private files = new Map<string, FileState>();
+  private events = new EventLog();
+  private registries = new Map<string, RegistryContent>();
+  private callStacks = new Map<string, CallStack>();
+  private agentSessions: AgentSession[] = [];
+  private version = 0;
+  private registryVersion = 0;
+  private sessionsVersion = 0;
+  private graph: { version: number; graph: TraceGraph } | null = null;
+  private sessionViews: SessionViews | null = null;
+  private updates: Promise<unknown> = Promise.resolve();
+  private inFlight: Promise<void> | null = null;
+  private loaded = false;
+  private watcher: CatalogWatcher | null = null;
+
+  constructor(projectRoot: string) {
+    this.projectRoot = projectRoot;
+  }
+
+  /** Bring the store in line with the filesystem. Concurrent callers share one pass. */
+  refresh(): Promise<void> {
+    // File events keep a watched store current; only wait for updates already queued
+    if (this.watcher && this.loaded) {
+      return this.updates.then(() => undefined);
+    }
+    if (!this.inFlight) {
+      this.inFlight = this.enqueue(async () => {
+        await this.sync();
+        this.loaded = true;
+      }).finally(() => {
+        this.inFlight = null;
+      });
+    }
+    return this.inFlight;
+  }
+
+  /** Re-read specific project-relative paths (files or directories) instead of rescanning */
+  applyChanges(relativePaths: Iterable<string>): Promise<void> {
+    const paths = Array.from(new Set(relativePaths));
+    return this.enqueue(async () => {
+      let rescan = false;
+      await mapWithConcurrency(paths, IO_CONCURRENCY, async (relativePath) => {
+        const kind = classifyStatePath(relativePath);
+        if (kind) {
+          await this.syncFile(relativePath, kind);
+        } else if (!path.extname(relativePath)) {
+          // Directory events only report the directory itself
+          rescan = true;
+        }
+      });
+      if (rescan) await this.sync();
+    });
+  }
+
+  /** Follow filesystem events. Falls back to per-request rescans if watching fails. */
+  watch(): boolean {
+    if (this.watcher) return true;
+
+    const watcher = new CatalogWatcher(this.projectRoot, {
+      dirs: STATE_DIRS,
+      onChange: (paths) => {
+        this.applyChanges(paths).catch((error) => console.error('Error applying state changes:', error));
+      },
+      onError: (error) => {
+        console.error('State watcher failed, falling back to rescans:', error);
+        this.watcher = null;
+      },
+    });
+    if (!watcher.start()) return false;
+
+    this.watcher = watcher;
+    return true;
+  }
+
+  unwatch(): void {
+    this.watcher?.close();
+    this.watcher = null;
+  }
+
+  /** Incremented whenever an ingested file changes */
+  get currentVersion(): number {
+    return this.version;
+  }
+
+  /** Changes whenever any query result might; suitable for an ETag */
+  get versionTag(): string {
+    return `${this.instance}-${this.version}`;
+  }
+
+  /** Changes only with the registries, so traceability ETags survive log appends */
+  get registryVersionTag(): string {
+    return `${this.instance}-r${this.registryVersion}`;
+  }
+
+  /** Number of log events currently stored */
+  get eventCount(): number {
+    return this.events.size;
+  }
+
+  /** Log events, newest first. Throws InvalidCursorError for a bad cursor. */
+  async queryEvents(query: EventQuery): Promise<Page<StateEvent>> {
+    await this.refresh();
+    return this.events.query(query);
+  }
+
+  /** Agent sessions, newest first */
+  async getSessions(query: SessionQuery = {}): Promise<Page<AgentSession>> {
+    await this.refresh();
+    const views = this.getSessionViews();
+    let sessions = query.status ? views.byStatus.get(query.status) ?? [] : views.sessions;
+    if (query.agentType) {
+      sessions = query.status
+        ? sessions.filter(session => session.agent_type === query.agentType)
+        : views.byAgentType.get(query.agentType) ?? [];
+    }
+    return offsetPage(sessions, query.cursor, query.limit);
+  }
+
+  /** Call stack, agent session and event count for one session id */
+  async getSession(sessionId: string): Promise<SessionDetail> {
+    await this.refresh();
+    const views = this.getSessionViews();
+    return {
+      sessionId,
+      callStack: views.callStacks.get(sessionId) ?? null,
+      agentSession: views.sessions.find(session => session.session_id === sessionId) ?? null,
+      eventCount: this.events.countSession(sessionId),
+    };
+  }
+
+  /** Pain point -> JTBD -> requirement -> screen coverage across every registry */
+  async getCoverage(): Promise<CoverageReport> {
+    await this.refresh();
+    return this.getGraph().coverage();
+  }
+
+  async getArtifact(id: string): Promise<ArtifactDetail | null> {
+    await this.refresh();
+    return this.getGraph().get(id);
+  }
+
+  /** Registry artifacts sorted by id */
+  async listArtifacts(type?: ArtifactType, cursor?: string, limit?: number): Promise<Page<Artifact>> {
+    await this.refresh();
+    return offsetPage(this.getGraph().list(type), cursor, limit);
+  }
+
+  // Run store mutations one at a time, in call order
+  private enqueue<T>(task: () => Promise<T>): Promise<T> {
+    const result = this.updates.then(task);
+    this.updates = result.catch(() => undefined);
+    return result;
+  }
+
+  private async sync(): Promise<void> {
+    const files = await listStateFiles(this.projectRoot);
+    const seen = new Set(files);
+    await mapWithConcurrency(files, IO_CONCURRENCY, async (relativePath) => {
+      await this.syncFile(relativePath, classifyStatePath(relativePath)!);
+    });
+    for (const relativePath of Array.from(this.files.keys())) {
+      if (!seen.has(relativePath)) this.removeFile(relativePath);
+    }
+  }
+
+  /** Stat a regular file; null when it is missing or not a file */
+  private async statFile(relativePath: string): Promise<Stats | null> {
+    try {
+      const stat = await fs.stat(path.join(this.projectRoot, relativePath));
+      return stat.isFile() ? stat : null;
+    } catch (err) {
+      if ((err as NodeJS.ErrnoException).code !== 'ENOENT') {
+        console.error(`Error indexing ${relativePath}:`, err);
+      }
+      return null;
+    }
+  }
+
+  private async syncFile(relativePath: string, kind: StateFileKind): Promise<void> {
+    const stat = await this.statFile(relativePath);
+    if (!stat) {
+      this.removeFile(relativePath);
+      return;
+    }
+
+    const known = this.files.get(relativePath);
+    if (kind === 'log') {
+      await this.tailLog(relativePath, stat, known);
+      return;
+    }
+    if (known && known.mtimeMs === stat.mtimeMs && known.size === stat.size) return;
+
+    const data = await readJson(path.join(this.projectRoot, relativePath));
+    // Leave the file marked stale so it is retried once the writer finishes
+    if (data === undefined) return;
+
+    this.files.set(relativePath, { kind, mtimeMs: stat.mtimeMs, size: stat.size, ino: stat.ino, offset: 0 });
+    switch (kind) {
+      case 'registry':
+        this.registries.set(relativePath, parseRegistry(relativePath, data));
+        this.registryVersion++;
+        break;
+      case 'sessions':
+        this.agentSessions = parseAgentSessions(data);
+        this.sessionsVersion++;
+        break;
+      case 'callStack':
+        this.callStacks.set(relativePath, parseCallStack(relativePath, data));
+        this.sessionsVersion++;
+        break;
+    }
+    this.version++;
+  }
+
+  /** Ingest the lines appended to a log since it was last read */
+  private async tailLog(relativePath: string, stat: Stats, known: FileState | undefined): Promise<void> {
+    if (known && known.ino === stat.ino && known.size === stat.size && known.mtimeMs === stat.mtimeMs) return;
+
+    const file = path.join(this.projectRoot, relativePath);
+    const source = logSource(relativePath);
+    let offset = known?.offset ?? 0;
+    if (known && (
+      stat.size < offset ||
+      stat.ino !== known.ino ||
+      (offset > 0 && !(await readFingerprint(file, offset)).equals(known.fingerprint ?? Buffer.alloc(0)))
+    )) {
+      // Truncated, replaced or rewritten in place: read it again from the start
+      this.events.removeFile(relativePath);
+      offset = 0;
+      this.version++;
+    }
+
+    let appended = 0;
+    const consumed = await readLines(file, offset, stat.size, (line) => {
+      if (this.events.append(relativePath, source, line)) appended++;
+    });
+    offset += consumed;
+    const fingerprint = await readFingerprint(file, offset);
+    this.files.set(relativePath, { kind: 'log', mtimeMs: stat.mtimeMs, size: stat.size, ino: stat.ino, offset, fingerprint });
+    if (appended > 0) this.version++;
+  }
+
+  private removeFile(relativePath: string): void {
+    const known = this.files.get(relativePath);
+    if (!known) return;
+    this.files.delete(relativePath);
+
+    switch (known.kind) {
+      case 'log':
+        this.events.removeFile(relativePath);
+        break;
+      case 'registry':
+        this.registries.delete(relativePath);
+        this.registryVersion++;
+        break;
+      case 'sessions':
+        this.agentSessions = [];
+        this.sessionsVersion++;
+        break;
+      case 'callStack':
+        this.callStacks.delete(relativePath);
+        this.sessionsVersion++;
+        break;
+    }
+    this.version++;
+  }
+
+  private getGraph(): TraceGraph {
+    if (this.graph && this.graph.version === this.registryVersion) return this.graph.graph;
+
+    // Sorted so the same registries always resolve duplicate ids the same way
+    const paths = Array.from(this.registries.keys()).sort();
+    const graph = new TraceGraph(paths.map(relativePath => this.registries.get(relativePath)!));
+    this.graph = { version: this.registryVersion, graph };
+    return graph;
+  }
+
+  private getSessionViews(): SessionViews {
+    if (this.sessionViews && this.sessionViews.version === this.sessionsVersion) return this.sessionViews;
+
+    const sessions = [...this.agentSessions].sort((a, b) =>
+      (b.started_at ?? '').localeCompare(a.started_at ?? '') || compareIds(a.session_id, b.session_id)
+    );
+    this.sessionViews = {
+      version: this.sessionsVersion,
+      sessions,
+      byStatus: groupBy(sessions, 'status'),
+      byAgentType: groupBy(sessions, 'agent_type'),
+      callStacks: new Map(Array.from(this.callStacks.values(), ({ sessionId, stack }) => [sessionId, stack])),
+    };
+    return this.sessionViews;
+  }
+}
+
+// Kept on globalThis so every route bundle (and dev-mode hot reloads) share one instance
+const globalForState = globalThis as unknown as { __claudeManualStateStores?: Map<string, StateStore> };
+
+/** Get the shared state store for a project root (defaults to the repository root) */
+export function getStateStore(projectRoot: string = getProjectRoot()): StateStore {
+  if (!globalForState.__claudeManualStateStores) {
+    globalForState.__claudeManualStateStores = new Map();
+  }
+  let store = globalForState.__claudeManualStateStores.get(projectRoot);
+  if (!store) {
+    store = new StateStore(projectRoot);
+    globalForState.__claudeManualStateStores.set(projectRoot, store);
+  }
+  return store;
+}
@@ -0,0 +1,26 @@
+import type { Page } from './types';
+
+export const DEFAULT_PAGE_SIZE = 100;
+export const MAX_PAGE_SIZE = 1000;
+
+/** Thrown for a cursor that was not produced by this store */
+export class InvalidCursorError extends Error {
+  constructor(cursor: string) {
+    super(`Invalid cursor: ${cursor}`);
+    this.name = 'InvalidCursorError';
+  }
+}
+
+export function pageSize(limit: number | undefined): number {
+  if (limit === undefined || !Number.isFinite(limit)) return DEFAULT_PAGE_SIZE;
+  return Math.min(MAX_PAGE_SIZE, Math.max(1, Math.floor(limit)));
+}
+
+/** One page of an already ordered list; the cursor is the offset of the next item */
+export function offsetPage<T>(items: T[], cursor: string | undefined, limit: number | undefined): Page<T> {
+  const start = cursor === undefined ? 0 : Number(cursor);
+  if (!Number.isInteger(start) || start < 0) throw new InvalidCursorError(cursor!);
+
+  const end = start + pageSize(limit);
+  return { items: items.slice(start, end), nextCursor: end < items.length ? String(end) : null };
+}
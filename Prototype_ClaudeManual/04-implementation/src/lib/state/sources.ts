@@ -0,0 +1,56 @@
+import { promises as fs } from 'fs';
+import path from 'path';
+import type { StateFileKind } from './types';
+
+// Which files under `_state/` and `traceability/` the state store reads, and how.
+
+export const STATE_DIRS = ['_state', 'traceability'];
+
+const LOG_DIR = '_state/logs';
+
+/** Decide how a project-relative path is ingested, if at all */
+export function classifyStatePath(relativePath: string): StateFileKind | null {
+  const parts = relativePath.split('/');
+  const fileName = parts[parts.length - 1];
+
+  if (parts[0] === '_state') {
+    if (parts.length === 3 && parts[1] === 'logs') {
+      return fileName.endsWith('.jsonl') ? 'log' : null;
+    }
+    if (parts.length !== 2) return null;
+    // One JSON object per line despite the extension
+    if (fileName === 'permission_audit.json') return 'log';
+    if (fileName === 'agent_sessions.json') return 'sessions';
+    if (/^call_stack_.+\.json$/.test(fileName)) return 'callStack';
+    return fileName.endsWith('_registry.json') ? 'registry' : null;
+  }
+
+  if (parts[0] === 'traceability' && parts.length === 2) {
+    return /_(registry|register)\.json$/.test(fileName) ||
+      fileName === 'trace_links.json' ||
+      fileName === 'traceability_matrix_master.json'
+      ? 'registry'
+      : null;
+  }
+  return null;
+}
+
+/** Display name of a log: its file name without the extension. Not unique; logs are keyed by path. */
+export function logSource(relativePath: string): string {
+  return path.basename(relativePath).replace(/\.jsonl?$/, '');
+}
+
+async function listFiles(projectRoot: string, dir: string): Promise<string[]> {
+  try {
+    const entries = await fs.readdir(path.join(projectRoot, dir), { withFileTypes: true });
+    return entries.filter(entry => entry.isFile()).map(entry => `${dir}/${entry.name}`);
+  } catch {
+    return [];
+  }
+}
+
+/** Project-relative paths of every file the store ingests */
+export async function listStateFiles(projectRoot: string): Promise<string[]> {
+  const listed = await Promise.all([...STATE_DIRS, LOG_DIR].map(dir => listFiles(projectRoot, dir)));
+  return listed.flat().filter(relativePath => classifyStatePath(relativePath) !== null);
+}
@@ -0,0 +1,187 @@
+import type {
+  Artifact,
+  ArtifactDetail,
+  ArtifactType,
+  CoverageReport,
+  PainPointCoverage,
+} from './types';
+
+// Traceability registries: every entry with an id becomes an artifact, and an
+// artifact id mentioned inside another entry or a trace link links the two.
+
+// e.g. PP-1.1, JTBD-1.7, REQ-001, SCR-001, COMP-AGG-001
+const ARTIFACT_ID = /^[A-Z]{1,6}(?:-[A-Z]{1,6})*-\d+(?:\.\d+)*$/;
+const ARTIFACT_ID_IN_TEXT = /\b[A-Z]{1,6}(?:-[A-Z]{1,6})*-\d+(?:\.\d+)*\b/g;
+
+const TYPE_BY_PREFIX: Record<string, ArtifactType> = {
+  PP: 'pain_point',
+  JTBD: 'jtbd',
+  REQ: 'requirement',
+  SCR: 'screen',
+};
+
+const ARTIFACT_TYPES: ArtifactType[] = ['pain_point', 'jtbd', 'requirement', 'screen', 'other'];
+
+const idCollator = new Intl.Collator('en', { numeric: true });
+
+export interface RegistryContent {
+  artifacts: Artifact[];
+  /** Pairs of linked ids, in no particular direction */
+  links: Array<[string, string]>;
+}
+
+export function artifactType(id: string): ArtifactType {
+  return TYPE_BY_PREFIX[id.slice(0, id.indexOf('-'))] ?? 'other';
+}
+
+/** Artifact ids mentioned anywhere in a piece of text */
+export function artifactIdsIn(text: string): string[] {
+  return text.match(ARTIFACT_ID_IN_TEXT) ?? [];
+}
+
+/** Natural order, so JTBD-1.2 sorts before JTBD-1.10 */
+export function compareIds(a: string, b: string): number {
+  return idCollator.compare(a, b);
+}
+
+function isObject(value: unknown): value is Record<string, unknown> {
+  return typeof value === 'object' && value !== null && !Array.isArray(value);
+}
+
+/** Ids appearing as whole string values anywhere under `value` */
+function referencedIds(value: unknown, ids: Set<string>): Set<string> {
+  if (typeof value === 'string') {
+    if (ARTIFACT_ID.test(value)) ids.add(value);
+  } else if (Array.isArray(value)) {
+    for (const item of value) referencedIds(item, ids);
+  } else if (isObject(value)) {
+    for (const item of Object.values(value)) referencedIds(item, ids);
+  }
+  return ids;
+}
+
+/** Pull artifacts and links out of one parsed registry file */
+export function parseRegistry(source: string, data: unknown): RegistryContent {
+  const content: RegistryContent = { artifacts: [], links: [] };
+
+  const visit = (value: unknown, inArray: boolean) => {
+    if (Array.isArray(value)) {
+      for (const item of value) visit(item, true);
+      return;
+    }
+    if (!isObject(value)) return;
+
+    const { id } = value;
+    if (typeof id === 'string' && ARTIFACT_ID.test(id)) {
+      const title = typeof value.title === 'string' ? value.title : typeof value.name === 'string' ? value.name : null;
+      content.artifacts.push({ id, type: artifactType(id), title, source, record: value });
+      for (const target of referencedIds(value, new Set())) {
+        if (target !== id) content.links.push([id, target]);
+      }
+    } else if (inArray) {
+      // A trace link or matrix row: its first id links to the others
+      const [first, ...others] = referencedIds(value, new Set());
+      for (const target of others) content.links.push([first, target]);
+    }
+
+    for (const item of Object.values(value)) visit(item, false);
+  };
+
+  visit(data, false);
+  return content;
+}
+
+/** Artifacts and links from every registry, with the coverage report derived from them */
+export class TraceGraph {
+  private artifacts = new Map<string, Artifact>();
+  private adjacency = new Map<string, Set<string>>();
+  private sorted = new Map<ArtifactType | 'all', Artifact[]>();
+  private coverageReport: CoverageReport | null = null;
+
+  /** Registries are applied in order; the first entry for an id wins */
+  constructor(registries: Iterable<RegistryContent>) {
+    for (const { artifacts, links } of registries) {
+      for (const artifact of artifacts) {
+        if (!this.artifacts.has(artifact.id)) this.artifacts.set(artifact.id, artifact);
+      }
+      for (const [a, b] of links) {
+        this.link(a, b);
+        this.link(b, a);
+      }
+    }
+  }
+
+  get size(): number {
+    return this.artifacts.size;
+  }
+
+  get(id: string): ArtifactDetail | null {
+    const artifact = this.artifacts.get(id);
+    if (!artifact) return null;
+    return { ...artifact, links: Array.from(this.adjacency.get(id) ?? []).sort(compareIds) };
+  }
+
+  /** Artifacts sorted by id, optionally of one type. Do not modify the returned list. */
+  list(type?: ArtifactType): Artifact[] {
+    const key = type ?? 'all';
+    let artifacts = this.sorted.get(key);
+    if (!artifacts) {
+      artifacts = type
+        ? this.list().filter(artifact => artifact.type === type)
+        : Array.from(this.artifacts.values()).sort((a, b) => compareIds(a.id, b.id));
+      this.sorted.set(key, artifacts);
+    }
+    return artifacts;
+  }
+
+  /** Pain point -> JTBD -> requirement -> screen coverage, computed once per graph */
+  coverage(): CoverageReport {
+    if (this.coverageReport) return this.coverageReport;
+
+    const totals = Object.fromEntries(ARTIFACT_TYPES.map(type => [type, 0])) as Record<ArtifactType, number>;
+    for (const artifact of this.artifacts.values()) totals[artifact.type]++;
+
+    const painPoints: PainPointCoverage[] = this.list('pain_point').map(({ id, title }) => {
+      const jtbd = this.neighbors([id], 'jtbd');
+      // Requirements usually name both their source pain point and their job
+      const requirements = this.neighbors([id, ...jtbd], 'requirement');
+      const screens = this.neighbors(requirements, 'screen');
+      return { id, title, jtbd, requirements, screens, covered: screens.length > 0 };
+    });
+
+    const count = (predicate: (entry: PainPointCoverage) => boolean) => painPoints.filter(predicate).length;
+    const withScreens = count(entry => entry.covered);
+    this.coverageReport = {
+      summary: {
+        painPoints: painPoints.length,
+        withJtbd: count(entry => entry.jtbd.length > 0),
+        withRequirements: count(entry => entry.requirements.length > 0),
+        withScreens,
+        coveragePercent: painPoints.length ? Math.round((withScreens / painPoints.length) * 1000) / 10 : 0,
+        totals,
+      },
+      painPoints,
+    };
+    return this.coverageReport;
+  }
+
+  private link(from: string, to: string): void {
+    let targets = this.adjacency.get(from);
+    if (!targets) {
+      targets = new Set();
+      this.adjacency.set(from, targets);
+    }
+    targets.add(to);
+  }
+
+  /** Known artifacts of `type` linked to any of `ids` */
+  private neighbors(ids: string[], type: ArtifactType): string[] {
+    const found = new Set<string>();
+    for (const id of ids) {
+      for (const target of this.adjacency.get(id) ?? []) {
+        if (this.artifacts.get(target)?.type === type) found.add(target);
+      }
+    }
+    return Array.from(found).sort(compareIds);
+  }
+}
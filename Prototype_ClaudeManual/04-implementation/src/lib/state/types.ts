@@ -0,0 +1,102 @@
+/** How a file under `_state/` or `traceability/` is ingested */
+export type StateFileKind = 'log' | 'sessions' | 'callStack' | 'registry';
+
+/** One line of an append-only log (`_state/logs/*.jsonl`, `permission_audit.json`) */
+export interface StateEvent {
+  /** Stable row id; also breaks ties between events with the same timestamp */
+  id: number;
+  /** Log name for display: the file name without its extension */
+  source: string;
+  /** Project-relative path of the log; unlike `source`, unique per log */
+  file: string;
+  timestamp: string | null;
+  sessionId: string | null;
+  eventType: string | null;
+  data: Record<string, unknown>;
+}
+
+export interface EventQuery {
+  sessionId?: string;
+  eventType?: string;
+  /** Log name; may cover several files (e.g. `permission_audit.json` and `logs/permission_audit.jsonl`) */
+  source?: string;
+  /** Project-relative path of one log */
+  file?: string;
+  /** Events mentioning a traceability artifact id (e.g. `REQ-001`) */
+  artifactId?: string;
+  /** Inclusive bounds, as ISO timestamps */
+  from?: string;
+  to?: string;
+  /** `nextCursor` from the previous page */
+  cursor?: string;
+  limit?: number;
+}
+
+export interface Page<T> {
+  items: T[];
+  /** Pass back as `cursor` for the next page; null on the last page */
+  nextCursor: string | null;
+}
+
+/** An entry from `agent_sessions.json` */
+export interface AgentSession {
+  session_id: string;
+  agent_id?: string;
+  agent_type?: string;
+  task_id?: string;
+  status?: string;
+  started_at?: string;
+  ended_at?: string;
+  last_heartbeat?: string;
+  [key: string]: unknown;
+}
+
+export interface SessionQuery {
+  status?: string;
+  agentType?: string;
+  cursor?: string;
+  limit?: number;
+}
+
+export type ArtifactType = 'pain_point' | 'jtbd' | 'requirement' | 'screen' | 'other';
+
+/** Any registry entry with an id, e.g. a pain point, job, requirement or screen */
+export interface Artifact {
+  id: string;
+  type: ArtifactType;
+  title: string | null;
+  /** Project-relative registry file it came from */
+  source: string;
+  record: Record<string, unknown>;
+}
+
+export interface ArtifactDetail extends Artifact {
+  /** Ids linked to this artifact in either direction, by any registry or trace link */
+  links: string[];
+}
+
+/** Pain point -> JTBD -> requirement -> screen chain for one pain point */
+export interface PainPointCoverage {
+  id: string;
+  title: string | null;
+  jtbd: string[];
+  requirements: string[];
+  screens: string[];
+  /** Traced all the way to at least one screen */
+  covered: boolean;
+}
+
+export interface CoverageSummary {
+  painPoints: number;
+  withJtbd: number;
+  withRequirements: number;
+  withScreens: number;
+  /** Share of pain points traced to a screen, 0-100 */
+  coveragePercent: number;
+  totals: Record<ArtifactType, number>;
+}
+
+export interface CoverageReport {
+  summary: CoverageSummary;
+  painPoints: PainPointCoverage[];
+}
@@ -0,0 +1,134 @@
+import type { Stage, TreeNode } from '@/types/navigation';
+
+// Navigation tree filtering, split so the string matching can run in a Web Worker.
+// Nodes are addressed by their depth-first position ("ordinal") in the unfiltered tree.
+
+export interface TreeFilterResult {
+  filtered: TreeNode[];
+  /** Ids of nodes kept by the search that have children, to expand while searching */
+  toExpand: string[];
+}
+
+export interface VisibleTreeRow {
+  node: TreeNode;
+  level: number;
+  hasChildren: boolean;
+  isExpanded: boolean;
+}
+
+/** Lower-cased label, description and path of every node, in depth-first order */
+export function buildSearchTexts(items: TreeNode[]): string[] {
+  const texts: string[] = [];
+  const visit = (nodes: TreeNode[]) => {
+    for (const node of nodes) {
+      texts.push(`${node.label}\n${node.description ?? ''}\n${node.path ?? ''}`.toLowerCase());
+      if (node.children) visit(node.children);
+    }
+  };
+  visit(items);
+  return texts;
+}
+
+/** Ordinals of texts containing `query`; pass `within` to only rescan an earlier result */
+export function matchSearchTexts(texts: string[], query: string, within?: number[]): number[] {
+  const needle = query.toLowerCase();
+  const matches: number[] = [];
+  if (within) {
+    for (const ordinal of within) {
+      if (texts[ordinal].includes(needle)) matches.push(ordinal);
+    }
+  } else {
+    for (let ordinal = 0; ordinal < texts.length; ordinal++) {
+      if (texts[ordinal].includes(needle)) matches.push(ordinal);
+    }
+  }
+  return matches;
+}
+
+/**
+ * Matches queries against one set of texts, narrowing the previous result
+ * when the new query extends the last one (the common case while typing).
+ */
+export class IncrementalMatcher {
+  private texts: string[] = [];
+  private lastQuery = '';
+  private lastMatches: number[] | null = null;
+
+  setTexts(texts: string[]): void {
+    if (texts === this.texts) return;
+    this.texts = texts;
+    this.lastQuery = '';
+    this.lastMatches = null;
+  }
+
+  match(query: string): number[] {
+    const needle = query.toLowerCase();
+    const narrowing = this.lastMatches !== null && this.lastQuery !== '' && needle.startsWith(this.lastQuery);
+    const matches = matchSearchTexts(this.texts, needle, narrowing ? this.lastMatches! : undefined);
+    this.lastQuery = needle;
+    this.lastMatches = matches;
+    return matches;
+  }
+}
+
+// Nodes without a stage (categories) always pass; uses stages[] when set, otherwise stage (PF-003)
+function matchesStage(node: TreeNode, stages: Stage[]): boolean {
+  const nodeStages = node.stages || (node.stage ? [node.stage] : []);
+  return nodeStages.length === 0 || nodeStages.some(s => stages.includes(s));
+}
+
+/**
+ * Apply the stage filter and search matches in one pass.
+ * A node is kept when it matches, or when any of its descendants is kept;
+ * under a stage filter, counts reflect the children left after it.
+ */
+export function filterTree(
+  items: TreeNode[],
+  stageFilter: Stage[],
+  matches: ReadonlySet<number> | null
+): TreeFilterResult {
+  if (stageFilter.length === 0 && matches === null) {
+    return { filtered: items, toExpand: [] };
+  }
+
+  let ordinal = 0;
+  const toExpand: string[] = [];
+
+  // Returns the node after the stage filter and after the search (null when dropped)
+  const visit = (node: TreeNode): [TreeNode | null, TreeNode | null] => {
+    const textMatch = matches === null || matches.has(ordinal);
+    ordinal++;
+    const visited = (node.children ?? []).map(visit);
+
+    let staged = node;
+    if (stageFilter.length > 0) {
+      const children = visited.flatMap(([child]) => (child ? [child] : []));
+      if (!matchesStage(node, stageFilter) && children.length === 0) return [null, null];
+      staged = { ...node, children, count: children.length };
+    }
+    if (matches === null) return [staged, staged];
+
+    const children = visited.flatMap(([, child]) => (child ? [child] : []));
+    if (!textMatch && children.length === 0) return [staged, null];
+    if (staged.children && staged.children.length > 0) toExpand.push(node.id);
+    return [staged, { ...staged, children }];
+  };
+
+  const filtered = items.map(visit).flatMap(([, node]) => (node ? [node] : []));
+  return { filtered, toExpand };
+}
+
+/** The rows a tree shows with the given nodes expanded, in display order */
+export function flattenVisibleTree(items: TreeNode[], expandedKeys: ReadonlySet<string>): VisibleTreeRow[] {
+  const rows: VisibleTreeRow[] = [];
+  const visit = (nodes: TreeNode[], level: number) => {
+    for (const node of nodes) {
+      const hasChildren = !!node.children && node.children.length > 0;
+      const isExpanded = hasChildren && expandedKeys.has(node.id);
+      rows.push({ node, level, hasChildren, isExpanded });
+      if (isExpanded) visit(node.children!, level + 1);
+    }
+  };
+  visit(items, 0);
+  return rows;
+}
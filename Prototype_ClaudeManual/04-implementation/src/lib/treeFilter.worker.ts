@@ -0,0 +1,25 @@
+import { IncrementalMatcher } from './treeFilter';
+
+// Web Worker that matches navigation tree search queries off the main thread
+
+export type TreeSearchRequest =
+  | { type: 'texts'; texts: string[] }
+  | { type: 'match'; id: number; query: string };
+
+export interface TreeSearchResponse {
+  id: number;
+  matches: number[];
+}
+
+const ctx = self as unknown as Worker;
+const matcher = new IncrementalMatcher();
+
+ctx.onmessage = (event: MessageEvent<TreeSearchRequest>) => {
+  const request = event.data;
+  if (request.type === 'texts') {
+    matcher.setTexts(request.texts);
+    return;
+  }
+  const response: TreeSearchResponse = { id: request.id, matches: matcher.match(request.query) };
+  ctx.postMessage(response);
+};